@@ -0,0 +1 @@
+# Benchmarks for sec4dev Python SDK
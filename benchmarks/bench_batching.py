@@ -0,0 +1,86 @@
+"""
+Throughput of the micro-batching front end against individual check() calls.
+
+Usage: python -m benchmarks.bench_batching [--items N] [--latency-ms MS] [--workers W]
+
+Individual calls are issued from a fixed pool of ``--workers`` caller threads
+(like a web server's handler pool). The batched path submits the same items to
+IPService.batched() at several max_wait_ms latency budgets. The report gives
+throughput plus p50/p99 submit-to-result latency for each run.
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from benchmarks.stub_server import StubServer
+from sec4dev import Sec4DevClient
+
+API_KEY = "sec4_bench"
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _run(submit: Callable[[str], "Future[Any]"], ips: List[str]) -> Dict[str, float]:
+    latencies: List[float] = []
+    lock = threading.Lock()
+    done = threading.Event()
+    remaining = [len(ips)]
+
+    def finished(start: float) -> Callable[["Future[Any]"], None]:
+        def callback(_: "Future[Any]") -> None:
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    done.set()
+        return callback
+
+    start = time.perf_counter()
+    for ip in ips:
+        submit(ip).add_done_callback(finished(time.perf_counter()))
+    done.wait()
+    elapsed = time.perf_counter() - start
+    return {
+        "throughput_per_s": len(ips) / elapsed,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--budgets", type=str, default="1,5,20")
+    args = parser.parse_args()
+
+    ips = [f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}" for i in range(args.items)]
+    report: Dict[str, Any] = {"benchmark": "batching", "items": args.items, "latency_ms": args.latency_ms}
+
+    with StubServer(latency_ms=args.latency_ms) as server:
+        with Sec4DevClient(API_KEY, base_url=server.base_url, retries=0) as client:
+            with ThreadPoolExecutor(max_workers=args.workers) as pool:
+                report["individual"] = _run(lambda ip: pool.submit(client.ip.check, ip), ips)
+            report["batched"] = {}
+            for budget in (float(b) for b in args.budgets.split(",")):
+                with client.ip.batched(max_wait_ms=budget, concurrency=args.concurrency) as batcher:
+                    run = _run(batcher.submit, ips)
+                    run["mean_batch_size"] = batcher.stats()["mean_batch_size"]
+                run["gain"] = run["throughput_per_s"] / report["individual"]["throughput_per_s"]
+                report["batched"][f"{budget:g}ms"] = run
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
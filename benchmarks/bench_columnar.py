@@ -0,0 +1,110 @@
+"""
+Memory per row and build time of columnar IP results against IPCheckResult objects.
+
+Usage: python -m benchmarks.bench_columnar [--rows N]
+
+"objects" is a list of IPCheckResult models, as check_many() returns them.
+"columns" is an IPResultColumns holding the same rows. Memory is measured with
+tracemalloc and includes every allocation made while building each form
+(build times are inflated by tracemalloc and only comparable to each other).
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from sec4dev.columnar import IPResultColumns
+from sec4dev.ip import _build_result
+from sec4dev.models.ip import IPCheckResult
+
+CLASSIFICATIONS = ["hosting", "residential", "mobile", "vpn", "tor", "proxy", "unknown"]
+NETWORKS = [
+    (16509, "Amazon.com, Inc.", "AWS"),
+    (15169, "Google LLC", "GCP"),
+    (8075, "Microsoft Corporation", "Azure"),
+    (7922, "Comcast Cable Communications, LLC", None),
+    (3320, "Deutsche Telekom AG", None),
+]
+COUNTRIES = ["US", "DE", "BR", "IN", "JP", "GB", "FR"]
+
+
+def _bodies(rows: int) -> List[Tuple[str, Dict[str, Any]]]:
+    rng = random.Random(0)
+    bodies = []
+    for i in range(rows):
+        ip = f"{10 + i // 16_777_216}.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}"
+        classification = rng.choice(CLASSIFICATIONS)
+        asn, org, provider = rng.choice(NETWORKS)
+        bodies.append(
+            (
+                ip,
+                {
+                    "ip": ip,
+                    "classification": classification,
+                    "confidence": round(rng.random(), 3),
+                    "signals": {f"is_{classification}": classification != "unknown"},
+                    "network": {"asn": asn, "org": org, "provider": provider},
+                    "geo": {"country": rng.choice(COUNTRIES), "region": None},
+                },
+            )
+        )
+    return bodies
+
+
+def _measure(build: Callable[[], Any]) -> Tuple[Any, int, float]:
+    """Build once; return (value, bytes still allocated, seconds)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    value = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    bodies = _bodies(args.rows)
+    results: List[IPCheckResult]
+    results, objects_bytes, objects_s = _measure(lambda: [_build_result(body, ip) for ip, body in bodies])
+
+    def build_columns() -> IPResultColumns:
+        columns = IPResultColumns()
+        for ip, body in bodies:
+            columns.append(ip, _build_result(body, ip))
+        return columns
+
+    columns, columns_bytes, columns_s = _measure(build_columns)
+    assert columns.result(len(columns) - 1).ip == results[-1].ip
+
+    to_numpy_s = None
+    try:
+        columns.to_numpy()  # imports numpy
+        start = time.perf_counter()
+        columns.to_numpy()
+        to_numpy_s = time.perf_counter() - start
+    except ImportError:
+        pass
+
+    report = {
+        "benchmark": "columnar",
+        "rows": args.rows,
+        "objects_bytes_per_row": objects_bytes / args.rows,
+        "columns_bytes_per_row": columns_bytes / args.rows,
+        "column_buffer_bytes_per_row": columns.nbytes / args.rows,
+        "memory_reduction": objects_bytes / columns_bytes,
+        "objects_build_s": objects_s,
+        "columns_build_s": columns_s,
+        "to_numpy_s": to_numpy_s,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
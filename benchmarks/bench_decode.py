@@ -0,0 +1,110 @@
+"""
+Response bodies decoded (and turned into results) per second by each JSON backend.
+
+Usage: python -m benchmarks.bench_decode [--corpus FILE] [--size N] [--rounds N]
+
+--corpus is a file of recorded /ip/check and /email/check response bodies, one
+JSON object per line. Without it a synthetic corpus of --size bodies shaped like
+real responses is generated. "decode" times decode_json() alone; "decode_build"
+also builds the IPCheckResult / EmailCheckResult, as the services do.
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Any, Callable, List, Tuple
+
+from sec4dev import email as email_service
+from sec4dev import ip as ip_service
+from sec4dev.http import available_json_backends, decode_json, set_json_backend
+
+CLASSIFICATIONS = ["hosting", "residential", "mobile", "vpn", "tor", "proxy", "unknown"]
+PROVIDERS = [("AWS", "Amazon.com, Inc.", 16509), ("GCP", "Google LLC", 15169), (None, "Comcast Cable", 7922)]
+
+
+def _synthetic_corpus(size: int) -> List[bytes]:
+    rng = random.Random(0)
+    bodies = []
+    for i in range(size):
+        if i % 4 == 3:
+            domain = rng.choice(["gmail.com", "tempmail.com", "example.org"])
+            body = {"email": f"user{i}@{domain}", "domain": domain, "is_disposable": domain == "tempmail.com"}
+        else:
+            classification = rng.choice(CLASSIFICATIONS)
+            provider, org, asn = rng.choice(PROVIDERS)
+            body = {
+                "ip": f"203.0.{i // 256 % 256}.{i % 256}",
+                "classification": classification,
+                "confidence": round(rng.random(), 2),
+                "signals": {f"is_{name}": name == classification for name in CLASSIFICATIONS[:-1]},
+                "network": {"asn": asn, "org": org, "provider": provider},
+                "geo": {"country": rng.choice(["US", "DE", "BR"]), "region": None},
+            }
+        bodies.append(json.dumps(body).encode())
+    return bodies
+
+
+def _load_corpus(path: str) -> List[bytes]:
+    with open(path, "rb") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def _builder(body: bytes) -> Callable[[Any], Any]:
+    if b'"email"' in body:
+        return lambda data: email_service._build_result(data, "")
+    return lambda data: ip_service._build_result(data, "")
+
+
+def _per_second(run: Callable[[], None], count: int, rounds: int) -> float:
+    best = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run()
+        best = max(best, count / (time.perf_counter() - start))
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", help="recorded response bodies, one per line")
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    bodies = _load_corpus(args.corpus) if args.corpus else _synthetic_corpus(args.size)
+    pairs: List[Tuple[bytes, Callable[[Any], Any]]] = [(body, _builder(body)) for body in bodies]
+
+    def decode() -> None:
+        for body in bodies:
+            decode_json(body)
+
+    def decode_build() -> None:
+        for body, build in pairs:
+            build(decode_json(body))
+
+    backends = {}
+    expected = [json.loads(body) for body in bodies]
+    for name in available_json_backends():
+        set_json_backend(name)
+        assert [decode_json(body) for body in bodies] == expected
+        backends[name] = {
+            "decode_per_s": _per_second(decode, len(bodies), args.rounds),
+            "decode_build_per_s": _per_second(decode_build, len(bodies), args.rounds),
+        }
+    set_json_backend()
+
+    baseline = backends["json"]["decode_build_per_s"]
+    report = {
+        "benchmark": "decode",
+        "corpus": args.corpus or "synthetic",
+        "bodies": len(bodies),
+        "mean_body_bytes": sum(map(len, bodies)) / len(bodies),
+        "backends": backends,
+        "decode_build_speedup_vs_json": {name: r["decode_build_per_s"] / baseline for name, r in backends.items()},
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
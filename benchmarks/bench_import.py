@@ -0,0 +1,49 @@
+"""
+Cold import time of the sec4dev package and what a first check pulls in.
+
+Usage: python -m benchmarks.bench_import [--runs N]
+
+Each run starts a fresh interpreter with -X importtime and reports the best
+cumulative time in ms spent importing sec4dev modules and their dependencies.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import_sec4dev": "import sec4dev",
+    "import_exceptions": "import sec4dev.exceptions",
+    "first_client_access": "import sec4dev; sec4dev.Sec4DevClient",
+}
+
+
+def _cumulative_ms(statement: str) -> float:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    total = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Top-level sec4dev entries include everything imported beneath them.
+        if cumulative.strip().isdigit() and name.startswith(" sec4dev"):
+            total += int(cumulative)
+    return total / 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    report = {"benchmark": "import", "runs": args.runs}
+    for label, statement in STATEMENTS.items():
+        report[f"{label}_ms"] = min(_cumulative_ms(statement) for _ in range(args.runs))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
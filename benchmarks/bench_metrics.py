@@ -0,0 +1,78 @@
+"""
+Per-request cost of recording metrics.
+
+Usage: python -m benchmarks.bench_metrics [--requests N] [--threads N]
+
+Times the calls http.request() makes on a MetricsRegistry for one request
+with a single attempt (start, two perf_counter() reads, attempt, finished),
+without any I/O, and reports nanoseconds per request. "baseline" times the
+same loop with only the perf_counter() reads. With --threads, that many
+threads record concurrently.
+"""
+
+import argparse
+import json
+import threading
+import time
+
+from sec4dev.metrics import MetricsRegistry
+
+URL = "https://api.sec4.dev/api/v1/ip/check"
+
+
+def _record(metrics: MetricsRegistry, requests: int) -> None:
+    perf_counter = time.perf_counter
+    for _ in range(requests):
+        counters = metrics.start(URL)
+        started = perf_counter()
+        counters.attempt(perf_counter() - started, 200)
+        counters.finished()
+
+
+def _baseline(requests: int) -> None:
+    perf_counter = time.perf_counter
+    for _ in range(requests):
+        started = perf_counter()
+        perf_counter() - started
+
+
+def _timed(target, threads: int) -> float:
+    workers = [threading.Thread(target=target) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=1_000_000, help="requests per thread")
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    metrics = MetricsRegistry()
+    total = args.requests * args.threads
+    baseline_s = _timed(lambda: _baseline(args.requests), args.threads)
+    metrics_s = _timed(lambda: _record(metrics, args.requests), args.threads)
+    assert metrics.snapshot()["endpoints"]["/api/v1/ip/check"]["requests"] == total
+
+    start = time.perf_counter()
+    metrics.to_prometheus()
+    export_s = time.perf_counter() - start
+
+    report = {
+        "benchmark": "metrics",
+        "requests": total,
+        "threads": args.threads,
+        "baseline_ns_per_request": baseline_s / total * 1e9,
+        "metrics_ns_per_request": metrics_s / total * 1e9,
+        "overhead_ns_per_request": (metrics_s - baseline_s) / total * 1e9,
+        "to_prometheus_ms": export_s * 1000,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
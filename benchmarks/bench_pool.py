@@ -0,0 +1,58 @@
+"""
+Compare a fresh connection per request against the pooled client.
+
+Usage: python -m benchmarks.bench_pool [--requests N]
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks.stub_server import StubServer
+from sec4dev import Sec4DevClient
+from sec4dev.http import request
+
+API_KEY = "sec4_bench"
+
+
+def _run_unpooled(server: StubServer, n: int) -> dict:
+    server.reset_counters()
+    url = f"{server.base_url}/ip/check"
+    start = time.perf_counter()
+    for _ in range(n):
+        request("POST", url, API_KEY, json={"ip": "203.0.113.42"}, retries=0)
+    elapsed = time.perf_counter() - start
+    return {"requests": server.requests, "connections": server.connections, "seconds": elapsed}
+
+
+def _run_pooled(server: StubServer, n: int) -> dict:
+    server.reset_counters()
+    with Sec4DevClient(API_KEY, base_url=server.base_url, retries=0) as client:
+        start = time.perf_counter()
+        for _ in range(n):
+            client.ip.check("203.0.113.42")
+        elapsed = time.perf_counter() - start
+    return {"requests": server.requests, "connections": server.connections, "seconds": elapsed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    with StubServer() as server:
+        unpooled = _run_unpooled(server, args.requests)
+        pooled = _run_pooled(server, args.requests)
+
+    report = {
+        "benchmark": "pool",
+        "unpooled": unpooled,
+        "pooled": pooled,
+        "handshakes_saved": unpooled["connections"] - pooled["connections"],
+        "speedup": unpooled["seconds"] / pooled["seconds"] if pooled["seconds"] else None,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
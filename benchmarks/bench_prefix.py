@@ -0,0 +1,104 @@
+"""
+Compare the prefix trie against a flat dict keyed by IP string.
+
+Usage: python -m benchmarks.bench_prefix [--entries N] [--lookups N]
+
+"exact" stores every address in both structures (/32 entries in the trie).
+"generalized" stores one /24 per block in the trie, as IPPrefixCache does for
+hosting results, while the dict still needs one entry per address.
+"""
+
+import argparse
+import gc
+import ipaddress
+import json
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from sec4dev.prefix import PrefixTrie
+
+VALUE = object()
+
+
+def _measure(build: Callable[[], Any]) -> Tuple[Any, int, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    obj = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size, elapsed
+
+
+def _lookup_ns(lookup: Callable[[Any], Any], queries: List[Any]) -> float:
+    start = time.perf_counter()
+    for q in queries:
+        lookup(q)
+    return (time.perf_counter() - start) / len(queries) * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--per-block", type=int, default=200, help="addresses per /24 block")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    blocks = max(1, args.entries // args.per_block)
+    block_keys = [b << 8 for b in rng.sample(range(1 << 24), blocks)]
+    per_block = min(args.per_block, 256)
+    addrs = [b | host for b in block_keys for host in rng.sample(range(256), per_block)]
+    query_idx = [rng.randrange(len(addrs)) for _ in range(args.lookups)]
+    strings = [str(ipaddress.IPv4Address(a)) for a in addrs]
+
+    def build_dict() -> Dict[str, Any]:
+        # Key strings are built inside the measurement: a cache owns its keys.
+        return {str(ipaddress.IPv4Address(a)): VALUE for a in addrs}
+
+    def build_exact_trie() -> PrefixTrie:
+        trie = PrefixTrie(32)
+        for a in addrs:
+            trie.insert(a, 32, VALUE)
+        return trie
+
+    def build_block_trie() -> PrefixTrie:
+        trie = PrefixTrie(32)
+        for b in block_keys:
+            trie.insert(b, 24, VALUE)
+        return trie
+
+    flat, dict_bytes, dict_build = _measure(build_dict)
+    exact, exact_bytes, exact_build = _measure(build_exact_trie)
+    blocks_trie, block_bytes, block_build = _measure(build_block_trie)
+
+    str_queries = [strings[i] for i in query_idx]
+    int_queries = [addrs[i] for i in query_idx]
+    # Both paths include parsing the address string, as a cache lookup would.
+    dict_ns = _lookup_ns(flat.get, str_queries)
+    exact_ns = _lookup_ns(lambda s: exact.longest_match(int(ipaddress.IPv4Address(s))), str_queries)
+    block_ns = _lookup_ns(lambda s: blocks_trie.longest_match(int(ipaddress.IPv4Address(s))), str_queries)
+    trie_only_ns = _lookup_ns(blocks_trie.longest_match, int_queries)
+
+    report = {
+        "benchmark": "prefix",
+        "entries": len(addrs),
+        "blocks": blocks,
+        "dict": {"entries": len(flat), "bytes": dict_bytes, "build_s": dict_build, "lookup_ns": dict_ns},
+        "trie_exact": {"entries": len(exact), "bytes": exact_bytes, "build_s": exact_build, "lookup_ns": exact_ns},
+        "trie_generalized": {
+            "entries": len(blocks_trie),
+            "bytes": block_bytes,
+            "build_s": block_build,
+            "lookup_ns": block_ns,
+            "lookup_ns_preparsed": trie_only_ns,
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Results built per second by each construction path.
+
+Usage: python -m benchmarks.bench_results [--count N]
+
+"nested_models" is the former path: one validated constructor per sub-model.
+"model_validate" is the current path: one validated call for the whole tree.
+"trusted" is sec4dev.models.fast.construct() without validation, used to copy
+validated results (prefix cache) and rebuild email results.
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+from sec4dev.ip import _build_result
+from sec4dev.models.email import EmailCheckResult
+from sec4dev.models.fast import construct, email_check_result
+from sec4dev.models.ip import IPCheckResult, IPGeo, IPNetwork, IPSignals
+
+IP_BODY: Dict[str, Any] = {
+    "ip": "203.0.113.42",
+    "classification": "hosting",
+    "confidence": 0.9,
+    "signals": {"is_hosting": True, "is_vpn": False},
+    "network": {"asn": 16509, "org": "Amazon", "provider": "AWS"},
+    "geo": {"country": "US", "region": "VA"},
+}
+
+
+def _nested_models(data: Dict[str, Any], ip: str) -> IPCheckResult:
+    signals = data.get("signals") or {}
+    network = data.get("network") or {}
+    geo = data.get("geo") or {}
+    return IPCheckResult(
+        ip=data.get("ip", ip),
+        classification=data.get("classification", "unknown"),
+        confidence=float(data.get("confidence", 0.0)),
+        signals=IPSignals(
+            is_hosting=signals.get("is_hosting", False),
+            is_residential=signals.get("is_residential", False),
+            is_mobile=signals.get("is_mobile", False),
+            is_vpn=signals.get("is_vpn", False),
+            is_tor=signals.get("is_tor", False),
+            is_proxy=signals.get("is_proxy", False),
+        ),
+        network=IPNetwork(asn=network.get("asn"), org=network.get("org"), provider=network.get("provider")),
+        geo=IPGeo(country=geo.get("country"), region=geo.get("region")),
+    )
+
+
+def _per_second(build: Callable[[], Any], count: int) -> float:
+    best = 0.0
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(count):
+            build()
+        best = max(best, count / (time.perf_counter() - start))
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    template = _build_result(IP_BODY, "x")
+    assert _nested_models(IP_BODY, "x") == template
+    ip_rates = {
+        "nested_models": _per_second(lambda: _nested_models(IP_BODY, "x"), args.count),
+        "model_validate": _per_second(lambda: _build_result(IP_BODY, "x"), args.count),
+    }
+    copy_rates = {
+        "model_copy": _per_second(lambda: template.model_copy(update={"ip": "y"}), args.count),
+        "trusted": _per_second(lambda: construct(IPCheckResult, {**template.__dict__, "ip": "y"}), args.count),
+    }
+    email_rates = {
+        "validated": _per_second(
+            lambda: EmailCheckResult(email="a@b.com", domain="b.com", is_disposable=True), args.count
+        ),
+        "trusted": _per_second(lambda: email_check_result("a@b.com", "b.com", True), args.count),
+    }
+    report = {
+        "benchmark": "results",
+        "count": args.count,
+        "ip_results_per_s": ip_rates,
+        "ip_speedup_vs_nested": ip_rates["model_validate"] / ip_rates["nested_models"],
+        "ip_copies_per_s": copy_rates,
+        "email_results_per_s": email_rates,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""
+SDK benchmark suite: latency, throughput, behaviour under faults and CPU cost.
+
+Usage: python -m benchmarks.bench_suite [--scenarios latency,throughput,faults]
+       [--requests N] [--concurrency 1,4,16,64] [--latency-ms MS]
+       [--output FILE] [--compare BASELINE.json] [--threshold 0.10]
+
+The stub API runs in a child process (see StubProcess), so the CPU time
+reported for each run (cpu_us_per_request) is spent by the SDK and httpx alone.
+
+- latency: sequential checks with the sync and async clients, as percentiles.
+  "raw_httpx" posts the same requests with a bare httpx.Client; the difference
+  is the SDK's per-call overhead.
+- throughput: checks per second at each --concurrency (threads for sync,
+  tasks for async), with distinct inputs so that no calls are coalesced.
+- faults: checks against a stub that answers --error-rate of requests with a
+  503 and --throttle-rate with a 429, using a MetricsRegistry to count
+  attempts, retries and backoff sleep.
+
+The JSON report can be written with --output and compared with a previous one
+with --compare. Metrics that got worse by more than --threshold are listed
+under "regressions" and make the exit status 1.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.stub_server import StubProcess
+from sec4dev import AsyncSec4DevClient, Sec4DevClient, __version__
+from sec4dev.exceptions import Sec4DevError
+from sec4dev.http import json_backend
+from sec4dev.metrics import MetricsRegistry
+
+API_KEY = "sec4_bench"
+SCENARIOS = ("latency", "throughput", "faults")
+
+
+def _ips(n: int) -> List[str]:
+    return [f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}" for i in range(n)]
+
+
+def _emails(n: int) -> List[str]:
+    # Email checks are coalesced per domain, so each input gets its own domain.
+    return [f"user@domain{i}.example" for i in range(n)]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _latency_summary(latencies: List[float], cpu_seconds: float) -> Dict[str, float]:
+    return {
+        "requests": len(latencies),
+        "mean_us": sum(latencies) / len(latencies) * 1e6,
+        "p50_us": _percentile(latencies, 50) * 1e6,
+        "p90_us": _percentile(latencies, 90) * 1e6,
+        "p99_us": _percentile(latencies, 99) * 1e6,
+        "cpu_us_per_request": cpu_seconds / len(latencies) * 1e6,
+    }
+
+
+def _time_sequential(call: Callable[[str], Any], inputs: List[str]) -> Dict[str, float]:
+    call(inputs[0])  # warm up the connection
+    latencies = []
+    cpu_start = time.process_time()
+    for value in inputs:
+        start = time.perf_counter()
+        call(value)
+        latencies.append(time.perf_counter() - start)
+    return _latency_summary(latencies, time.process_time() - cpu_start)
+
+
+async def _time_sequential_async(call: Callable[[str], Awaitable[Any]], inputs: List[str]) -> Dict[str, float]:
+    await call(inputs[0])
+    latencies = []
+    cpu_start = time.process_time()
+    for value in inputs:
+        start = time.perf_counter()
+        await call(value)
+        latencies.append(time.perf_counter() - start)
+    return _latency_summary(latencies, time.process_time() - cpu_start)
+
+
+def _client_options(concurrency: int = 1, **options: Any) -> Dict[str, Any]:
+    pool = max(concurrency, 10)
+    return {"max_connections": pool, "max_keepalive_connections": pool, **options}
+
+
+def _bench_latency(args: argparse.Namespace) -> Dict[str, Any]:
+    n = args.requests
+    results: Dict[str, Any] = {}
+    with StubProcess(latency_ms=args.latency_ms) as stub:
+        with httpx.Client(base_url=stub.base_url, headers={"X-API-Key": API_KEY}) as raw:
+            results["raw_httpx"] = _time_sequential(lambda ip: raw.post("/ip/check", json={"ip": ip}).json(), _ips(n))
+        with Sec4DevClient(API_KEY, base_url=stub.base_url, retries=0) as client:
+            results["sync_ip"] = _time_sequential(client.ip.check, _ips(n))
+            results["sync_email"] = _time_sequential(client.email.check, _emails(n))
+
+        async def run_async() -> None:
+            async with AsyncSec4DevClient(API_KEY, base_url=stub.base_url, retries=0) as client:
+                results["async_ip"] = await _time_sequential_async(client.ip.check, _ips(n))
+                results["async_email"] = await _time_sequential_async(client.email.check, _emails(n))
+
+        asyncio.run(run_async())
+    results["sdk_overhead_us"] = results["sync_ip"]["p50_us"] - results["raw_httpx"]["p50_us"]
+    return results
+
+
+def _timed_run(run: Callable[[], int], n: int) -> Dict[str, float]:
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    completed = run()
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    return {
+        "requests": n,
+        "completed": completed,
+        "seconds": elapsed,
+        "requests_per_second": n / elapsed,
+        "cpu_us_per_request": cpu / n * 1e6,
+    }
+
+
+def _sync_run(client: Sec4DevClient, inputs: List[str], concurrency: int) -> int:
+    def check(ip: str) -> bool:
+        try:
+            client.ip.check(ip)
+            return True
+        except Sec4DevError:
+            return False
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return sum(pool.map(check, inputs))
+
+
+async def _async_run(client: AsyncSec4DevClient, inputs: List[str], concurrency: int) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def check(ip: str) -> bool:
+        async with semaphore:
+            try:
+                await client.ip.check(ip)
+                return True
+            except Sec4DevError:
+                return False
+
+    return sum(await asyncio.gather(*(check(ip) for ip in inputs)))
+
+
+def _bench_throughput(args: argparse.Namespace) -> Dict[str, Any]:
+    results: Dict[str, Any] = {"sync": {}, "async": {}}
+    inputs = _ips(args.requests)
+    with StubProcess(latency_ms=args.latency_ms) as stub:
+        for concurrency in args.concurrency:
+            options = _client_options(concurrency, base_url=stub.base_url, retries=0)
+            with Sec4DevClient(API_KEY, **options) as client:
+                _sync_run(client, inputs[:concurrency], concurrency)
+                results["sync"][str(concurrency)] = _timed_run(
+                    lambda: _sync_run(client, inputs, concurrency), len(inputs)
+                )
+
+            async def run_async() -> Dict[str, float]:
+                async with AsyncSec4DevClient(API_KEY, **options) as client:
+                    await _async_run(client, inputs[:concurrency], concurrency)
+                    cpu_start = time.process_time()
+                    start = time.perf_counter()
+                    completed = await _async_run(client, inputs, concurrency)
+                    elapsed = time.perf_counter() - start
+                    cpu = time.process_time() - cpu_start
+                return {
+                    "requests": len(inputs),
+                    "completed": completed,
+                    "seconds": elapsed,
+                    "requests_per_second": len(inputs) / elapsed,
+                    "cpu_us_per_request": cpu / len(inputs) * 1e6,
+                }
+
+            results["async"][str(concurrency)] = asyncio.run(run_async())
+    return results
+
+
+def _fault_summary(run: Dict[str, float], metrics: MetricsRegistry, stub: StubProcess) -> Dict[str, Any]:
+    endpoint = metrics.snapshot()["endpoints"].get("/api/v1/ip/check", {})
+    attempts = endpoint.get("attempts", 0)
+    return {
+        **run,
+        "failed": run["requests"] - run["completed"],
+        "attempts": attempts,
+        "retries": endpoint.get("retries", 0),
+        "attempts_per_request": attempts / run["requests"],
+        "retry_sleep_seconds": endpoint.get("sleep_seconds", 0.0),
+        "server_statuses": stub.stats()["statuses"],
+    }
+
+
+def _bench_faults(args: argparse.Namespace) -> Dict[str, Any]:
+    results: Dict[str, Any] = {"error_rate": args.error_rate, "throttle_rate": args.throttle_rate}
+    inputs = _ips(args.requests)
+    concurrency = max(args.concurrency)
+    faults = {"error_rate": args.error_rate, "throttle_rate": args.throttle_rate, "retry_after": 0, "seed": 0}
+
+    with StubProcess(latency_ms=args.latency_ms, **faults) as stub:
+        metrics = MetricsRegistry()
+        options = _client_options(concurrency, base_url=stub.base_url, retries=3, retry_delay=1, metrics=metrics)
+        with Sec4DevClient(API_KEY, **options) as client:
+            run = _timed_run(lambda: _sync_run(client, inputs, concurrency), len(inputs))
+        results["sync"] = _fault_summary(run, metrics, stub)
+
+    with StubProcess(latency_ms=args.latency_ms, **faults) as stub:
+        metrics = MetricsRegistry()
+        options = _client_options(concurrency, base_url=stub.base_url, retries=3, retry_delay=1, metrics=metrics)
+
+        async def run_async() -> int:
+            async with AsyncSec4DevClient(API_KEY, **options) as client:
+                return await _async_run(client, inputs, concurrency)
+
+        run = _timed_run(lambda: asyncio.run(run_async()), len(inputs))
+        results["async"] = _fault_summary(run, metrics, stub)
+    return results
+
+
+def _flatten(value: Any, prefix: str = "") -> Iterator[Tuple[str, float]]:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _flatten(item, f"{prefix}.{key}" if prefix else key)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        yield prefix, float(value)
+
+
+def _lower_is_better(metric: str) -> Optional[bool]:
+    """Direction of a metric for comparisons; None if it is not compared."""
+    name = metric.rsplit(".", 1)[-1]
+    if name.endswith("_us") or name in ("cpu_us_per_request", "seconds", "attempts_per_request"):
+        return True
+    if name == "requests_per_second":
+        return False
+    return None
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> Dict[str, Any]:
+    """Relative change of each comparable metric; those worse than ``threshold`` are regressions."""
+    before = dict(_flatten(baseline.get("results", {})))
+    changes = {}
+    regressions = []
+    for metric, value in _flatten(current.get("results", {})):
+        lower_is_better = _lower_is_better(metric)
+        old = before.get(metric)
+        if lower_is_better is None or not old:
+            continue
+        change = (value - old) / old
+        changes[metric] = change
+        if (change if lower_is_better else -change) > threshold:
+            regressions.append(metric)
+    return {"baseline": baseline.get("environment"), "threshold": threshold, "changes": changes, "regressions": regressions}
+
+
+def _environment() -> Dict[str, Any]:
+    return {
+        "sdk_version": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "httpx": httpx.__version__,
+        "json_backend": json_backend(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def _csv(parse: Callable[[str], Any]) -> Callable[[str], List[Any]]:
+    return lambda value: [parse(item) for item in value.split(",") if item]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", type=_csv(str), default=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=1000, help="requests per run")
+    parser.add_argument("--concurrency", type=_csv(int), default=[1, 4, 16, 64])
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="stub latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.1, help="503s in the faults scenario")
+    parser.add_argument("--throttle-rate", type=float, default=0.05, help="429s in the faults scenario")
+    parser.add_argument("--output", help="also write the report to this file")
+    parser.add_argument("--compare", help="previous report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change counted as a regression")
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    runners = {"latency": _bench_latency, "throughput": _bench_throughput, "faults": _bench_faults}
+    report: Dict[str, Any] = {
+        "benchmark": "suite",
+        "environment": _environment(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        "results": {name: runners[name](args) for name in SCENARIOS if name in args.scenarios},
+    }
+    if args.compare:
+        with open(args.compare) as f:
+            report["comparison"] = compare(json.load(f), report, args.threshold)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+    if report.get("comparison", {}).get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
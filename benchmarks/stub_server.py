@@ -0,0 +1,279 @@
+"""
+Local stub of the Sec4Dev API for benchmarks.
+
+StubServer runs in a background thread of the calling process. StubProcess
+runs the same server in a child process (``python -m benchmarks.stub_server``)
+so that the benchmark process's CPU time is spent on the client alone.
+
+Both answer POST /ip/check and /email/check with canned bodies, and can inject
+latency, 5xx errors and 429s and enforce a fixed-window rate limit reported in
+X-RateLimit-* headers. GET /_stub/stats returns the server's counters.
+"""
+
+import argparse
+import json
+import math
+import random
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+STATS_PATH = "/_stub/stats"
+
+
+def ip_payload(ip: str) -> Dict[str, Any]:
+    """Canned /ip/check response body."""
+    return {
+        "ip": ip,
+        "classification": "hosting",
+        "confidence": 0.95,
+        "signals": {
+            "is_hosting": True,
+            "is_residential": False,
+            "is_mobile": False,
+            "is_vpn": False,
+            "is_tor": False,
+            "is_proxy": False,
+        },
+        "network": {"asn": 16509, "org": "Amazon.com, Inc.", "provider": "AWS"},
+        "geo": {"country": "US", "region": None},
+    }
+
+
+def email_payload(email: str) -> Dict[str, Any]:
+    """Canned /email/check response body."""
+    domain = email.rsplit("@", 1)[-1]
+    return {"email": email, "domain": domain, "is_disposable": domain.startswith("temp")}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server: "StubServer" = self.server.stub  # type: ignore[attr-defined]
+        if self.path == STATS_PATH:
+            self._send(200, server.stats(), {})
+        else:
+            self._send(404, {"detail": "Not found"}, {})
+
+    def do_POST(self) -> None:
+        server: "StubServer" = self.server.stub  # type: ignore[attr-defined]
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        fault, headers = server._admit()
+        if server.latency_ms:
+            time.sleep(server.latency_ms / 1000.0)
+        if fault is not None:
+            status, payload = fault
+        elif self.path.endswith("/ip/check"):
+            status, payload = 200, ip_payload(body.get("ip", ""))
+        elif self.path.endswith("/email/check"):
+            status, payload = 200, email_payload(body.get("email", ""))
+        else:
+            status, payload = 404, {"detail": "Not found"}
+        server._count_status(status)
+        self._send(status, payload, headers)
+
+    def _send(self, status: int, payload: Any, headers: Dict[str, str]) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        # Called once per accepted TCP connection (i.e. per handshake).
+        self.stub._count_connection()  # type: ignore[attr-defined]
+        super().process_request(request, client_address)
+
+
+class StubServer:
+    """
+    Threaded localhost HTTP/1.1 server that answers /ip/check and /email/check.
+    Counts accepted TCP connections, handled requests and responses by status.
+
+    Every request sleeps ``latency_ms``. A fraction ``error_rate`` of requests
+    gets a 503 and a fraction ``throttle_rate`` a 429 with ``Retry-After:
+    retry_after``. With ``rate_limit``, at most that many requests are served
+    per ``rate_limit_window`` seconds and the rest get a 429 until the window
+    resets. ``seed`` makes the injected faults reproducible.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 0,
+        rate_limit: Optional[int] = None,
+        rate_limit_window: float = 60.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.connections = 0
+        self.requests = 0
+        self.statuses: Dict[int, int] = {}
+        self._random = random.Random(seed)
+        self._window_start = time.monotonic()
+        self._window_used = 0
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), _Handler)
+        self._server.stub = self  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v1"
+
+    def _count_connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def _count_status(self, status: int) -> None:
+        with self._lock:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def _admit(self) -> Tuple[Optional[Tuple[int, Dict[str, Any]]], Dict[str, str]]:
+        """Count a request; return the injected (status, body), if any, and rate limit headers."""
+        with self._lock:
+            self.requests += 1
+            now = time.monotonic()
+            if now - self._window_start >= self.rate_limit_window:
+                self._window_start, self._window_used = now, 0
+            reset = self.rate_limit_window - (now - self._window_start)
+            limit = self.rate_limit if self.rate_limit is not None else 1_000_000
+            limited = self._window_used >= limit
+            if not limited:
+                self._window_used += 1
+            headers = {
+                "X-RateLimit-Limit": str(limit),
+                "X-RateLimit-Remaining": str(max(0, limit - self._window_used)),
+                "X-RateLimit-Reset": str(math.ceil(reset)),
+            }
+            if limited:
+                headers["Retry-After"] = str(math.ceil(reset))
+                return (429, {"detail": "Rate limit exceeded"}), headers
+            roll = self._random.random()
+        if roll < self.error_rate:
+            return (503, {"detail": "Service unavailable"}), headers
+        if roll < self.error_rate + self.throttle_rate:
+            headers["Retry-After"] = str(self.retry_after)
+            return (429, {"detail": "Rate limit exceeded"}), headers
+        return None, headers
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters: connections, requests and statuses (status code -> responses)."""
+        with self._lock:
+            return {
+                "connections": self.connections,
+                "requests": self.requests,
+                "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            }
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.connections = 0
+            self.requests = 0
+            self.statuses = {}
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+class StubProcess:
+    """
+    StubServer in a child process; takes the same keyword arguments.
+    Counters are read over HTTP with stats().
+    """
+
+    def __init__(self, **options: Any) -> None:
+        self._args = [sys.executable, "-m", "benchmarks.stub_server"]
+        for name, value in options.items():
+            if value is not None:
+                self._args += [f"--{name.replace('_', '-')}", str(value)]
+        self._process: Optional["subprocess.Popen[str]"] = None
+        self.base_url = ""
+
+    def stats(self) -> Dict[str, Any]:
+        root = self.base_url.split("/api/", 1)[0]
+        return httpx.get(root + STATS_PATH).json()
+
+    def start(self) -> "StubProcess":
+        self._process = subprocess.Popen(self._args, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        assert self._process.stdout is not None
+        self.base_url = self._process.stdout.readline().strip()
+        if not self.base_url:
+            self.stop()
+            raise RuntimeError("stub server process failed to start")
+        return self
+
+    def stop(self) -> None:
+        if self._process is not None:
+            # Closing stdin tells the child to exit.
+            self._process.communicate()
+            self._process = None
+
+    def __enter__(self) -> "StubProcess":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the Sec4Dev API stub until stdin is closed.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=0)
+    parser.add_argument("--rate-limit", type=int)
+    parser.add_argument("--rate-limit-window", type=float, default=60.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    with StubServer(**vars(args)) as server:
+        print(server.base_url, flush=True)
+        sys.stdin.read()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,13 @@
 
 __version__ = "1.0.0"
 
-from sec4dev.client import Sec4DevClient
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from sec4dev.exceptions import (
     AuthenticationError,
+    CircuitOpenError,
+    DeadlineExceededError,
     ForbiddenError,
     NotFoundError,
     PaymentRequiredError,
@@ -13,17 +17,54 @@ from sec4dev.exceptions import (
     ServerError,
     ValidationError,
 )
-from sec4dev.models import (
-    EmailCheckResult,
-    IPCheckResult,
-    IPClassification,
-    IPGeo,
-    IPNetwork,
-    IPSignals,
-)
+
+if TYPE_CHECKING:
+    from sec4dev.client import AsyncSec4DevClient, Sec4DevClient
+    from sec4dev.models import (
+        EmailCheckResult,
+        IPCheckResult,
+        IPClassification,
+        IPGeo,
+        IPNetwork,
+        IPSignals,
+    )
+
+# The clients and models pull in httpx and pydantic, which dominate import
+# time. They are imported on first attribute access instead (PEP 562).
+_LAZY = {
+    "Sec4DevClient": "sec4dev.client",
+    "AsyncSec4DevClient": "sec4dev.client",
+    "EmailCheckResult": "sec4dev.models",
+    "IPCheckResult": "sec4dev.models",
+    "IPSignals": "sec4dev.models",
+    "IPNetwork": "sec4dev.models",
+    "IPGeo": "sec4dev.models",
+    "IPClassification": "sec4dev.models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        # Submodules (sec4dev.http, sec4dev.ip, ...) resolve like a plain package.
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "Sec4DevClient",
+    "AsyncSec4DevClient",
     "Sec4DevError",
     "AuthenticationError",
     "PaymentRequiredError",
@@ -32,6 +73,8 @@ __all__ = [
     "ValidationError",
     "RateLimitError",
     "ServerError",
+    "CircuitOpenError",
+    "DeadlineExceededError",
     "EmailCheckResult",
     "IPCheckResult",
     "IPSignals",
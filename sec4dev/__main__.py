@@ -0,0 +1,7 @@
+"""Allow ``python -m sec4dev``; see sec4dev.cli."""
+
+import sys
+
+from sec4dev.cli import main
+
+sys.exit(main())
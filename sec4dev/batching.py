@@ -0,0 +1,218 @@
+"""Micro-batching front ends that group individual checks into bulk dispatches."""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ITEMS = 100
+DEFAULT_MAX_WAIT_MS = 5.0
+DEFAULT_MAX_BATCHES_IN_FLIGHT = 4
+
+_STOP = object()
+
+
+def _resolve(pending: List[Tuple[Any, Any]], outcomes: Dict[Any, Any]) -> None:
+    """Complete each caller's future with its own result or exception."""
+    for item, future in pending:
+        if future.done():
+            continue
+        if item not in outcomes:
+            future.set_exception(RuntimeError(f"dispatch returned no outcome for {item!r}"))
+            continue
+        outcome = outcomes[item]
+        if isinstance(outcome, BaseException):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+
+
+class BatchCollector(Generic[T]):
+    """
+    Thread-based micro-batcher.
+
+    Individual submit() calls are buffered for up to ``max_wait_ms`` or
+    ``max_items`` items, then dispatched together through ``dispatch`` (a bulk
+    function returning a dict keyed by input, such as IPService.check_many).
+    Up to ``max_batches_in_flight`` batches run at once. Each caller gets its
+    own concurrent.futures.Future.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[List[Any]], Dict[Any, Any]],
+        max_items: int = DEFAULT_MAX_ITEMS,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        max_batches_in_flight: int = DEFAULT_MAX_BATCHES_IN_FLIGHT,
+    ) -> None:
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        self._dispatch = dispatch
+        self.max_items = max_items
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=max_batches_in_flight)
+        self._closed = False
+        self._batches = 0
+        self._items = 0
+        self._thread = threading.Thread(target=self._run, name="sec4dev-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, item: Any) -> "Future[T]":
+        """Queue an item; the returned future resolves when its batch completes."""
+        if self._closed:
+            raise RuntimeError("BatchCollector is closed")
+        future: "Future[T]" = Future()
+        self._queue.put((item, future))
+        return future
+
+    def check(self, item: Any, timeout: Optional[float] = None) -> T:
+        """Submit an item and block for its result."""
+        return self.submit(item).result(timeout)
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            pending = [first]
+            deadline = time.monotonic() + self.max_wait
+            stop = False
+            while len(pending) < self.max_items:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stop = True
+                    break
+                pending.append(entry)
+            self._batches += 1
+            self._items += len(pending)
+            self._executor.submit(self._flush, pending)
+            if stop:
+                return
+
+    def _flush(self, pending: List[Tuple[Any, "Future[T]"]]) -> None:
+        try:
+            outcomes = self._dispatch([item for item, _ in pending])
+        except BaseException as e:
+            outcomes = {item: e for item, _ in pending}
+        _resolve(pending, outcomes)
+
+    def close(self) -> None:
+        """Dispatch everything already submitted, then stop the collector."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+        # Fail anything that raced with close().
+        while True:
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is not _STOP and not entry[1].done():
+                entry[1].set_exception(RuntimeError("BatchCollector is closed"))
+
+    def stats(self) -> Dict[str, float]:
+        """Batches dispatched, items dispatched and mean batch size."""
+        batches, items = self._batches, self._items
+        return {"batches": batches, "items": items, "mean_batch_size": items / batches if batches else 0.0}
+
+    def __enter__(self) -> "BatchCollector[T]":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class AsyncBatchCollector(Generic[T]):
+    """
+    Asyncio micro-batcher (see BatchCollector).
+
+    ``dispatch`` is an async bulk function such as AsyncIPService.check_many.
+    Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[List[Any]], Awaitable[Dict[Any, Any]]],
+        max_items: int = DEFAULT_MAX_ITEMS,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ) -> None:
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        self._dispatch = dispatch
+        self.max_items = max_items
+        self.max_wait = max_wait_ms / 1000.0
+        self._pending: List[Tuple[Any, "asyncio.Future[T]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: "set[asyncio.Task[None]]" = set()
+        self._batches = 0
+        self._items = 0
+
+    def submit(self, item: Any) -> "asyncio.Future[T]":
+        """Queue an item; the returned future resolves when its batch completes."""
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[T]" = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_items:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return future
+
+    async def check(self, item: Any) -> T:
+        """Submit an item and await its result."""
+        return await self.submit(item)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._batches += 1
+        self._items += len(pending)
+        task = asyncio.ensure_future(self._run(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending: List[Tuple[Any, "asyncio.Future[T]"]]) -> None:
+        try:
+            outcomes = await self._dispatch([item for item, _ in pending])
+        except asyncio.CancelledError:
+            for _, future in pending:
+                future.cancel()
+            raise
+        except Exception as e:
+            outcomes = {item: e for item, _ in pending}
+        _resolve(pending, outcomes)
+
+    async def aclose(self) -> None:
+        """Dispatch everything already submitted and wait for it to finish."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, float]:
+        """Batches dispatched, items dispatched and mean batch size."""
+        batches, items = self._batches, self._items
+        return {"batches": batches, "items": items, "mean_batch_size": items / batches if batches else 0.0}
+
+    async def __aenter__(self) -> "AsyncBatchCollector[T]":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
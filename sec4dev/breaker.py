@@ -0,0 +1,145 @@
+"""Client-side circuit breaker for the HTTP layer."""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Union
+
+from sec4dev.exceptions import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_WINDOW_SIZE = 20
+DEFAULT_MIN_CALLS = 10
+DEFAULT_RESET_TIMEOUT = 30.0
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker shared by all services of a client.
+
+    Every HTTP attempt is recorded as a success or a failure (transport errors
+    and 5xx responses; 4xx answers, including 429, mean the API is up). The
+    breaker opens after ``failure_threshold`` consecutive failures, or when
+    the failure rate over the last ``window_size`` attempts reaches
+    ``error_rate`` (once at least ``min_calls`` were recorded).
+
+    While open, attempts fail immediately with CircuitOpenError. After
+    ``reset_timeout`` seconds it turns half-open and lets up to
+    ``half_open_max_calls`` probe attempts through: a successful probe closes
+    it, a failed one opens it again. Probes that never report back stop
+    counting after another ``reset_timeout``.
+
+    Works unchanged with the async client: no method blocks.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = DEFAULT_FAILURE_THRESHOLD,
+        error_rate: Optional[float] = None,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        min_calls: int = DEFAULT_MIN_CALLS,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        if failure_threshold is None and error_rate is None:
+            raise ValueError("failure_threshold or error_rate is required")
+        if error_rate is not None and not 0 < error_rate <= 1:
+            raise ValueError("error_rate must be in (0, 1]")
+        self.failure_threshold = failure_threshold
+        self.error_rate = error_rate
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probes_since = 0.0
+        self._lock = threading.Lock()
+        self._opens = 0
+        self._rejections = 0
+
+    @property
+    def state(self) -> str:
+        """"closed", "open" or "half_open"."""
+        with self._lock:
+            self._advance(time.monotonic())
+            return self._state
+
+    def _advance(self, now: float) -> None:
+        if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probes = 0
+            self._probes_since = now
+        elif self._state == HALF_OPEN and now - self._probes_since >= self.reset_timeout:
+            # Probes that never reported back (e.g. cancelled) are forgotten.
+            self._probes = 0
+            self._probes_since = now
+
+    def before_call(self) -> None:
+        """Admit an attempt, or raise CircuitOpenError."""
+        now = time.monotonic()
+        with self._lock:
+            self._advance(now)
+            if self._state == CLOSED:
+                return
+            if self._state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return
+            self._rejections += 1
+            if self._state == OPEN:
+                retry_after = self._opened_at + self.reset_timeout - now
+            else:
+                retry_after = self._probes_since + self.reset_timeout - now
+        raise CircuitOpenError("Circuit breaker is open", retry_after=max(0.0, retry_after))
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of an admitted attempt."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                if success:
+                    self._close()
+                else:
+                    self._open(time.monotonic())
+                return
+            self._outcomes.append(success)
+            if success:
+                self._consecutive_failures = 0
+                return
+            self._consecutive_failures += 1
+            if self._state == CLOSED and self._should_trip():
+                self._open(time.monotonic())
+
+    def _should_trip(self) -> bool:
+        if self.failure_threshold is not None and self._consecutive_failures >= self.failure_threshold:
+            return True
+        if self.error_rate is not None and len(self._outcomes) >= self.min_calls:
+            failures = len(self._outcomes) - sum(self._outcomes)
+            return failures / len(self._outcomes) >= self.error_rate
+        return False
+
+    def _open(self, now: float) -> None:
+        self._state = OPEN
+        self._opened_at = now
+        self._opens += 1
+
+    def _close(self) -> None:
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._outcomes.clear()
+
+    def reset(self) -> None:
+        """Force the breaker closed."""
+        with self._lock:
+            self._close()
+
+    def stats(self) -> Dict[str, Union[str, int]]:
+        """Current state and counters: opens (times tripped) and rejections."""
+        with self._lock:
+            self._advance(time.monotonic())
+            return {"state": self._state, "opens": self._opens, "rejections": self._rejections}
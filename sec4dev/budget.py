@@ -0,0 +1,76 @@
+"""Client-wide retry budget."""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List
+
+DEFAULT_RATIO = 0.1
+DEFAULT_WINDOW = 10.0
+DEFAULT_MIN_RETRIES_PER_SECOND = 1.0
+_BUCKETS = 10
+
+
+class RetryBudget:
+    """
+    Caps retries at ``ratio`` of the requests made over the last ``window``
+    seconds, plus a floor of ``min_retries_per_second`` so a quiet client can
+    still retry. Shared by all services of a client, it keeps retries from
+    multiplying load on a degraded API: once the budget is spent, failed
+    attempts raise instead of retrying. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        ratio: float = DEFAULT_RATIO,
+        window: float = DEFAULT_WINDOW,
+        min_retries_per_second: float = DEFAULT_MIN_RETRIES_PER_SECOND,
+    ) -> None:
+        if ratio < 0:
+            raise ValueError("ratio must not be negative")
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.ratio = ratio
+        self.window = window
+        self.min_retries_per_second = min_retries_per_second
+        self._bucket_width = window / _BUCKETS
+        # [bucket index, requests, retries], oldest first
+        self._buckets: Deque[List[int]] = deque()
+        self._lock = threading.Lock()
+        self._exhausted = 0
+
+    def _current(self, now: float) -> List[int]:
+        index = int(now / self._bucket_width)
+        buckets = self._buckets
+        while buckets and buckets[0][0] <= index - _BUCKETS:
+            buckets.popleft()
+        if not buckets or buckets[-1][0] != index:
+            buckets.append([index, 0, 0])
+        return buckets[-1]
+
+    def record_request(self) -> None:
+        """Count one request (not its retries)."""
+        with self._lock:
+            self._current(time.monotonic())[1] += 1
+
+    def try_retry(self) -> bool:
+        """Take one retry from the budget; False if it is spent."""
+        with self._lock:
+            bucket = self._current(time.monotonic())
+            requests = sum(b[1] for b in self._buckets)
+            retries = sum(b[2] for b in self._buckets)
+            if retries + 1 > self.ratio * requests + self.min_retries_per_second * self.window:
+                self._exhausted += 1
+                return False
+            bucket[2] += 1
+            return True
+
+    def stats(self) -> Dict[str, int]:
+        """Requests and retries in the current window, and retries refused."""
+        with self._lock:
+            self._current(time.monotonic())
+            return {
+                "requests": sum(b[1] for b in self._buckets),
+                "retries": sum(b[2] for b in self._buckets),
+                "exhausted": self._exhausted,
+            }
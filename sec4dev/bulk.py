@@ -0,0 +1,91 @@
+"""Bounded-concurrency fan-out helpers for bulk checks."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+DEFAULT_CONCURRENCY = 10
+
+
+def _dedupe(items: Iterable[Any]) -> Tuple[List[Any], Dict[Any, int]]:
+    """
+    Normalize (strip) inputs and drop duplicates.
+    Returns the distinct keys and a mapping of each original input, in
+    first-seen order, to the index of its key.
+    """
+    keys: List[Any] = []
+    key_index: Dict[Any, int] = {}
+    originals: Dict[Any, int] = {}
+    for item in items:
+        if item in originals:
+            continue
+        key = item.strip() if isinstance(item, str) else item
+        if key not in key_index:
+            key_index[key] = len(keys)
+            keys.append(key)
+        originals[item] = key_index[key]
+    return keys, originals
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split an iterable into lists of at most ``size`` items, consuming it lazily."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+def _call(func: Callable[[Any], T], item: Any) -> Union[T, Exception]:
+    try:
+        return func(item)
+    except Exception as e:
+        return e
+
+
+def run_many(
+    func: Callable[[Any], T],
+    items: Iterable[Any],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Dict[Any, Union[T, Exception]]:
+    """
+    Call func once per distinct input using up to `concurrency` threads.
+    Returns a dict keyed by each input (in first-seen order) whose values are
+    results or the exception raised for that input.
+    """
+    _check_concurrency(concurrency)
+    keys, originals = _dedupe(items)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(lambda key: _call(func, key), keys))
+    return {original: outcomes[index] for original, index in originals.items()}
+
+
+async def async_run_many(
+    func: Callable[[Any], Awaitable[T]],
+    items: Iterable[Any],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Dict[Any, Union[T, Exception]]:
+    """Async variant of run_many() using `concurrency` worker tasks."""
+    _check_concurrency(concurrency)
+    keys, originals = _dedupe(items)
+    outcomes: List[Any] = [None] * len(keys)
+    pending = iter(range(len(keys)))
+
+    async def worker() -> None:
+        for index in pending:
+            try:
+                outcomes[index] = await func(keys[index])
+            except Exception as e:
+                outcomes[index] = e
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(keys)))))
+    return {original: outcomes[index] for original, index in originals.items()}
@@ -0,0 +1,151 @@
+"""Result cache backends."""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+DEFAULT_MAXSIZE = 10000
+DEFAULT_TTL = 300.0
+
+
+class CacheBackend(ABC):
+    """
+    Interface for service result caches.
+
+    Implementations must be thread-safe. get() returns None on a miss or an
+    expired entry; ``ttl`` values are in seconds. Backends that support
+    stale-while-revalidate override lookup() to also return entries past
+    their soft TTL, flagged as stale.
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Cached value, or None on a miss or an expired entry."""
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[Any], bool]:
+        """Return (value or None, whether the value is stale)."""
+        return self.get(key), False
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value``; ``ttl`` overrides the backend's default."""
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        """Remove ``key`` if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """Backend counters; at least hits and misses."""
+
+    def close(self) -> None:
+        """Release resources (flush pending writes)."""
+
+
+class TTLCache(CacheBackend):
+    """
+    In-process, thread-safe bounded cache with per-entry TTL and LRU eviction.
+
+    Lookups and inserts are O(1). ``ttl`` is in seconds. With ``hard_ttl``
+    greater than ``ttl`` (stale-while-revalidate), entries past ``ttl`` are
+    misses for get() but are still returned by lookup(), flagged stale, until
+    ``hard_ttl`` has passed.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float = DEFAULT_TTL,
+        hard_ttl: Optional[float] = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if hard_ttl is not None and hard_ttl < ttl:
+            raise ValueError("hard_ttl must not be less than ttl")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hard_ttl = ttl if hard_ttl is None else hard_ttl
+        # key -> (fresh_until, expires_at, value)
+        self._data: "OrderedDict[Hashable, Tuple[float, float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._stale_hits = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        value, stale = self._lookup(key, allow_stale=False)
+        return value
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[Any], bool]:
+        """Return (value, stale); stale entries are served until hard_ttl."""
+        return self._lookup(key, allow_stale=True)
+
+    def _lookup(self, key: Hashable, allow_stale: bool) -> Tuple[Optional[Any], bool]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return None, False
+            fresh_until, expires_at, value = entry
+            now = time.monotonic()
+            if expires_at <= now:
+                del self._data[key]
+                self._expirations += 1
+                self._misses += 1
+                return None, False
+            stale = fresh_until <= now
+            if stale and not allow_stale:
+                self._misses += 1
+                return None, False
+            self._data.move_to_end(key)
+            self._hits += 1
+            if stale:
+                self._stale_hits += 1
+            return value, stale
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        fresh_until = time.monotonic() + (self.ttl if ttl is None else ttl)
+        expires_at = fresh_until + (self.hard_ttl - self.ttl)
+        with self._lock:
+            self._data[key] = (fresh_until, expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a key if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters: hits (stale_hits of them served stale), misses, evictions, expirations, size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "size": len(self._data),
+            }
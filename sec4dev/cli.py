@@ -0,0 +1,317 @@
+"""
+Command-line bulk enrichment: ``sec4dev ip|email [options] [FILE ...]``.
+
+Reads CSV or JSONL rows from files or stdin, checks one column of each row,
+and writes the rows back out with the result added, in input order. Rows are
+streamed through a window of at most ``2 * concurrency`` rows, so memory use
+does not depend on input size. Progress goes to stderr.
+
+A JSONL line that is not a JSON object does not stop the run: it is written
+out as ``{"input": <line>, "sec4dev": {"error": ...}}`` and counted as an error.
+Several CSV inputs must share one header (in any column order). ``.json``
+files are not guessed to be JSONL; pass ``--format jsonl`` if they are.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Any, Callable, Deque, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from sec4dev.cache import TTLCache
+from sec4dev.client import Sec4DevClient
+from sec4dev.exceptions import Sec4DevError
+from sec4dev.http import DEFAULT_BASE_URL, decode_json
+from sec4dev.metrics import MetricsRegistry
+from sec4dev.models.email import EmailCheckResult
+from sec4dev.models.ip import IPCheckResult
+
+Row = Dict[str, Any]
+
+PREFIX = "sec4dev_"
+IP_FIELDS = [
+    "classification",
+    "confidence",
+    "is_hosting",
+    "is_residential",
+    "is_mobile",
+    "is_vpn",
+    "is_tor",
+    "is_proxy",
+    "asn",
+    "org",
+    "provider",
+    "country",
+    "region",
+    "error",
+]
+EMAIL_FIELDS = ["domain", "is_disposable", "error"]
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+
+def _ip_fields(result: IPCheckResult) -> Row:
+    return {
+        "classification": result.classification,
+        "confidence": result.confidence,
+        **result.signals.__dict__,
+        **result.network.__dict__,
+        **result.geo.__dict__,
+    }
+
+
+def _email_fields(result: EmailCheckResult) -> Row:
+    return {"domain": result.domain, "is_disposable": result.is_disposable}
+
+
+class _Unreadable(NamedTuple):
+    """Stands in for the value of an input row that could not be parsed."""
+
+    error: Exception
+
+
+class _Progress:
+    """
+    Row and error counters, reported to stderr every ``interval`` seconds
+    with the 429 and 5xx responses (retries included) recorded in ``metrics``.
+    """
+
+    def __init__(self, stream: IO[str], interval: float) -> None:
+        self._stream = stream
+        self._interval = interval
+        self._started = time.monotonic()
+        self._last_report = self._started
+        self.metrics = MetricsRegistry()
+        self.rows = 0
+        self.errors = 0
+
+    def statuses(self) -> Tuple[int, int]:
+        """(429 responses, 5xx responses) received so far."""
+        rate_limited = server_errors = 0
+        for endpoint in self.metrics.snapshot()["endpoints"].values():
+            for status, count in endpoint["statuses"].items():
+                if status == 429:
+                    rate_limited += count
+                elif status >= 500:
+                    server_errors += count
+        return rate_limited, server_errors
+
+    def row_done(self, failed: bool) -> None:
+        self.rows += 1
+        if failed:
+            self.errors += 1
+        now = time.monotonic()
+        if self._interval > 0 and now - self._last_report >= self._interval:
+            self._last_report = now
+            self.report()
+
+    def report(self, final: bool = False) -> None:
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        rate_limited, server_errors = self.statuses()
+        print(
+            f"sec4dev: {'done, ' if final else ''}{self.rows} rows in {elapsed:.1f}s "
+            f"({self.rows / elapsed:.0f} rows/s), {self.errors} errors, "
+            f"{rate_limited} rate limited (429), {server_errors} server errors",
+            file=self._stream,
+            flush=True,
+        )
+
+
+def _call(check: Callable[[Any], Any], value: Any) -> Tuple[Any, Optional[Exception]]:
+    if isinstance(value, _Unreadable):
+        return None, value.error
+    try:
+        return check(value), None
+    except Exception as e:
+        return None, e
+
+
+def enrich(
+    rows: Iterator[Tuple[Row, Any]],
+    check: Callable[[Any], Any],
+    concurrency: int,
+) -> Iterator[Tuple[Row, Any, Optional[Exception]]]:
+    """
+    Run check(value) for each (row, value) on ``concurrency`` threads.
+    Yields (row, result, error) in input order, holding at most
+    2 * concurrency rows in memory. If reading ``rows`` fails, the rows
+    already read are yielded before the error is raised.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    window: Deque[Tuple[Row, "Future[Tuple[Any, Optional[Exception]]]"]] = deque()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        try:
+            for row, value in rows:
+                window.append((row, executor.submit(_call, check, value)))
+                if len(window) >= 2 * concurrency:
+                    row, future = window.popleft()
+                    yield (row, *future.result())
+        except Exception:
+            while window:
+                row, future = window.popleft()
+                yield (row, *future.result())
+            raise
+        except BaseException:
+            # Interrupted, or the consumer stopped early: skip the queued checks.
+            for _, future in window:
+                future.cancel()
+            raise
+        while window:
+            row, future = window.popleft()
+            yield (row, *future.result())
+
+
+def _open_inputs(paths: Sequence[str]) -> Iterator[IO[str]]:
+    for path in paths:
+        if path == "-":
+            yield sys.stdin
+        else:
+            with open(path, encoding="utf-8", newline="") as f:
+                yield f
+
+
+def _read_csv(paths: Sequence[str], column: str, header: List[str]) -> Iterator[Tuple[Row, Any]]:
+    """
+    Rows from each CSV file; ``header`` receives the first file's field names.
+    Every later file must have the same columns, in any order.
+    """
+    first = ""
+    for f in _open_inputs(paths):
+        name = getattr(f, "name", "<stdin>")
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames or []
+        if column not in fieldnames:
+            raise SystemExit(f"sec4dev: column {column!r} not found in CSV header {fieldnames}")
+        if not header:
+            header.extend(fieldnames)
+            first = name
+        elif set(fieldnames) != set(header):
+            raise SystemExit(f"sec4dev: CSV header {fieldnames} of {name} does not match {header} of {first}")
+        for row in reader:
+            yield row, row[column]
+
+
+def _read_jsonl(paths: Sequence[str], column: str) -> Iterator[Tuple[Row, Any]]:
+    for f in _open_inputs(paths):
+        name = getattr(f, "name", "<stdin>")
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                row = decode_json(line)
+                problem = None if isinstance(row, dict) else "not a JSON object"
+            except ValueError as e:
+                problem = f"invalid JSON ({e})"
+            if problem is not None:
+                error = ValueError(f"{name}:{number}: {problem}")
+                yield {"input": line.rstrip("\r\n")}, _Unreadable(error)
+            else:
+                yield row, row.get(column)
+
+
+def _run(args: argparse.Namespace, out: IO[str], progress: _Progress) -> None:
+    fields, to_fields = (IP_FIELDS, _ip_fields) if args.check == "ip" else (EMAIL_FIELDS, _email_fields)
+    column = args.column or args.check
+    cache = TTLCache(maxsize=args.cache_size, ttl=args.cache_ttl) if args.cache_size > 0 else None
+    client = Sec4DevClient(
+        args.api_key,
+        base_url=args.base_url,
+        timeout=args.timeout,
+        retries=args.retries,
+        max_connections=args.concurrency,
+        max_keepalive_connections=args.concurrency,
+        ip_cache=cache if args.check == "ip" else None,
+        email_cache=cache if args.check == "email" else None,
+        metrics=progress.metrics,
+    )
+    check = client.ip.check if args.check == "ip" else client.email.check
+
+    with client:
+        if args.format == "jsonl":
+            for row, result, error in enrich(_read_jsonl(args.inputs, column), check, args.concurrency):
+                row["sec4dev"] = {"error": str(error)} if error is not None else to_fields(result)
+                out.write(json.dumps(row, ensure_ascii=False) + "\n")
+                progress.row_done(error is not None)
+            return
+
+        header: List[str] = []
+        writer: Optional[csv.DictWriter] = None
+        for row, result, error in enrich(_read_csv(args.inputs, column, header), check, args.concurrency):
+            if writer is None:
+                names = header + [PREFIX + name for name in fields]
+                writer = csv.DictWriter(out, names, restval="", extrasaction="ignore", lineterminator="\n")
+                writer.writeheader()
+            values = {"error": str(error)} if error is not None else to_fields(result)
+            row.update((PREFIX + name, value) for name, value in values.items())
+            writer.writerow(row)
+            progress.row_done(error is not None)
+        if writer is None and header:
+            csv.writer(out, lineterminator="\n").writerow(header + [PREFIX + name for name in fields])
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="sec4dev",
+        description="Enrich CSV or JSONL rows with Sec4Dev IP or email checks.",
+    )
+    parser.add_argument("check", choices=["ip", "email"], help="check to run on each row")
+    parser.add_argument("inputs", nargs="*", default=["-"], help="input files (default: stdin)")
+    parser.add_argument("-c", "--column", help="column (CSV) or key (JSONL) to check (default: ip/email)")
+    parser.add_argument("-f", "--format", choices=["csv", "jsonl"], help="input format (default: from file suffix, else csv)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("-j", "--concurrency", type=int, default=32, help="maximum requests in flight (default: 32)")
+    parser.add_argument("--api-key", default=os.environ.get("SEC4DEV_API_KEY"), help="API key (default: $SEC4DEV_API_KEY)")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--timeout", type=int, default=30000, help="per-request timeout in ms")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--cache-size", type=int, default=100_000, help="results cached for repeated values (0 disables)")
+    parser.add_argument("--cache-ttl", type=float, default=3600, help="cache TTL in seconds")
+    parser.add_argument("--progress-interval", type=float, default=5.0, help="seconds between progress lines (0 disables)")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if not args.api_key:
+        parser.error("an API key is required (--api-key or SEC4DEV_API_KEY)")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.format is None:
+        if any(path.lower().endswith(".json") for path in args.inputs):
+            parser.error("cannot read .json input; convert it to JSONL (one object per line) or pass --format jsonl")
+        args.format = "jsonl" if args.inputs[0].lower().endswith(JSONL_SUFFIXES) else "csv"
+
+    progress = _Progress(sys.stderr, args.progress_interval)
+    try:
+        if args.output == "-":
+            _run(args, sys.stdout, progress)
+            sys.stdout.flush()
+        else:
+            with open(args.output, "w", encoding="utf-8", newline="") as out:
+                _run(args, out, progress)
+    except Sec4DevError as e:
+        print(f"sec4dev: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`). Point stdout at devnull so the
+        # interpreter's final flush does not fail again.
+        try:
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        except OSError:
+            pass
+        return 1
+    except KeyboardInterrupt:
+        progress.report()
+        print("sec4dev: interrupted", file=sys.stderr)
+        return 130
+    progress.report(final=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
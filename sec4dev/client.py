@@ -1,15 +1,33 @@
 """Sec4Dev API client."""
 
-from typing import Any, Callable, Optional
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional
 
-from sec4dev.email import EmailService
+from sec4dev.breaker import CircuitBreaker
+from sec4dev.budget import RetryBudget
+from sec4dev.cache import CacheBackend
+from sec4dev.email import AsyncEmailService, EmailService
 from sec4dev.exceptions import ValidationError
-from sec4dev.http import DEFAULT_BASE_URL
-from sec4dev.ip import IPService
+from sec4dev.hedging import HedgePolicy
+from sec4dev.http import (
+    DEFAULT_BASE_URL,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    create_async_http_client,
+    create_http_client,
+)
+from sec4dev.ip import AsyncIPService, IPService
+from sec4dev.metrics import MetricsRegistry
+from sec4dev.negative import NegativeCache
+from sec4dev.prefix import IPPrefixCache
+from sec4dev.ranges import IPRangeDatabase
+from sec4dev.ratelimit import RateLimiter
+from sec4dev.snapshot import DomainSnapshot
 
 
-class Sec4DevClient:
-    """Main client for the Sec4Dev Security Checks API."""
+class _BaseClient(ABC):
+    """Configuration and rate limit tracking shared by the sync and async clients."""
 
     def __init__(
         self,
@@ -19,7 +37,23 @@ class Sec4DevClient:
         timeout: int = 30000,
         retries: int = 3,
         retry_delay: int = 1000,
+        deadline: Optional[int] = None,
         on_rate_limit: Optional[Callable[[Any], None]] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: int = int(DEFAULT_KEEPALIVE_EXPIRY * 1000),
+        ip_cache: Optional[CacheBackend] = None,
+        email_cache: Optional[CacheBackend] = None,
+        ip_prefix_cache: Optional[IPPrefixCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        email_snapshot: Optional[DomainSnapshot] = None,
+        ip_ranges: Optional[IPRangeDatabase] = None,
+        ip_hedge: Optional[HedgePolicy] = None,
+        ip_negative_cache: Optional[NegativeCache] = None,
+        email_negative_cache: Optional[NegativeCache] = None,
+        metrics: Optional[MetricsRegistry] = None,
     ) -> None:
         if not api_key or not str(api_key).strip().startswith("sec4_"):
             raise ValidationError("API key must start with sec4_", status_code=422)
@@ -28,29 +62,132 @@ class Sec4DevClient:
         self._timeout = timeout
         self._retries = retries
         self._retry_delay = retry_delay
+        self._deadline = deadline
         self._on_rate_limit = on_rate_limit
         self._rate_limit: dict = {"limit": 0, "remaining": 0, "reset_seconds": 0}
+        self._pool_options: Dict[str, Any] = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "keepalive_expiry": keepalive_expiry / 1000.0,
+        }
+        self._ip_cache = ip_cache
+        self._email_cache = email_cache
+        self._ip_prefix_cache = ip_prefix_cache
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self._retry_budget = retry_budget
+        self._email_snapshot = email_snapshot
+        self._ip_ranges = ip_ranges
+        self._ip_hedge = ip_hedge
+        self._ip_negative_cache = ip_negative_cache
+        self._email_negative_cache = email_negative_cache
+        self._metrics = metrics
+        self._setup()
+        if metrics is not None:
+            self._register_stats(metrics)
 
-        def _capture_rate_limit(info: dict) -> None:
-            self._rate_limit = info
-            if on_rate_limit:
-                on_rate_limit(info)
+    @abstractmethod
+    def _setup(self) -> None:
+        """Create the connection pool and services."""
 
+    def _capture_rate_limit(self, info: dict) -> None:
+        self._rate_limit = info
+        if self._on_rate_limit:
+            self._on_rate_limit(info)
+
+    def _close_caches(self) -> None:
+        for cache in (self._ip_cache, self._email_cache):
+            if cache is not None:
+                cache.close()
+
+    def _register_stats(self, metrics: MetricsRegistry) -> None:
+        """Export the stats() of every enabled component through the registry."""
+        components = {
+            "ip": self._ip,
+            "email": self._email,
+            "ip_cache": self._ip_cache,
+            "email_cache": self._email_cache,
+            "ip_prefix_cache": self._ip_prefix_cache,
+            "ip_negative_cache": self._ip_negative_cache,
+            "email_negative_cache": self._email_negative_cache,
+            "ip_hedge": self._ip_hedge,
+            "rate_limiter": self._rate_limiter,
+            "circuit_breaker": self._circuit_breaker,
+            "retry_budget": self._retry_budget,
+        }
+        for name, component in components.items():
+            if component is not None:
+                metrics.register(name, component.stats)
+
+    def _service_kwargs(self, http_client: Any) -> Dict[str, Any]:
+        """Keyword arguments passed to every service."""
+        return {
+            "timeout_ms": self._timeout,
+            "retries": self._retries,
+            "retry_delay_ms": self._retry_delay,
+            "on_rate_limit": self._capture_rate_limit,
+            "http_client": http_client,
+            "rate_limiter": self._rate_limiter,
+            "circuit_breaker": self._circuit_breaker,
+            "retry_budget": self._retry_budget,
+            "deadline_ms": self._deadline,
+            "metrics": self._metrics,
+        }
+
+    @property
+    def rate_limit(self) -> dict:
+        """Last rate limit info (limit, remaining, reset_seconds)."""
+        return dict(self._rate_limit)
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Client-side rate limiter shared by all services, if enabled."""
+        return self._rate_limiter
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Circuit breaker shared by all services, if enabled."""
+        return self._circuit_breaker
+
+    @property
+    def retry_budget(self) -> Optional[RetryBudget]:
+        """Retry budget shared by all services, if enabled."""
+        return self._retry_budget
+
+    @property
+    def metrics(self) -> Optional[MetricsRegistry]:
+        """Request metrics registry, if enabled."""
+        return self._metrics
+
+
+class Sec4DevClient(_BaseClient):
+    """
+    Main client for the Sec4Dev Security Checks API.
+
+    The client owns one pooled HTTP connection pool shared by all services.
+    Call close() when done, or use the client as a context manager.
+    """
+
+    def _setup(self) -> None:
+        self._http_client = create_http_client(self._timeout, **self._pool_options)
+        service_kwargs = self._service_kwargs(self._http_client)
         self._email = EmailService(
             self._base_url,
             self._api_key,
-            timeout_ms=self._timeout,
-            retries=self._retries,
-            retry_delay_ms=self._retry_delay,
-            on_rate_limit=_capture_rate_limit,
+            cache=self._email_cache,
+            snapshot=self._email_snapshot,
+            negative_cache=self._email_negative_cache,
+            **service_kwargs,
         )
         self._ip = IPService(
             self._base_url,
             self._api_key,
-            timeout_ms=self._timeout,
-            retries=self._retries,
-            retry_delay_ms=self._retry_delay,
-            on_rate_limit=_capture_rate_limit,
+            cache=self._ip_cache,
+            prefix_cache=self._ip_prefix_cache,
+            range_db=self._ip_ranges,
+            hedge=self._ip_hedge,
+            negative_cache=self._ip_negative_cache,
+            **service_kwargs,
         )
 
     @property
@@ -63,7 +200,70 @@ class Sec4DevClient:
         """IP check service."""
         return self._ip
 
+    def close(self) -> None:
+        """Stop background refreshes, close the connection pool and flush the caches."""
+        self._ip.close()
+        self._email.close()
+        self._http_client.close()
+        self._close_caches()
+
+    def __enter__(self) -> "Sec4DevClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class AsyncSec4DevClient(_BaseClient):
+    """
+    Asyncio client for the Sec4Dev Security Checks API.
+
+    Services share one httpx.AsyncClient pool and back off with asyncio.sleep,
+    so many checks can be in flight on a single event loop. Call aclose() when
+    done, or use the client as an async context manager.
+    """
+
+    def _setup(self) -> None:
+        self._http_client = create_async_http_client(self._timeout, **self._pool_options)
+        service_kwargs = self._service_kwargs(self._http_client)
+        self._email = AsyncEmailService(
+            self._base_url,
+            self._api_key,
+            cache=self._email_cache,
+            snapshot=self._email_snapshot,
+            negative_cache=self._email_negative_cache,
+            **service_kwargs,
+        )
+        self._ip = AsyncIPService(
+            self._base_url,
+            self._api_key,
+            cache=self._ip_cache,
+            prefix_cache=self._ip_prefix_cache,
+            range_db=self._ip_ranges,
+            hedge=self._ip_hedge,
+            negative_cache=self._ip_negative_cache,
+            **service_kwargs,
+        )
+
     @property
-    def rate_limit(self) -> dict:
-        """Last rate limit info (limit, remaining, reset_seconds)."""
-        return dict(self._rate_limit)
+    def email(self) -> AsyncEmailService:
+        """Async email check service."""
+        return self._email
+
+    @property
+    def ip(self) -> AsyncIPService:
+        """Async IP check service."""
+        return self._ip
+
+    async def aclose(self) -> None:
+        """Stop background refreshes, close the connection pool and flush the caches."""
+        self._ip.close()
+        self._email.close()
+        await self._http_client.aclose()
+        self._close_caches()
+
+    async def __aenter__(self) -> "AsyncSec4DevClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
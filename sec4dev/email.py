@@ -1,14 +1,67 @@
 """Email check service."""
 
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Union
 
-from sec4dev.http import request
+import httpx
+
+from sec4dev.batching import (
+    DEFAULT_MAX_ITEMS,
+    DEFAULT_MAX_WAIT_MS,
+    AsyncBatchCollector,
+    BatchCollector,
+)
+from sec4dev.budget import RetryBudget
+from sec4dev.bulk import DEFAULT_CONCURRENCY, async_run_many, run_many
+from sec4dev.breaker import CircuitBreaker
+from sec4dev.cache import CacheBackend
+from sec4dev.exceptions import Sec4DevError, ValidationError
+from sec4dev.http import async_request, request, response_json
+from sec4dev.metrics import MetricsRegistry
 from sec4dev.models.email import EmailCheckResult
+from sec4dev.models.fast import email_check_result
+from sec4dev.negative import NegativeCache
+from sec4dev.ratelimit import RateLimiter
+from sec4dev.refresh import AsyncBackgroundRefresher
+from sec4dev.service import BaseService
+from sec4dev.singleflight import AsyncSingleFlight
+from sec4dev.snapshot import DomainSnapshot
 from sec4dev.validation import validate_email
 
 
-class EmailService:
-    """Service for checking email (disposable domain)."""
+def _build_result(data: Dict[str, Any], email: str) -> EmailCheckResult:
+    """Build an EmailCheckResult from an /email/check response body."""
+    return EmailCheckResult(
+        email=data.get("email", email),
+        domain=data.get("domain", ""),
+        is_disposable=data.get("is_disposable", False),
+    )
+
+
+def _cache_key(canonical: str) -> str:
+    """
+    Cache key for a canonical email address. Disposability depends only on
+    the domain, so every address on a domain shares one cache entry.
+    """
+    return canonical.rpartition("@")[2]
+
+
+def _for_address(result: EmailCheckResult, email: str) -> EmailCheckResult:
+    """Rebuild a domain verdict fetched for another address for this one."""
+    email = email.strip()
+    if result.email.lower() == email.lower():
+        return result
+    return email_check_result(email, result.domain, result.is_disposable)
+
+
+class _Rejection(NamedTuple):
+    """The API rejected ``canonical`` itself (404/422); other addresses on its domain may be fine."""
+
+    canonical: str
+    error: Sec4DevError
+
+
+class _BaseEmailService(BaseService):
+    """Configuration shared by the sync and async email services."""
 
     def __init__(
         self,
@@ -18,35 +71,269 @@ class EmailService:
         retries: int = 3,
         retry_delay_ms: int = 1000,
         on_rate_limit: Optional[Callable[[dict], None]] = None,
+        http_client: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        deadline_ms: Optional[int] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        cache: Optional[CacheBackend] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        snapshot: Optional[DomainSnapshot] = None,
     ) -> None:
-        self._base_url = base_url.rstrip("/")
-        self._api_key = api_key
-        self._timeout_ms = timeout_ms
-        self._retries = retries
-        self._retry_delay_ms = retry_delay_ms
-        self._on_rate_limit = on_rate_limit
-
-    def check(self, email: str) -> EmailCheckResult:
-        """Check if an email uses a disposable domain."""
-        validate_email(email)
-        url = f"{self._base_url}/email/check"
+        super().__init__(
+            base_url,
+            api_key,
+            timeout_ms=timeout_ms,
+            retries=retries,
+            retry_delay_ms=retry_delay_ms,
+            on_rate_limit=on_rate_limit,
+            http_client=http_client,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            retry_budget=retry_budget,
+            deadline_ms=deadline_ms,
+            metrics=metrics,
+            cache=cache,
+            negative_cache=negative_cache,
+        )
+        self._snapshot = snapshot
+
+    @property
+    def snapshot(self) -> Optional[DomainSnapshot]:
+        """Offline domain snapshot, if loaded."""
+        return self._snapshot
+
+    def load_snapshot(self, path: str) -> DomainSnapshot:
+        """Load (or refresh) the offline snapshot from a file and start using it."""
+        snapshot = DomainSnapshot.load(path)
+        self._snapshot = snapshot
+        return snapshot
+
+    def _local_answer(self, key: str, email: str) -> Optional[EmailCheckResult]:
+        """Answer from the snapshot when it is certain about the domain."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        verdict = snapshot.lookup(key)
+        if verdict is None:
+            return None
+        self._count("local_answers")
+        return email_check_result(email.strip(), key, verdict)
+
+    def _validate(self, email: str) -> str:
+        """Raise for known-bad or malformed input; return the canonical address."""
+        self._raise_if_known_bad(email)
+        try:
+            return validate_email(email)
+        except ValidationError as e:
+            self._remember_failure(email, e)
+            raise
+
+    def _rejected(self, email: str, rejection: _Rejection) -> Sec4DevError:
+        """Remember a rejection of this very address and return the error to raise."""
+        self._remember_failure(email, rejection.error)
+        return rejection.error
+
+    def stats(self) -> Dict[str, int]:
+        """
+        BaseService counters plus calls_avoided: checks answered by the
+        domain cache.
+        """
+        stats = super().stats()
+        stats["calls_avoided"] = self._cache.stats()["hits"] if self._cache is not None else 0
+        return stats
+
+
+class EmailService(_BaseEmailService):
+    """Service for checking email (disposable domain)."""
+
+    _http_client: Optional[httpx.Client]
+
+    def _post(self, path: str, payload: Dict[str, Any], deadline: Optional[int] = None) -> Dict[str, Any]:
+        """POST to the API over the shared pool and return the decoded body."""
+        self._count("api_calls")
         resp, _ = request(
             "POST",
-            url,
+            f"{self._base_url}{path}",
             self._api_key,
-            json={"email": email.strip()},
+            json=payload,
             timeout_ms=self._timeout_ms,
             retries=self._retries,
             retry_delay_ms=self._retry_delay_ms,
             on_rate_limit=self._on_rate_limit,
+            client=self._http_client,
+            limiter=self._rate_limiter,
+            breaker=self._circuit_breaker,
+            deadline_ms=self._deadline_ms if deadline is None else deadline,
+            retry_budget=self._retry_budget,
+            metrics=self._metrics,
         )
-        data = resp.json()
-        return EmailCheckResult(
-            email=data.get("email", email),
-            domain=data.get("domain", ""),
-            is_disposable=data.get("is_disposable", False),
+        return response_json(resp)
+
+    def check(self, email: str, deadline: Optional[int] = None) -> EmailCheckResult:
+        """
+        Check if an email uses a disposable domain.
+        ``deadline`` (ms) bounds the whole call, retries included, and
+        overrides the client's ``deadline`` for this call.
+        """
+        canonical = self._validate(email)
+        key = _cache_key(canonical)
+        local = self._local_answer(key, email)
+        if local is not None:
+            return local
+        cached, stale = self._cache_lookup(key)
+        if cached is not None:
+            if stale:
+                self._revalidate(key, lambda: self._fetch(email, key))
+            return _for_address(cached, email)
+        expires_at = self._expires_at(deadline)
+        outcome = self._flight.do(key, lambda: self._fetch_shared(email, canonical, key, expires_at), expires_at)
+        if isinstance(outcome, _Rejection) and outcome.canonical != canonical:
+            # Another address on this domain was rejected; ask about this one.
+            outcome = self._fetch_shared(email, canonical, key, expires_at)
+        if isinstance(outcome, _Rejection):
+            raise self._rejected(email, outcome)
+        return _for_address(outcome, email)
+
+    def _fetch(self, email: str, key: str, deadline: Optional[int] = None) -> EmailCheckResult:
+        data = self._post("/email/check", {"email": email.strip()}, deadline)
+        result = _build_result(data, email)
+        self._cache_set(key, result)
+        return result
+
+    def _fetch_shared(
+        self, email: str, canonical: str, key: str, expires_at: Optional[float]
+    ) -> Union[EmailCheckResult, _Rejection]:
+        """_fetch() for the domain flight; rejections of the address are returned, not shared."""
+        try:
+            return self._fetch(email, key, self._deadline_left(expires_at))
+        except Sec4DevError as e:
+            if NegativeCache.cacheable(e):
+                return _Rejection(canonical, e)
+            raise
+
+    def check_many(
+        self,
+        emails: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Dict[str, Union[EmailCheckResult, Exception]]:
+        """
+        Check many emails in parallel over the shared pool.
+        Duplicates are checked once. Returns a dict keyed by input, in input
+        order, holding each result or the exception raised for that input.
+        """
+        return run_many(self.check, emails, concurrency)
+
+    def batched(
+        self,
+        max_items: int = DEFAULT_MAX_ITEMS,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> "BatchCollector[EmailCheckResult]":
+        """
+        Return a batching front end for this service.
+        Individual check()/submit() calls from any thread are buffered for up
+        to max_wait_ms or max_items and dispatched together via check_many().
+        Close it (or use it as a context manager) when done.
+        """
+        return BatchCollector(
+            lambda emails: self.check_many(emails, concurrency),
+            max_items=max_items,
+            max_wait_ms=max_wait_ms,
         )
 
     def is_disposable(self, email: str) -> bool:
         """Return True if the email domain is disposable."""
         return self.check(email).is_disposable
+
+
+class AsyncEmailService(_BaseEmailService):
+    """Async service for checking email (disposable domain)."""
+
+    _http_client: Optional[httpx.AsyncClient]
+    _flight_class = AsyncSingleFlight
+    _refresher_class = AsyncBackgroundRefresher
+
+    async def _post(self, path: str, payload: Dict[str, Any], deadline: Optional[int] = None) -> Dict[str, Any]:
+        """POST to the API over the shared async pool and return the decoded body."""
+        self._count("api_calls")
+        resp, _ = await async_request(
+            "POST",
+            f"{self._base_url}{path}",
+            self._api_key,
+            json=payload,
+            timeout_ms=self._timeout_ms,
+            retries=self._retries,
+            retry_delay_ms=self._retry_delay_ms,
+            on_rate_limit=self._on_rate_limit,
+            client=self._http_client,
+            limiter=self._rate_limiter,
+            breaker=self._circuit_breaker,
+            deadline_ms=self._deadline_ms if deadline is None else deadline,
+            retry_budget=self._retry_budget,
+            metrics=self._metrics,
+        )
+        return response_json(resp)
+
+    async def check(self, email: str, deadline: Optional[int] = None) -> EmailCheckResult:
+        """Check if an email uses a disposable domain."""
+        canonical = self._validate(email)
+        key = _cache_key(canonical)
+        local = self._local_answer(key, email)
+        if local is not None:
+            return local
+        cached, stale = self._cache_lookup(key)
+        if cached is not None:
+            if stale:
+                self._revalidate(key, lambda: self._fetch(email, key))
+            return _for_address(cached, email)
+        expires_at = self._expires_at(deadline)
+        outcome = await self._flight.do(key, lambda: self._fetch_shared(email, canonical, key, expires_at), expires_at)
+        if isinstance(outcome, _Rejection) and outcome.canonical != canonical:
+            outcome = await self._fetch_shared(email, canonical, key, expires_at)
+        if isinstance(outcome, _Rejection):
+            raise self._rejected(email, outcome)
+        return _for_address(outcome, email)
+
+    async def _fetch(self, email: str, key: str, deadline: Optional[int] = None) -> EmailCheckResult:
+        data = await self._post("/email/check", {"email": email.strip()}, deadline)
+        result = _build_result(data, email)
+        self._cache_set(key, result)
+        return result
+
+    async def _fetch_shared(
+        self, email: str, canonical: str, key: str, expires_at: Optional[float]
+    ) -> Union[EmailCheckResult, _Rejection]:
+        """Async variant of EmailService._fetch_shared()."""
+        try:
+            return await self._fetch(email, key, self._deadline_left(expires_at))
+        except Sec4DevError as e:
+            if NegativeCache.cacheable(e):
+                return _Rejection(canonical, e)
+            raise
+
+    async def check_many(
+        self,
+        emails: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Dict[str, Union[EmailCheckResult, Exception]]:
+        """Async variant of EmailService.check_many()."""
+        return await async_run_many(self.check, emails, concurrency)
+
+    def batched(
+        self,
+        max_items: int = DEFAULT_MAX_ITEMS,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> "AsyncBatchCollector[EmailCheckResult]":
+        """Async variant of EmailService.batched()."""
+        return AsyncBatchCollector(
+            lambda emails: self.check_many(emails, concurrency),
+            max_items=max_items,
+            max_wait_ms=max_wait_ms,
+        )
+
+    async def is_disposable(self, email: str) -> bool:
+        """Return True if the email domain is disposable."""
+        return (await self.check(email)).is_disposable
@@ -70,3 +70,23 @@ class ServerError(Sec4DevError):
     """500+ - Server errors."""
 
     pass
+
+
+class CircuitOpenError(Sec4DevError):
+    """Request not sent: the client-side circuit breaker is open."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int = 0,
+        response_body: Optional[Any] = None,
+        retry_after: float = 0.0,
+    ) -> None:
+        super().__init__(message, status_code, response_body)
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(Sec4DevError):
+    """The call's overall deadline passed before a response was received."""
+
+    pass
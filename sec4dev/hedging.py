@@ -0,0 +1,198 @@
+"""Hedged requests: send a second copy of a slow request and take the first answer."""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set, TypeVar, Union
+
+T = TypeVar("T")
+
+DEFAULT_PERCENTILE = 95.0
+DEFAULT_MAX_RATIO = 0.05
+DEFAULT_MIN_SAMPLES = 20
+DEFAULT_WINDOW = 1000
+DEFAULT_MIN_DELAY_MS = 1.0
+DEFAULT_MAX_WORKERS = 64
+_RECOMPUTE_EVERY = 32
+
+
+class HedgePolicy:
+    """
+    Hedging for one service.
+
+    A call that has not answered within the ``percentile`` latency of the
+    last ``window`` calls gets a second, identical request on another pooled
+    connection; the first successful answer wins and the other is cancelled.
+    At most ``max_ratio`` of calls are hedged, and nothing is hedged until
+    ``min_samples`` latencies have been observed. The percentile is taken over
+    primary requests only, timed until they finish even when the hedge
+    answered first (a cancelled async primary counts the time it ran).
+
+    A sync call that cannot be hedged (still warming up, or ``max_ratio``
+    reached) runs on the caller's thread. One that may be hedged runs on a
+    small thread pool so the caller can take the hedge's answer; a losing
+    sync request cannot be interrupted and its answer is dropped. Async calls
+    run as tasks and the loser is cancelled.
+    """
+
+    def __init__(
+        self,
+        percentile: float = DEFAULT_PERCENTILE,
+        max_ratio: float = DEFAULT_MAX_RATIO,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        window: int = DEFAULT_WINDOW,
+        min_delay_ms: float = DEFAULT_MIN_DELAY_MS,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= max_ratio <= 1:
+            raise ValueError("max_ratio must be between 0 and 1")
+        self.percentile = percentile
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self.min_delay = min_delay_ms / 1000.0
+        self._max_workers = max_workers
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._delay: Optional[float] = None
+        self._since_recompute = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._calls = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+
+    def record_latency(self, seconds: float) -> None:
+        """Add an observed call latency."""
+        with self._lock:
+            self._samples.append(seconds)
+            self._since_recompute += 1
+            if self._delay is None or self._since_recompute >= _RECOMPUTE_EVERY:
+                self._recompute()
+
+    def _recompute(self) -> None:
+        self._since_recompute = 0
+        if len(self._samples) < max(1, self.min_samples):
+            self._delay = None
+            return
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(math.ceil(self.percentile / 100.0 * len(ordered))) - 1)
+        self._delay = max(self.min_delay, ordered[max(0, index)])
+
+    def delay(self) -> Optional[float]:
+        """Current hedge delay in seconds, or None while still warming up."""
+        with self._lock:
+            return self._delay
+
+    def _start(self) -> Optional[float]:
+        """Count a call; return the hedge delay, or None if it cannot be hedged."""
+        with self._lock:
+            self._calls += 1
+            if self._hedges + 1 > self.max_ratio * self._calls:
+                return None
+            return self._delay
+
+    def _allow_hedge(self) -> bool:
+        with self._lock:
+            if self._hedges + 1 > self.max_ratio * self._calls:
+                return False
+            self._hedges += 1
+            return True
+
+    def _primary_done(self, future: "Union[Future[Any], asyncio.Future[Any]]", started: float) -> None:
+        if future.cancelled() or future.exception() is None:
+            self.record_latency(time.monotonic() - started)
+
+    def _hedge_won(self) -> None:
+        with self._lock:
+            self._hedge_wins += 1
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="sec4dev-hedge"
+                )
+            return self._executor
+
+    def run(self, fn: Callable[[], T]) -> T:
+        """Call fn, hedging it with a second call if it is slow."""
+        delay = self._start()
+        started = time.monotonic()
+        if delay is None:
+            result = fn()
+            self.record_latency(time.monotonic() - started)
+            return result
+        pool = self._pool()
+        primary = pool.submit(fn)
+        primary.add_done_callback(lambda future: self._primary_done(future, started))
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        if not self._allow_hedge():
+            return primary.result()
+        hedge = pool.submit(fn)
+        pending: Set["Future[T]"] = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    if future is hedge:
+                        self._hedge_won()
+                    return future.result()
+        return primary.result()
+
+    async def run_async(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of run(); the losing request is cancelled."""
+        delay = self._start()
+        started = time.monotonic()
+        if delay is None:
+            result = await fn()
+            self.record_latency(time.monotonic() - started)
+            return result
+        primary: "asyncio.Future[T]" = asyncio.ensure_future(fn())
+        primary.add_done_callback(lambda future: self._primary_done(future, started))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._allow_hedge():
+                return await primary
+            hedge: "asyncio.Future[T]" = asyncio.ensure_future(fn())
+            tasks.append(hedge)
+            pending: Set["asyncio.Future[T]"] = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._hedge_won()
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters: calls, hedges sent, hedge_wins, and the current delay_ms."""
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "hedges": self._hedges,
+                "hedge_wins": self._hedge_wins,
+                "delay_ms": None if self._delay is None else self._delay * 1000.0,
+            }
+
+    def close(self) -> None:
+        """Shut down the sync worker pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -1,13 +1,18 @@
 """HTTP client with retry, rate limit handling, and exception mapping."""
 
+import asyncio
+import json as json_lib
 import random
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import httpx
 
+from sec4dev.breaker import CircuitBreaker
+from sec4dev.budget import RetryBudget
 from sec4dev.exceptions import (
     AuthenticationError,
+    DeadlineExceededError,
     ForbiddenError,
     NotFoundError,
     PaymentRequiredError,
@@ -16,11 +21,139 @@ from sec4dev.exceptions import (
     ServerError,
     ValidationError,
 )
+from sec4dev.metrics import MetricsRegistry
+from sec4dev.ratelimit import RateLimiter
 
 DEFAULT_BASE_URL = "https://api.sec4.dev/api/v1"
 SDK_VERSION = "1.0.0"
 CONNECT_TIMEOUT = 10.0
 READ_TIMEOUT = 30.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+
+def _build_timeout(timeout_ms: int) -> httpx.Timeout:
+    """Build the httpx timeout used for every attempt."""
+    read = READ_TIMEOUT if timeout_ms >= 1000 else timeout_ms / 1000.0
+    return httpx.Timeout(
+        connect=CONNECT_TIMEOUT,
+        read=read,
+        write=read,
+        pool=CONNECT_TIMEOUT,
+    )
+
+
+def create_http_client(
+    timeout_ms: int = 30000,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+) -> httpx.Client:
+    """
+    Create a pooled, thread-safe httpx.Client.
+    Connections are kept alive and reused across requests and retries.
+    """
+    return httpx.Client(
+        timeout=_build_timeout(timeout_ms),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
+
+
+def create_async_http_client(
+    timeout_ms: int = 30000,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+) -> httpx.AsyncClient:
+    """Create a pooled httpx.AsyncClient (see create_http_client)."""
+    return httpx.AsyncClient(
+        timeout=_build_timeout(timeout_ms),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
+
+
+def _load_json_backends() -> Dict[str, Callable[[bytes], Any]]:
+    """Available JSON decoders, fastest first; stdlib json is always present."""
+    backends: Dict[str, Callable[[bytes], Any]] = {}
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        backends["orjson"] = orjson.loads
+    try:
+        import msgspec
+    except ImportError:
+        pass
+    else:
+        backends["msgspec"] = msgspec.json.Decoder().decode
+    backends["json"] = json_lib.loads
+    return backends
+
+
+_JSON_BACKENDS = _load_json_backends()
+_json_backend = next(iter(_JSON_BACKENDS))
+_json_loads = _JSON_BACKENDS[_json_backend]
+
+
+def available_json_backends() -> List[str]:
+    """Names of the installed JSON decoders, in order of preference."""
+    return list(_JSON_BACKENDS)
+
+
+def json_backend() -> str:
+    """Name of the JSON decoder used for response bodies."""
+    return _json_backend
+
+
+def set_json_backend(name: Optional[str] = None) -> str:
+    """
+    Select the decoder for response bodies: "orjson", "msgspec" or "json".
+    None picks the fastest installed one. Returns the selected name.
+    """
+    global _json_backend, _json_loads
+    if name is None:
+        name = next(iter(_JSON_BACKENDS))
+    if name not in _JSON_BACKENDS:
+        raise ValueError(f"JSON backend {name!r} is not installed (available: {', '.join(_JSON_BACKENDS)})")
+    _json_backend = name
+    _json_loads = _JSON_BACKENDS[name]
+    return name
+
+
+def decode_json(content: bytes) -> Any:
+    """Decode a UTF-8 JSON response body with the selected backend."""
+    return _json_loads(content)
+
+
+def response_json(response: httpx.Response) -> Any:
+    """
+    Decode a response body with decode_json(). Responses whose ``content`` is
+    not bytes (e.g. test doubles that only stub json()) fall back to json().
+    """
+    content = response.content
+    if isinstance(content, (bytes, bytearray)):
+        return decode_json(content)
+    return response.json()
+
+
+def _request_headers(api_key: str) -> Dict[str, str]:
+    """Headers sent with every API request."""
+    return {
+        "X-API-Key": api_key,
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        "User-Agent": f"sec4dev-python/{SDK_VERSION}",
+    }
 
 
 def _parse_rate_limit_headers(headers: httpx.Headers) -> Dict[str, int]:
@@ -98,6 +231,134 @@ def _is_retryable(status_code: Optional[int], error: Optional[Exception]) -> boo
     return False
 
 
+def _response_body(response: httpx.Response) -> Any:
+    """Decoded JSON body, or raw text if the body is not JSON."""
+    try:
+        return response.json()
+    except Exception:
+        return response.text
+
+
+def _retry_after_seconds(response: httpx.Response) -> int:
+    """Seconds to wait after a 429 (Retry-After header, default 60)."""
+    ra = response.headers.get("retry-after")
+    if ra is None:
+        return 60
+    try:
+        return int(ra)
+    except (ValueError, TypeError):
+        return 60
+
+
+def _backoff_seconds(retry_delay_ms: int, attempt: int) -> float:
+    """Exponential backoff with jitter for the given attempt."""
+    delay_ms = retry_delay_ms * (2 ** attempt) + random.randint(0, 100)
+    return delay_ms / 1000.0
+
+
+def _retry_delay_for_error(
+    error: Exception,
+    attempt: int,
+    retries: int,
+    retry_delay_ms: int,
+    allow: Optional[Callable[[float], bool]] = None,
+) -> float:
+    """
+    Delay before retrying a transport error; re-raises if out of retries or
+    if ``allow`` (deadline / retry budget) refuses the delay.
+    """
+    if attempt < retries and _is_retryable(None, error):
+        delay = _backoff_seconds(retry_delay_ms, attempt)
+        if allow is None or allow(delay):
+            return delay
+    raise error
+
+
+def _retry_delay_for_response(
+    response: httpx.Response,
+    attempt: int,
+    retries: int,
+    retry_delay_ms: int,
+    allow: Optional[Callable[[float], bool]] = None,
+) -> Optional[float]:
+    """
+    Decide what to do with a response.
+    Returns None on success, a delay in seconds to retry, or raises the mapped
+    error (also when ``allow`` refuses the delay).
+    """
+    if response.status_code == 429:
+        if attempt < retries:
+            delay = float(_retry_after_seconds(response))
+            if allow is None or allow(delay):
+                return delay
+        body = _response_body(response)
+        raise _error_from_response(429, body or {"detail": "Rate limit exceeded"}, response.headers)
+
+    if response.status_code >= 400:
+        body = _response_body(response)
+        err = _error_from_response(response.status_code, body or {}, response.headers)
+        if attempt < retries and _is_retryable(response.status_code, None):
+            delay = _backoff_seconds(retry_delay_ms, attempt)
+            if allow is None or allow(delay):
+                return delay
+        raise err
+
+    return None
+
+
+def _expiry(deadline_ms: Optional[int]) -> Optional[float]:
+    """Monotonic time at which a call with this deadline must give up."""
+    return None if deadline_ms is None else time.monotonic() + deadline_ms / 1000.0
+
+
+def _remaining(expires_at: Optional[float]) -> Optional[float]:
+    """Seconds left before expires_at; raises DeadlineExceededError if none."""
+    if expires_at is None:
+        return None
+    remaining = expires_at - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceededError("Deadline exceeded before the request completed")
+    return remaining
+
+
+def _attempt_timeout(timeout: httpx.Timeout, remaining: Optional[float]) -> httpx.Timeout:
+    """Shrink each phase of an attempt's timeout to the time left."""
+    if remaining is None:
+        return timeout
+    return httpx.Timeout(
+        connect=min(timeout.connect or remaining, remaining),
+        read=min(timeout.read or remaining, remaining),
+        write=min(timeout.write or remaining, remaining),
+        pool=min(timeout.pool or remaining, remaining),
+    )
+
+
+def _retry_allowance(
+    expires_at: Optional[float],
+    retry_budget: Optional[RetryBudget],
+) -> Optional[Callable[[float], bool]]:
+    """
+    Build the check applied before every retry: the backoff must end before
+    the deadline, and the client-wide retry budget must have room.
+    """
+    if expires_at is None and retry_budget is None:
+        return None
+
+    def allow(delay: float) -> bool:
+        if expires_at is not None and time.monotonic() + delay >= expires_at:
+            return False
+        return retry_budget is None or retry_budget.try_retry()
+
+    return allow
+
+
+def _sync_limiter(limiter: RateLimiter, response: httpx.Response, info: Dict[str, int]) -> None:
+    """Feed a response's rate limit state into the limiter."""
+    limiter.update(info)
+    if response.status_code == 429:
+        limiter.block(_retry_after_seconds(response))
+
+
 def request(
     method: str,
     url: str,
@@ -107,95 +368,199 @@ def request(
     retries: int = 3,
     retry_delay_ms: int = 1000,
     on_rate_limit: Optional[Any] = None,
-) -> tuple[httpx.Response, Dict[str, int]]:
+    client: Optional[httpx.Client] = None,
+    limiter: Optional[RateLimiter] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    deadline_ms: Optional[int] = None,
+    retry_budget: Optional[RetryBudget] = None,
+    metrics: Optional[MetricsRegistry] = None,
+) -> Tuple[httpx.Response, Dict[str, int]]:
     """
     Perform HTTP request with retries and rate limit handling.
     Returns (response, rate_limit_info).
+
+    If ``client`` is given, its connection pool is reused for every attempt;
+    otherwise a temporary client is opened for this call and closed afterwards.
+    If ``limiter`` is given, every attempt first takes a token from it and every
+    response re-syncs it from the rate limit headers. If ``breaker`` is given,
+    every attempt must be admitted by it (CircuitOpenError otherwise) and
+    reports its outcome to it.
+
+    ``deadline_ms`` bounds the whole call: every attempt's timeouts are cut to
+    the time left, a retry whose backoff would end past the deadline is not
+    made (the last error is raised instead), and DeadlineExceededError is
+    raised if the deadline passes between attempts. ``retry_budget`` caps
+    retries client-wide; when it is spent the last error is raised.
+    If ``metrics`` is given, the request, each attempt's latency and status,
+    and each retry's backoff are recorded in it.
     """
-    timeout = httpx.Timeout(
-        connect=CONNECT_TIMEOUT,
-        read=READ_TIMEOUT if timeout_ms >= 1000 else timeout_ms / 1000.0,
-    )
-    rate_limit_info: Dict[str, int] = {"limit": 0, "remaining": 0, "reset_seconds": 0}
-    last_error: Optional[Exception] = None
-    last_status: Optional[int] = None
-    last_response: Optional[httpx.Response] = None
+    if client is None:
+        with create_http_client(timeout_ms) as temp_client:
+            return request(
+                method,
+                url,
+                api_key,
+                json=json,
+                timeout_ms=timeout_ms,
+                retries=retries,
+                retry_delay_ms=retry_delay_ms,
+                on_rate_limit=on_rate_limit,
+                client=temp_client,
+                limiter=limiter,
+                breaker=breaker,
+                deadline_ms=deadline_ms,
+                retry_budget=retry_budget,
+                metrics=metrics,
+            )
 
-    for attempt in range(retries + 1):
-        try:
-            with httpx.Client(timeout=timeout) as client:
+    expires_at = _expiry(deadline_ms)
+    timeout = _build_timeout(timeout_ms)
+    headers = _request_headers(api_key)
+    allow = _retry_allowance(expires_at, retry_budget)
+    if retry_budget is not None:
+        retry_budget.record_request()
+
+    counters = metrics.start(url) if metrics is not None else None
+    try:
+        for attempt in range(retries + 1):
+            remaining = _remaining(expires_at)
+            # Wait for the limiter first: a half-open breaker hands out a probe
+            # slot that only record() gives back.
+            if limiter is not None:
+                limiter.acquire(max_wait=remaining)
+                remaining = _remaining(expires_at)
+            if breaker is not None:
+                breaker.before_call()
+            started = time.perf_counter()
+            try:
                 response = client.request(
-                    method,
-                    url,
-                    json=json,
-                    headers={
-                        "X-API-Key": api_key,
-                        "Content-Type": "application/json",
-                        "Accept": "application/json",
-                        "User-Agent": f"sec4dev-python/{SDK_VERSION}",
-                    },
+                    method, url, json=json, headers=headers, timeout=_attempt_timeout(timeout, remaining)
                 )
-        except Exception as e:
-            last_error = e
-            last_status = None
-            last_response = None
-            if attempt < retries and _is_retryable(None, e):
-                delay_ms = retry_delay_ms * (2 ** attempt) + random.randint(0, 100)
-                time.sleep(delay_ms / 1000.0)
+            except Exception as e:
+                if breaker is not None:
+                    breaker.record(False)
+                if counters is not None:
+                    counters.attempt(time.perf_counter() - started, error=e)
+                delay = _retry_delay_for_error(e, attempt, retries, retry_delay_ms, allow)
+                if counters is not None:
+                    counters.retrying(delay)
+                time.sleep(delay)
                 continue
-            raise
+            if counters is not None:
+                counters.attempt(time.perf_counter() - started, response.status_code)
+            if breaker is not None:
+                breaker.record(response.status_code < 500)
 
-        rate_limit_info = _parse_rate_limit_headers(response.headers)
-        if on_rate_limit and callable(on_rate_limit):
-            on_rate_limit(rate_limit_info)
+            rate_limit_info = _parse_rate_limit_headers(response.headers)
+            if on_rate_limit and callable(on_rate_limit):
+                on_rate_limit(rate_limit_info)
+            if limiter is not None:
+                _sync_limiter(limiter, response, rate_limit_info)
 
-        if response.status_code == 429:
-            retry_after = 0
-            ra = response.headers.get("retry-after")
-            if ra is not None:
-                try:
-                    retry_after = int(ra)
-                except (ValueError, TypeError):
-                    retry_after = 60
-            else:
-                retry_after = 60
-            if attempt < retries:
-                time.sleep(retry_after)
-                continue
-            body: Any = None
-            try:
-                body = response.json()
-            except Exception:
-                body = response.text
-            raise _error_from_response(429, body or {"detail": "Rate limit exceeded"}, response.headers)
-
-        if response.status_code >= 400:
-            last_status = response.status_code
-            last_response = response
-            body = None
+            delay = _retry_delay_for_response(response, attempt, retries, retry_delay_ms, allow)
+            if delay is None:
+                return response, rate_limit_info
+            if counters is not None:
+                counters.retrying(delay)
+            time.sleep(delay)
+    finally:
+        if counters is not None:
+            counters.finished()
+
+    raise Sec4DevError("Request failed after retries", status_code=0)
+
+
+async def async_request(
+    method: str,
+    url: str,
+    api_key: str,
+    json: Optional[Dict[str, Any]] = None,
+    timeout_ms: int = 30000,
+    retries: int = 3,
+    retry_delay_ms: int = 1000,
+    on_rate_limit: Optional[Any] = None,
+    client: Optional[httpx.AsyncClient] = None,
+    limiter: Optional[RateLimiter] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    deadline_ms: Optional[int] = None,
+    retry_budget: Optional[RetryBudget] = None,
+    metrics: Optional[MetricsRegistry] = None,
+) -> Tuple[httpx.Response, Dict[str, int]]:
+    """
+    Async variant of request(). Backs off with asyncio.sleep, so cancelling
+    the awaiting task aborts the in-flight attempt or the pending retry.
+    """
+    if client is None:
+        async with create_async_http_client(timeout_ms) as temp_client:
+            return await async_request(
+                method,
+                url,
+                api_key,
+                json=json,
+                timeout_ms=timeout_ms,
+                retries=retries,
+                retry_delay_ms=retry_delay_ms,
+                on_rate_limit=on_rate_limit,
+                client=temp_client,
+                limiter=limiter,
+                breaker=breaker,
+                deadline_ms=deadline_ms,
+                retry_budget=retry_budget,
+                metrics=metrics,
+            )
+
+    expires_at = _expiry(deadline_ms)
+    timeout = _build_timeout(timeout_ms)
+    headers = _request_headers(api_key)
+    allow = _retry_allowance(expires_at, retry_budget)
+    if retry_budget is not None:
+        retry_budget.record_request()
+
+    counters = metrics.start(url) if metrics is not None else None
+    try:
+        for attempt in range(retries + 1):
+            remaining = _remaining(expires_at)
+            # Wait for the limiter first: a half-open breaker hands out a probe
+            # slot that only record() gives back.
+            if limiter is not None:
+                await limiter.acquire_async(max_wait=remaining)
+                remaining = _remaining(expires_at)
+            if breaker is not None:
+                breaker.before_call()
+            started = time.perf_counter()
             try:
-                body = response.json()
-            except Exception:
-                body = response.text
-            err = _error_from_response(response.status_code, body or {}, response.headers)
-            if not _is_retryable(response.status_code, None):
-                raise err
-            last_error = err
-            if attempt < retries:
-                delay_ms = retry_delay_ms * (2 ** attempt) + random.randint(0, 100)
-                time.sleep(delay_ms / 1000.0)
+                response = await client.request(
+                    method, url, json=json, headers=headers, timeout=_attempt_timeout(timeout, remaining)
+                )
+            except Exception as e:
+                if breaker is not None:
+                    breaker.record(False)
+                if counters is not None:
+                    counters.attempt(time.perf_counter() - started, error=e)
+                delay = _retry_delay_for_error(e, attempt, retries, retry_delay_ms, allow)
+                if counters is not None:
+                    counters.retrying(delay)
+                await asyncio.sleep(delay)
                 continue
-            raise err
+            if counters is not None:
+                counters.attempt(time.perf_counter() - started, response.status_code)
+            if breaker is not None:
+                breaker.record(response.status_code < 500)
 
-        return response, rate_limit_info
+            rate_limit_info = _parse_rate_limit_headers(response.headers)
+            if on_rate_limit and callable(on_rate_limit):
+                on_rate_limit(rate_limit_info)
+            if limiter is not None:
+                _sync_limiter(limiter, response, rate_limit_info)
+
+            delay = _retry_delay_for_response(response, attempt, retries, retry_delay_ms, allow)
+            if delay is None:
+                return response, rate_limit_info
+            if counters is not None:
+                counters.retrying(delay)
+            await asyncio.sleep(delay)
+    finally:
+        if counters is not None:
+            counters.finished()
 
-    if last_response is not None and last_status is not None:
-        body = None
-        try:
-            body = last_response.json()
-        except Exception:
-            body = last_response.text
-        raise _error_from_response(last_status, body or {}, last_response.headers)
-    if last_error is not None:
-        raise last_error
     raise Sec4DevError("Request failed after retries", status_code=0)
@@ -1,19 +1,57 @@
 """IP check service."""
 
-from typing import Callable, Optional
-
-from sec4dev.http import request
-from sec4dev.models.ip import (
-    IPCheckResult,
-    IPGeo,
-    IPNetwork,
-    IPSignals,
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+import httpx
+
+from sec4dev.batching import (
+    DEFAULT_MAX_ITEMS,
+    DEFAULT_MAX_WAIT_MS,
+    AsyncBatchCollector,
+    BatchCollector,
 )
+from sec4dev.budget import RetryBudget
+from sec4dev.bulk import DEFAULT_CONCURRENCY, async_run_many, chunked, run_many
+from sec4dev.breaker import CircuitBreaker
+from sec4dev.cache import CacheBackend
+from sec4dev.columnar import IPResultColumns
+from sec4dev.exceptions import Sec4DevError
+from sec4dev.hedging import HedgePolicy
+from sec4dev.http import async_request, request, response_json
+from sec4dev.metrics import MetricsRegistry
+from sec4dev.models.ip import IPCheckResult
+from sec4dev.negative import NegativeCache
+from sec4dev.prefix import IPPrefixCache
+from sec4dev.ranges import IPRangeDatabase
+from sec4dev.ratelimit import RateLimiter
+from sec4dev.refresh import AsyncBackgroundRefresher
+from sec4dev.service import BaseService
+from sec4dev.singleflight import AsyncSingleFlight
 from sec4dev.validation import validate_ip
 
 
-class IPService:
-    """Service for classifying IP addresses."""
+# check_many_columns() checks inputs this many times ``concurrency`` at a time.
+COLUMN_CHUNK_FACTOR = 16
+
+
+def _build_result(data: Dict[str, Any], ip: str) -> IPCheckResult:
+    """
+    Build an IPCheckResult from an /ip/check response body.
+    The nested models are validated in one model_validate() call, which is
+    much cheaper than constructing each sub-model separately.
+    """
+    return IPCheckResult.model_validate({
+        "ip": data.get("ip", ip),
+        "classification": data.get("classification", "unknown"),
+        "confidence": data.get("confidence", 0.0),
+        "signals": data.get("signals") or {},
+        "network": data.get("network") or {},
+        "geo": data.get("geo") or {},
+    })
+
+
+class _BaseIPService(BaseService):
+    """Configuration shared by the sync and async IP services."""
 
     def __init__(
         self,
@@ -23,53 +61,197 @@ class IPService:
         retries: int = 3,
         retry_delay_ms: int = 1000,
         on_rate_limit: Optional[Callable[[dict], None]] = None,
+        http_client: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        deadline_ms: Optional[int] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        cache: Optional[CacheBackend] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        prefix_cache: Optional[IPPrefixCache] = None,
+        range_db: Optional[IPRangeDatabase] = None,
+        hedge: Optional[HedgePolicy] = None,
     ) -> None:
-        self._base_url = base_url.rstrip("/")
-        self._api_key = api_key
-        self._timeout_ms = timeout_ms
-        self._retries = retries
-        self._retry_delay_ms = retry_delay_ms
-        self._on_rate_limit = on_rate_limit
-
-    def check(self, ip: str) -> IPCheckResult:
-        """Classify an IP address."""
-        validate_ip(ip)
-        url = f"{self._base_url}/ip/check"
+        super().__init__(
+            base_url,
+            api_key,
+            timeout_ms=timeout_ms,
+            retries=retries,
+            retry_delay_ms=retry_delay_ms,
+            on_rate_limit=on_rate_limit,
+            http_client=http_client,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            retry_budget=retry_budget,
+            deadline_ms=deadline_ms,
+            metrics=metrics,
+            cache=cache,
+            negative_cache=negative_cache,
+        )
+        self._prefix_cache = prefix_cache
+        self._range_db = range_db
+        self._hedge = hedge
+
+    @property
+    def prefix_cache(self) -> Optional[IPPrefixCache]:
+        """Network-prefix result cache, if enabled."""
+        return self._prefix_cache
+
+    @property
+    def range_db(self) -> Optional[IPRangeDatabase]:
+        """Local IP range database, if enabled."""
+        return self._range_db
+
+    @property
+    def hedge(self) -> Optional[HedgePolicy]:
+        """Request hedging policy, if enabled."""
+        return self._hedge
+
+    def close(self) -> None:
+        """Stop background refreshes and hedging workers."""
+        super().close()
+        if self._hedge is not None:
+            self._hedge.close()
+
+    def _local_answer(self, key: str) -> Optional[IPCheckResult]:
+        """Answer from the local range database for canonical addresses it covers."""
+        if self._range_db is None:
+            return None
+        result = self._range_db.result_for(key)
+        if result is not None:
+            self._count("local_answers")
+        return result
+
+    def _cache_lookup(self, key: str) -> Tuple[Optional[IPCheckResult], bool]:
+        cached, stale = super()._cache_lookup(key)
+        if cached is None and self._prefix_cache is not None:
+            return self._prefix_cache.get(key), False
+        return cached, stale
+
+    def _cache_set(self, key: str, result: IPCheckResult) -> None:
+        super()._cache_set(key, result)
+        if self._prefix_cache is not None:
+            self._prefix_cache.set(key, result)
+
+
+class IPService(_BaseIPService):
+    """Service for classifying IP addresses."""
+
+    _http_client: Optional[httpx.Client]
+
+    def _post(self, path: str, payload: Dict[str, Any], deadline: Optional[int] = None) -> Dict[str, Any]:
+        """
+        POST to the API over the shared pool and return the decoded body,
+        hedging slow requests if enabled.
+        """
+        if self._hedge is None:
+            resp = self._send(path, payload, deadline)
+        else:
+            # The hedge starts later, so it gets what is left of the deadline.
+            expires_at = self._expires_at(deadline)
+            resp = self._hedge.run(
+                lambda: self._send(path, payload, self._deadline_left(expires_at))
+            )
+        return response_json(resp)
+
+    def _send(self, path: str, payload: Dict[str, Any], deadline: Optional[int]) -> httpx.Response:
+        self._count("api_calls")
         resp, _ = request(
             "POST",
-            url,
+            f"{self._base_url}{path}",
             self._api_key,
-            json={"ip": ip.strip()},
+            json=payload,
             timeout_ms=self._timeout_ms,
             retries=self._retries,
             retry_delay_ms=self._retry_delay_ms,
             on_rate_limit=self._on_rate_limit,
+            client=self._http_client,
+            limiter=self._rate_limiter,
+            breaker=self._circuit_breaker,
+            deadline_ms=self._deadline_ms if deadline is None else deadline,
+            retry_budget=self._retry_budget,
+            metrics=self._metrics,
         )
-        data = resp.json()
-        signals = data.get("signals") or {}
-        network = data.get("network") or {}
-        geo = data.get("geo") or {}
-        return IPCheckResult(
-            ip=data.get("ip", ip),
-            classification=data.get("classification", "unknown"),
-            confidence=float(data.get("confidence", 0.0)),
-            signals=IPSignals(
-                is_hosting=signals.get("is_hosting", False),
-                is_residential=signals.get("is_residential", False),
-                is_mobile=signals.get("is_mobile", False),
-                is_vpn=signals.get("is_vpn", False),
-                is_tor=signals.get("is_tor", False),
-                is_proxy=signals.get("is_proxy", False),
-            ),
-            network=IPNetwork(
-                asn=network.get("asn"),
-                org=network.get("org"),
-                provider=network.get("provider"),
-            ),
-            geo=IPGeo(
-                country=geo.get("country"),
-                region=geo.get("region"),
-            ),
+        return resp
+
+    def check(self, ip: str, deadline: Optional[int] = None) -> IPCheckResult:
+        """
+        Classify an IP address.
+        ``deadline`` (ms) bounds the whole call, retries included, and
+        overrides the client's ``deadline`` for this call.
+        """
+        self._raise_if_known_bad(ip)
+        try:
+            return self._check(ip, deadline)
+        except Sec4DevError as e:
+            self._remember_failure(ip, e)
+            raise
+
+    def _check(self, ip: str, deadline: Optional[int]) -> IPCheckResult:
+        key = validate_ip(ip)
+        local = self._local_answer(key)
+        if local is not None:
+            return local
+        cached, stale = self._cache_lookup(key)
+        if cached is not None:
+            if stale:
+                self._revalidate(key, lambda: self._fetch(ip, key))
+            return cached
+        expires_at = self._expires_at(deadline)
+        return self._flight.do(key, lambda: self._fetch(ip, key, self._deadline_left(expires_at)), expires_at)
+
+    def _fetch(self, ip: str, key: str, deadline: Optional[int] = None) -> IPCheckResult:
+        data = self._post("/ip/check", {"ip": ip.strip()}, deadline)
+        result = _build_result(data, ip)
+        self._cache_set(key, result)
+        return result
+
+    def check_many(
+        self,
+        ips: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Dict[str, Union[IPCheckResult, Exception]]:
+        """
+        Check many IPs in parallel over the shared pool.
+        Duplicates are checked once. Returns a dict keyed by input, in input
+        order, holding each result or the exception raised for that input.
+        """
+        return run_many(self.check, ips, concurrency)
+
+    def check_many_columns(
+        self,
+        ips: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> IPResultColumns:
+        """
+        Check many IPs like check_many(), but return an IPResultColumns with
+        one row per input (duplicates included), in input order. Inputs are
+        consumed in chunks, so only a chunk of results is held as objects.
+        """
+        columns = IPResultColumns()
+        for chunk in chunked(ips, concurrency * COLUMN_CHUNK_FACTOR):
+            outcomes = self.check_many(chunk, concurrency)
+            for ip in chunk:
+                columns.append(ip, outcomes[ip])
+        return columns
+
+    def batched(
+        self,
+        max_items: int = DEFAULT_MAX_ITEMS,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> "BatchCollector[IPCheckResult]":
+        """
+        Return a batching front end for this service.
+        Individual check()/submit() calls from any thread are buffered for up
+        to max_wait_ms or max_items and dispatched together via check_many().
+        Close it (or use it as a context manager) when done.
+        """
+        return BatchCollector(
+            lambda ips: self.check_many(ips, concurrency),
+            max_items=max_items,
+            max_wait_ms=max_wait_ms,
         )
 
     def is_hosting(self, ip: str) -> bool:
@@ -91,3 +273,128 @@ class IPService:
     def is_mobile(self, ip: str) -> bool:
         """Return True if the IP is classified as mobile."""
         return self.check(ip).signals.is_mobile
+
+
+class AsyncIPService(_BaseIPService):
+    """Async service for classifying IP addresses."""
+
+    _http_client: Optional[httpx.AsyncClient]
+    _flight_class = AsyncSingleFlight
+    _refresher_class = AsyncBackgroundRefresher
+
+    async def _post(self, path: str, payload: Dict[str, Any], deadline: Optional[int] = None) -> Dict[str, Any]:
+        """
+        POST to the API over the shared async pool and return the decoded body,
+        hedging slow requests if enabled.
+        """
+        if self._hedge is None:
+            resp = await self._send(path, payload, deadline)
+        else:
+            # The hedge starts later, so it gets what is left of the deadline.
+            expires_at = self._expires_at(deadline)
+            resp = await self._hedge.run_async(
+                lambda: self._send(path, payload, self._deadline_left(expires_at))
+            )
+        return response_json(resp)
+
+    async def _send(self, path: str, payload: Dict[str, Any], deadline: Optional[int]) -> httpx.Response:
+        self._count("api_calls")
+        resp, _ = await async_request(
+            "POST",
+            f"{self._base_url}{path}",
+            self._api_key,
+            json=payload,
+            timeout_ms=self._timeout_ms,
+            retries=self._retries,
+            retry_delay_ms=self._retry_delay_ms,
+            on_rate_limit=self._on_rate_limit,
+            client=self._http_client,
+            limiter=self._rate_limiter,
+            breaker=self._circuit_breaker,
+            deadline_ms=self._deadline_ms if deadline is None else deadline,
+            retry_budget=self._retry_budget,
+            metrics=self._metrics,
+        )
+        return resp
+
+    async def check(self, ip: str, deadline: Optional[int] = None) -> IPCheckResult:
+        """Classify an IP address."""
+        self._raise_if_known_bad(ip)
+        try:
+            return await self._check(ip, deadline)
+        except Sec4DevError as e:
+            self._remember_failure(ip, e)
+            raise
+
+    async def _check(self, ip: str, deadline: Optional[int]) -> IPCheckResult:
+        key = validate_ip(ip)
+        local = self._local_answer(key)
+        if local is not None:
+            return local
+        cached, stale = self._cache_lookup(key)
+        if cached is not None:
+            if stale:
+                self._revalidate(key, lambda: self._fetch(ip, key))
+            return cached
+        expires_at = self._expires_at(deadline)
+        return await self._flight.do(key, lambda: self._fetch(ip, key, self._deadline_left(expires_at)), expires_at)
+
+    async def _fetch(self, ip: str, key: str, deadline: Optional[int] = None) -> IPCheckResult:
+        data = await self._post("/ip/check", {"ip": ip.strip()}, deadline)
+        result = _build_result(data, ip)
+        self._cache_set(key, result)
+        return result
+
+    async def check_many(
+        self,
+        ips: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Dict[str, Union[IPCheckResult, Exception]]:
+        """Async variant of IPService.check_many()."""
+        return await async_run_many(self.check, ips, concurrency)
+
+    async def check_many_columns(
+        self,
+        ips: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> IPResultColumns:
+        """Async variant of IPService.check_many_columns()."""
+        columns = IPResultColumns()
+        for chunk in chunked(ips, concurrency * COLUMN_CHUNK_FACTOR):
+            outcomes = await self.check_many(chunk, concurrency)
+            for ip in chunk:
+                columns.append(ip, outcomes[ip])
+        return columns
+
+    def batched(
+        self,
+        max_items: int = DEFAULT_MAX_ITEMS,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> "AsyncBatchCollector[IPCheckResult]":
+        """Async variant of IPService.batched()."""
+        return AsyncBatchCollector(
+            lambda ips: self.check_many(ips, concurrency),
+            max_items=max_items,
+            max_wait_ms=max_wait_ms,
+        )
+
+    async def is_hosting(self, ip: str) -> bool:
+        """Return True if the IP is classified as hosting."""
+        return (await self.check(ip)).signals.is_hosting
+
+    async def is_vpn(self, ip: str) -> bool:
+        """Return True if the IP is classified as VPN."""
+        return (await self.check(ip)).signals.is_vpn
+
+    async def is_tor(self, ip: str) -> bool:
+        """Return True if the IP is classified as TOR."""
+        return (await self.check(ip)).signals.is_tor
+
+    async def is_residential(self, ip: str) -> bool:
+        """Return True if the IP is classified as residential."""
+        return (await self.check(ip)).signals.is_residential
+
+    async def is_mobile(self, ip: str) -> bool:
+        """Return True if the IP is classified as mobile."""
+        return (await self.check(ip)).signals.is_mobile
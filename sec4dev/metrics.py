@@ -0,0 +1,302 @@
+"""
+In-process request metrics with a snapshot API and a Prometheus text exporter.
+
+A MetricsRegistry passed to the client records, per API endpoint: requests,
+in-flight requests, attempts, retries, time slept in retry backoff, responses
+by status code, transport errors by type, and a fixed-bucket histogram of
+attempt latency. Recording takes no lock: each thread updates its own
+counters, which are summed when a snapshot is taken, and a thread's counters
+are folded into a shared total when the thread exits. Nothing leaves the
+process unless you export it.
+"""
+
+import math
+import threading
+import weakref
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+# Upper bounds in seconds of the latency histogram buckets (+Inf is implied).
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class EndpointCounters:
+    """
+    One thread's counters for one endpoint, returned by MetricsRegistry.start().
+    Only the owning thread writes them, so recording needs no lock.
+    """
+
+    __slots__ = (
+        "_bounds",
+        "requests",
+        "in_flight",
+        "attempts",
+        "retries",
+        "sleep_seconds",
+        "statuses",
+        "errors",
+        "bucket_counts",
+        "latency_sum",
+    )
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self._bounds = bounds
+        self.requests = 0
+        self.in_flight = 0
+        self.attempts = 0
+        self.retries = 0
+        self.sleep_seconds = 0.0
+        self.statuses: Dict[int, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.bucket_counts = [0] * (len(bounds) + 1)
+        self.latency_sum = 0.0
+
+    def attempt(self, seconds: float, status: Optional[int] = None, error: Optional[BaseException] = None) -> None:
+        """One attempt took ``seconds`` and got ``status``, or failed with a transport ``error``."""
+        self.attempts += 1
+        self.bucket_counts[bisect_left(self._bounds, seconds)] += 1
+        self.latency_sum += seconds
+        if status is not None:
+            statuses = self.statuses
+            statuses[status] = statuses.get(status, 0) + 1
+        if error is not None:
+            name = type(error).__name__
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def retrying(self, sleep_seconds: float) -> None:
+        """A retry will be made after sleeping ``sleep_seconds``."""
+        self.retries += 1
+        self.sleep_seconds += sleep_seconds
+
+    def finished(self) -> None:
+        """The request started by MetricsRegistry.start() has returned or raised."""
+        self.in_flight -= 1
+
+    def merge(self, other: "EndpointCounters") -> None:
+        """Add another thread's counts to these."""
+        for key in ("requests", "in_flight", "attempts", "retries", "sleep_seconds", "latency_sum"):
+            setattr(self, key, getattr(self, key) + getattr(other, key))
+        for key in ("statuses", "errors"):
+            into = getattr(self, key)
+            for label, count in list(getattr(other, key).items()):
+                into[label] = into.get(label, 0) + count
+        self.bucket_counts = [a + b for a, b in zip(self.bucket_counts, other.bucket_counts)]
+
+
+class _ThreadToken:
+    """Lives in a thread's local storage; its finalizer runs when the thread exits."""
+
+    __slots__ = ("__weakref__",)
+
+
+class _Endpoint:
+    """
+    Per-thread EndpointCounters of one endpoint URL, summed on snapshot.
+    When a thread exits, its counters are merged into ``_retired`` and
+    dropped, so short-lived worker threads do not accumulate.
+    """
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self._bounds = bounds
+        self._local = threading.local()
+        self._shards: List[EndpointCounters] = []
+        self._retired = EndpointCounters(bounds)
+        self._lock = threading.Lock()
+
+    def counters(self) -> EndpointCounters:
+        try:
+            return self._local.counters
+        except AttributeError:
+            counters = self._local.counters = EndpointCounters(self._bounds)
+            token = self._local.token = _ThreadToken()
+            weakref.finalize(token, self._retire, counters)
+            with self._lock:
+                self._shards.append(counters)
+            return counters
+
+    def _retire(self, counters: EndpointCounters) -> None:
+        with self._lock:
+            self._retired.merge(counters)
+            self._shards.remove(counters)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            retired = EndpointCounters(self._bounds)
+            retired.merge(self._retired)
+            shards = [retired, *self._shards]
+        totals: Dict[str, Any] = {
+            "requests": 0,
+            "in_flight": 0,
+            "attempts": 0,
+            "retries": 0,
+            "sleep_seconds": 0.0,
+            "statuses": {},
+            "errors": {},
+        }
+        bucket_counts = [0] * (len(self._bounds) + 1)
+        latency_sum = 0.0
+        for shard in shards:
+            for key in ("requests", "in_flight", "attempts", "retries", "sleep_seconds"):
+                totals[key] += getattr(shard, key)
+            for key in ("statuses", "errors"):
+                for label, count in list(getattr(shard, key).items()):
+                    totals[key][label] = totals[key].get(label, 0) + count
+            bucket_counts = [a + b for a, b in zip(bucket_counts, shard.bucket_counts)]
+            latency_sum += shard.latency_sum
+        cumulative = []
+        total = 0
+        for bound, count in zip((*self._bounds, math.inf), bucket_counts):
+            total += count
+            cumulative.append((bound, total))
+        totals["latency"] = {"count": total, "sum": latency_sum, "buckets": cumulative}
+        return totals
+
+
+def _label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """
+    Thread-safe metrics for one client. Endpoints are keyed by request URL
+    and reported by URL path. Extra numeric stats (caches, rate limiter,
+    services) can be attached with register() and are exported as gauges.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        bounds = tuple(sorted(float(b) for b in buckets))
+        if not bounds or bounds[0] <= 0:
+            raise ValueError("buckets must be positive")
+        self._bounds = bounds
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _Endpoint] = {}
+        self._collectors: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+    @property
+    def buckets(self) -> Tuple[float, ...]:
+        """Upper bounds of the latency histogram buckets, in seconds."""
+        return self._bounds
+
+    def start(self, url: str) -> EndpointCounters:
+        """
+        Record the start of a request to ``url`` and return the calling
+        thread's counters for it, on which to record attempts and retries.
+        Call finished() on them when the request is over.
+        """
+        endpoint = self._endpoints.get(url)
+        if endpoint is None:
+            with self._lock:
+                endpoint = self._endpoints.setdefault(url, _Endpoint(self._bounds))
+        counters = endpoint.counters()
+        counters.requests += 1
+        counters.in_flight += 1
+        return counters
+
+    def register(self, name: str, stats: Callable[[], Dict[str, Any]]) -> None:
+        """Export the numeric values of ``stats()`` as gauges named ``<name>_<key>``."""
+        self._collectors[name] = stats
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current values: {"endpoints": {path: {...}}, "stats": {name: {...}}}.
+        Endpoint entries hold requests, in_flight, attempts, retries,
+        sleep_seconds, statuses, errors and latency (count, sum and
+        cumulative (upper bound, count) buckets).
+        """
+        endpoints: Dict[str, Dict[str, Any]] = {}
+        for url, metrics in list(self._endpoints.items()):
+            path = urlsplit(url).path or url
+            endpoints[path] = _merge(endpoints.get(path), metrics.snapshot())
+        stats = {name: collect() for name, collect in list(self._collectors.items())}
+        return {"endpoints": endpoints, "stats": stats}
+
+    def to_prometheus(self, prefix: str = "sec4dev") -> str:
+        """Render the snapshot in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        endpoints = snapshot["endpoints"]
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            full = f"{prefix}_{name}"
+            lines.append(f"# HELP {full} {help_text}")
+            lines.append(f"# TYPE {full} {kind}")
+            return full
+
+        per_endpoint = (
+            ("requests_total", "counter", "requests", "Requests made, each including all of its attempts."),
+            ("attempts_total", "counter", "attempts", "HTTP attempts sent."),
+            ("retries_total", "counter", "retries", "Attempts retried after an error or retryable response."),
+            ("retry_sleep_seconds_total", "counter", "sleep_seconds", "Time slept in retry backoff."),
+            ("in_flight_requests", "gauge", "in_flight", "Requests currently in progress."),
+        )
+        for name, kind, key, help_text in per_endpoint:
+            full = family(name, kind, help_text)
+            for path, values in endpoints.items():
+                lines.append(f'{full}{{endpoint="{_label(path)}"}} {_number(values[key])}')
+
+        full = family("responses_total", "counter", "HTTP responses by status code.")
+        for path, values in endpoints.items():
+            for status, count in sorted(values["statuses"].items()):
+                lines.append(f'{full}{{endpoint="{_label(path)}",status="{status}"}} {count}')
+
+        full = family("transport_errors_total", "counter", "Attempts that failed without a response, by error type.")
+        for path, values in endpoints.items():
+            for error, count in sorted(values["errors"].items()):
+                lines.append(f'{full}{{endpoint="{_label(path)}",error="{_label(error)}"}} {count}')
+
+        full = family("request_duration_seconds", "histogram", "Latency of each HTTP attempt.")
+        for path, values in endpoints.items():
+            endpoint = _label(path)
+            latency = values["latency"]
+            for bound, count in latency["buckets"]:
+                lines.append(f'{full}_bucket{{endpoint="{endpoint}",le="{_number(bound)}"}} {count}')
+            lines.append(f'{full}_sum{{endpoint="{endpoint}"}} {_number(latency["sum"])}')
+            lines.append(f'{full}_count{{endpoint="{endpoint}"}} {latency["count"]}')
+
+        for name, stats in snapshot["stats"].items():
+            for key, value in stats.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                full = family(f"{name}_{key}", "gauge", f"{name} {key}.")
+                lines.append(f"{full} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _merge(into: Optional[Dict[str, Any]], values: Dict[str, Any]) -> Dict[str, Any]:
+    """Add two endpoint snapshots (same path under different base URLs)."""
+    if into is None:
+        return values
+    for key in ("requests", "in_flight", "attempts", "retries", "sleep_seconds"):
+        into[key] += values[key]
+    for key in ("statuses", "errors"):
+        for label, count in values[key].items():
+            into[key][label] = into[key].get(label, 0) + count
+    latency = into["latency"]
+    latency["count"] += values["latency"]["count"]
+    latency["sum"] += values["latency"]["sum"]
+    latency["buckets"] = [
+        (bound, a + b) for (bound, a), (_, b) in zip(latency["buckets"], values["latency"]["buckets"])
+    ]
+    return into
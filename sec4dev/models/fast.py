@@ -0,0 +1,41 @@
+"""
+Fast construction of result models.
+
+construct() builds a model from values that are already known to be valid
+(copies of validated results, rows decoded from the SDK's own cache format)
+without running pydantic validation. Never pass it API responses.
+
+For nested models such as IPCheckResult, a single model_validate() call over
+the whole dict is about as fast as Python-level construction, because
+pydantic-core validates the tree natively; prefer that.
+"""
+
+from typing import Any, Dict, Type, TypeVar
+
+from pydantic import BaseModel
+
+from sec4dev.models.email import EmailCheckResult
+
+M = TypeVar("M", bound=BaseModel)
+
+_setattr = object.__setattr__
+_new = object.__new__
+
+
+def construct(cls: Type[M], values: Dict[str, Any]) -> M:
+    """
+    Build a model instance from a dict holding every field with a valid value.
+    Unlike BaseModel.model_construct(), defaults are not filled in, which
+    makes it several times cheaper.
+    """
+    obj = _new(cls)
+    _setattr(obj, "__dict__", values)
+    _setattr(obj, "__pydantic_fields_set__", set(values))
+    _setattr(obj, "__pydantic_extra__", None)
+    _setattr(obj, "__pydantic_private__", None)
+    return obj
+
+
+def email_check_result(email: str, domain: str, is_disposable: bool) -> EmailCheckResult:
+    """Trusted EmailCheckResult."""
+    return construct(EmailCheckResult, {"email": email, "domain": domain, "is_disposable": is_disposable})
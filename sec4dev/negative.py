@@ -0,0 +1,55 @@
+"""Short-lived cache of deterministic failures (negative caching)."""
+
+from typing import Dict, Hashable, Tuple, Type
+
+from sec4dev.cache import TTLCache
+from sec4dev.exceptions import NotFoundError, Sec4DevError, ValidationError
+
+DEFAULT_MAXSIZE = 10000
+DEFAULT_TTL = 60.0
+
+# Failures that will recur for the same input. 429 and 5xx are transient
+# and never cached.
+CACHEABLE_ERRORS: Tuple[Type[Sec4DevError], ...] = (ValidationError, NotFoundError)
+CACHEABLE_STATUS_CODES = (404, 422)
+
+
+class NegativeCache:
+    """
+    Remembers inputs that failed deterministically (client-side validation
+    errors and server 404/422 answers) for ``ttl`` seconds, so resubmitting
+    the same bad value raises the same exception type without validating or
+    calling the API again. Bounded to ``maxsize`` inputs, LRU evicted.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = DEFAULT_TTL) -> None:
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def cacheable(error: BaseException) -> bool:
+        """True if the error is deterministic for its input."""
+        return isinstance(error, CACHEABLE_ERRORS) and error.status_code in CACHEABLE_STATUS_CODES
+
+    def check(self, key: Hashable) -> None:
+        """Raise a copy of the remembered error for key, if any."""
+        entry = self._cache.get(key)
+        if entry is not None:
+            error_type, message, status_code, body = entry
+            raise error_type(message, status_code, body)
+
+    def record(self, key: Hashable, error: BaseException) -> bool:
+        """Remember a deterministic error for key. Returns True if it was stored."""
+        if not isinstance(error, Sec4DevError) or not self.cacheable(error):
+            return False
+        self._cache.set(key, (type(error), error.message, error.status_code, error.response_body))
+        return True
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters: hits (failures re-raised from the cache), misses, evictions, expirations, size."""
+        return self._cache.stats()
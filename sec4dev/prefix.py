@@ -0,0 +1,302 @@
+"""Network-prefix aware IP cache built on a compressed binary (patricia) trie."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sec4dev.models.fast import construct
+from sec4dev.models.ip import IPCheckResult
+from sec4dev.validation import packed_ip
+
+DEFAULT_IPV4_PREFIX = 24
+DEFAULT_IPV6_PREFIX = 64
+DEFAULT_MAXSIZE = 100000
+DEFAULT_TTL = 3600.0
+
+
+class _Node:
+    __slots__ = ("key", "length", "value", "has_value", "children")
+
+    def __init__(self, key: int, length: int) -> None:
+        self.key = key
+        self.length = length
+        self.value: Any = None
+        self.has_value = False
+        self.children: List[Optional["_Node"]] = [None, None]
+
+
+class PrefixTrie:
+    """
+    Path-compressed binary trie mapping network prefixes to values.
+
+    Keys are integers of ``width`` bits (32 for IPv4, 128 for IPv6). Inserts,
+    deletes and longest-prefix-match lookups are O(prefix bits). Not thread-safe.
+    """
+
+    def __init__(self, width: int) -> None:
+        self.width = width
+        self._root = _Node(0, 0)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def mask(self, key: int, length: int) -> int:
+        """Zero all bits of key beyond the first length bits."""
+        if length == 0:
+            return 0
+        shift = self.width - length
+        return (key >> shift) << shift
+
+    def _bit(self, key: int, index: int) -> int:
+        return (key >> (self.width - 1 - index)) & 1
+
+    def _common_length(self, a: int, b: int, limit: int) -> int:
+        diff = a ^ b
+        if diff == 0:
+            return limit
+        return min(limit, self.width - diff.bit_length())
+
+    def insert(self, key: int, length: int, value: Any) -> None:
+        """Store value for the prefix key/length (replacing any existing value)."""
+        if not 0 <= length <= self.width:
+            raise ValueError(f"prefix length must be between 0 and {self.width}")
+        width = self.width
+        key = self.mask(key, length)
+        node = self._root
+        while True:
+            if node.length == length:
+                if not node.has_value:
+                    self._size += 1
+                node.value = value
+                node.has_value = True
+                return
+            bit = (key >> (width - 1 - node.length)) & 1
+            child = node.children[bit]
+            if child is None:
+                leaf = _Node(key, length)
+                leaf.value = value
+                leaf.has_value = True
+                node.children[bit] = leaf
+                self._size += 1
+                return
+            if child.length <= length and not (child.key ^ key) >> (width - child.length):
+                node = child
+                continue
+            common = self._common_length(child.key, key, min(child.length, length))
+            if common == length:
+                # The new prefix sits between node and child.
+                new = _Node(key, length)
+                new.value = value
+                new.has_value = True
+                new.children[self._bit(child.key, length)] = child
+                node.children[bit] = new
+            else:
+                # Split at the first differing bit.
+                split = _Node(self.mask(key, common), common)
+                leaf = _Node(key, length)
+                leaf.value = value
+                leaf.has_value = True
+                split.children[self._bit(child.key, common)] = child
+                split.children[self._bit(key, common)] = leaf
+                node.children[bit] = split
+            self._size += 1
+            return
+
+    def items(self) -> Iterator[Tuple[int, int, Any]]:
+        """Yield (key, prefix length, value) for every stored prefix."""
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.has_value:
+                yield node.key, node.length, node.value
+            stack.extend(child for child in node.children if child is not None)
+
+    def copy(self) -> "PrefixTrie":
+        """Return a new trie holding the same prefixes and values."""
+        clone = PrefixTrie(self.width)
+        for key, length, value in self.items():
+            clone.insert(key, length, value)
+        return clone
+
+    def _matches(self, node: _Node, key: int) -> bool:
+        if node.length == 0:
+            return True
+        return (node.key ^ key) >> (self.width - node.length) == 0
+
+    def longest_match(self, key: int) -> Optional[Tuple[int, Any]]:
+        """Return (prefix length, value) of the longest prefix containing key, or None."""
+        # Hot path: bit arithmetic is inlined to avoid per-level method calls.
+        width = self.width
+        best: Optional[_Node] = None
+        node: Optional[_Node] = self._root
+        while node is not None:
+            length = node.length
+            if length and (node.key ^ key) >> (width - length):
+                break
+            if node.has_value:
+                best = node
+            if length == width:
+                break
+            node = node.children[(key >> (width - 1 - length)) & 1]
+        if best is None:
+            return None
+        return best.length, best.value
+
+    def get(self, key: int, length: int) -> Optional[Any]:
+        """Return the value stored for exactly key/length, or None."""
+        key = self.mask(key, length)
+        node: Optional[_Node] = self._root
+        while node is not None and node.length <= length and self._matches(node, key):
+            if node.length == length:
+                return node.value if node.has_value else None
+            node = node.children[self._bit(key, node.length)]
+        return None
+
+    def delete(self, key: int, length: int) -> bool:
+        """Remove the value for exactly key/length. Returns True if it existed."""
+        key = self.mask(key, length)
+        path: List[_Node] = []
+        node: Optional[_Node] = self._root
+        while node is not None and node.length <= length and self._matches(node, key):
+            if node.length == length:
+                break
+            path.append(node)
+            node = node.children[self._bit(key, node.length)]
+        else:
+            return False
+        if node is None or not node.has_value:
+            return False
+        node.value = None
+        node.has_value = False
+        self._size -= 1
+        # Prune nodes that no longer carry a value or a branch.
+        while path and not node.has_value:
+            parent = path.pop()
+            kids = [c for c in node.children if c is not None]
+            slot = parent.children.index(node)
+            if len(kids) == 0:
+                parent.children[slot] = None
+            elif len(kids) == 1:
+                parent.children[slot] = kids[0]
+            else:
+                break
+            node = parent
+        return True
+
+
+def _parse(ip: str) -> Tuple[int, int]:
+    """Return (version, integer value) of an IP address string."""
+    packed = packed_ip(ip)
+    if packed is None:
+        raise ValueError(f"{ip!r} does not appear to be an IPv4 or IPv6 address")
+    return (4 if len(packed) == 4 else 6), int.from_bytes(packed, "big")
+
+
+def _generalizes(result: IPCheckResult) -> bool:
+    """True if a verdict can be assumed to hold for the whole allocated block."""
+    return (
+        result.classification == "hosting"
+        or result.signals.is_hosting
+        or bool(result.network.provider)
+    )
+
+
+class IPPrefixCache:
+    """
+    Opt-in IP result cache that can answer for a whole network block.
+
+    Hosting or provider-attributed results are stored under their
+    ``ipv4_prefix``/``ipv6_prefix`` network (e.g. /24, /64); other results are
+    stored for the single address. Lookups use longest-prefix match, so a
+    cached /24 serves every address in it. Entries expire after ``ttl``
+    seconds and the least recently used prefixes are evicted past ``maxsize``.
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float = DEFAULT_TTL,
+        ipv4_prefix: int = DEFAULT_IPV4_PREFIX,
+        ipv6_prefix: int = DEFAULT_IPV6_PREFIX,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if not 0 < ipv4_prefix <= 32:
+            raise ValueError("ipv4_prefix must be between 1 and 32")
+        if not 0 < ipv6_prefix <= 128:
+            raise ValueError("ipv6_prefix must be between 1 and 128")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ipv4_prefix = ipv4_prefix
+        self.ipv6_prefix = ipv6_prefix
+        self._tries: Dict[int, PrefixTrie] = {4: PrefixTrie(32), 6: PrefixTrie(128)}
+        self._order: "OrderedDict[Tuple[int, int, int], None]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, ip: str) -> Optional[IPCheckResult]:
+        """Return a cached result covering ip (with ``ip`` set to the query), or None."""
+        version, key = _parse(ip)
+        trie = self._tries[version]
+        now = time.monotonic()
+        with self._lock:
+            while True:
+                match = trie.longest_match(key)
+                if match is None:
+                    self._misses += 1
+                    return None
+                length, (expires_at, result) = match
+                entry = (version, trie.mask(key, length), length)
+                if expires_at > now:
+                    break
+                trie.delete(key, length)
+                self._order.pop(entry, None)
+            self._order.move_to_end(entry)
+            self._hits += 1
+        if result.ip == ip.strip():
+            return result
+        return construct(IPCheckResult, {**result.__dict__, "ip": ip.strip()})
+
+    def set(self, ip: str, result: IPCheckResult) -> None:
+        """Store a result, generalized to the configured prefix when applicable."""
+        version, key = _parse(ip)
+        trie = self._tries[version]
+        if _generalizes(result):
+            length = self.ipv4_prefix if version == 4 else self.ipv6_prefix
+        else:
+            length = trie.width
+        entry = (version, trie.mask(key, length), length)
+        with self._lock:
+            trie.insert(key, length, (time.monotonic() + self.ttl, result))
+            self._order[entry] = None
+            self._order.move_to_end(entry)
+            while len(self._order) > self.maxsize:
+                (old_version, old_key, old_length), _ = self._order.popitem(last=False)
+                self._tries[old_version].delete(old_key, old_length)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._tries = {4: PrefixTrie(32), 6: PrefixTrie(128)}
+            self._order.clear()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters: hits, misses, evictions, size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._order),
+            }
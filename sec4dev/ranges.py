@@ -0,0 +1,206 @@
+"""Local IP range database for pre-classifying addresses (Tor exits, cloud ranges)."""
+
+import csv
+import ipaddress
+import json
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from sec4dev.models.ip import IPCheckResult
+from sec4dev.prefix import PrefixTrie
+from sec4dev.serialization import SIGNAL_FIELDS
+from sec4dev.validation import packed_ip
+
+_Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+# Keys accepted for the network column in JSON/CSV sources
+# (AWS ip-ranges.json uses ip_prefix / ipv6_prefix).
+_CIDR_KEYS = ("cidr", "prefix", "network", "ip_prefix", "ipv6_prefix")
+
+
+class IPRange:
+    """Classification attached to one network range."""
+
+    __slots__ = ("network", "classification", "signals", "provider", "org", "asn", "country", "confidence")
+
+    def __init__(
+        self,
+        network: str,
+        classification: str,
+        signals: Optional[Dict[str, bool]] = None,
+        provider: Optional[str] = None,
+        org: Optional[str] = None,
+        asn: Optional[int] = None,
+        country: Optional[str] = None,
+        confidence: float = 1.0,
+    ) -> None:
+        self.network = network
+        self.classification = classification
+        self.signals = signals if signals is not None else _default_signals(classification)
+        self.provider = provider
+        self.org = org
+        self.asn = asn
+        self.country = country
+        self.confidence = confidence
+
+    def to_result(self, ip: str) -> IPCheckResult:
+        """Build an IPCheckResult for an address inside this range."""
+        return IPCheckResult.model_validate({
+            "ip": ip,
+            "classification": self.classification,
+            "confidence": self.confidence,
+            "signals": self.signals,
+            "network": {"asn": self.asn, "org": self.org, "provider": self.provider},
+            "geo": {"country": self.country},
+        })
+
+    def __repr__(self) -> str:
+        return f"IPRange({self.network!r}, {self.classification!r}, provider={self.provider!r})"
+
+
+def _default_signals(classification: str) -> Dict[str, bool]:
+    """Signals implied by a classification (e.g. "tor" -> is_tor)."""
+    name = f"is_{classification}"
+    return {name: True} if name in SIGNAL_FIELDS else {}
+
+
+def _parse_networks(text: str) -> List[_Network]:
+    """Parse a CIDR, a single address, or a "first-last" address range."""
+    text = text.strip()
+    if "-" in text:
+        first, last = (ipaddress.ip_address(part.strip()) for part in text.split("-", 1))
+        return list(ipaddress.summarize_address_range(first, last))  # type: ignore[arg-type]
+    return [ipaddress.ip_network(text, strict=False)]
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    if value in (None, ""):
+        return None
+    return int(str(value).upper().lstrip("AS"))
+
+
+def _given(value: Any, default: Any) -> Any:
+    """``value`` unless the row left it empty; falsy values such as 0 are kept."""
+    return default if value in (None, "") else value
+
+
+def _truthy(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y")
+    return bool(value)
+
+
+class IPRangeDatabase:
+    """
+    Longest-prefix-match index of classified IPv4/IPv6 ranges.
+
+    Ranges are loaded from plain-text CIDR lists, CSV or JSON files (or added
+    directly) into one PrefixTrie per address family. lookup() is O(prefix
+    bits); the most specific matching range wins. Thread-safe: loaders build
+    new tries and swap them in.
+    """
+
+    def __init__(self) -> None:
+        self._tries: Dict[int, PrefixTrie] = {4: PrefixTrie(32), 6: PrefixTrie(128)}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tries[4]) + len(self._tries[6])
+
+    def add(self, network: str, info: IPRange) -> None:
+        """Add one range (CIDR, single address or "first-last")."""
+        self.add_many([(network, info)])
+
+    def add_many(self, entries: Iterable[Tuple[str, IPRange]]) -> int:
+        """
+        Add (network, IPRange) pairs. Returns the number of CIDR blocks added.
+        The index is rebuilt and swapped in once per call, so prefer one call
+        per source file over many add() calls.
+        """
+        with self._lock:
+            tries = {4: self._tries[4].copy(), 6: self._tries[6].copy()}
+            count = 0
+            for network, info in entries:
+                for net in _parse_networks(network):
+                    tries[net.version].insert(int(net.network_address), net.prefixlen, info)
+                    count += 1
+            self._tries = tries
+        return count
+
+    def lookup(self, ip: str) -> Optional[IPRange]:
+        """
+        Return the most specific range containing ip, or None. IPv4-mapped
+        IPv6 addresses are looked up as their IPv4 address.
+        """
+        packed = packed_ip(ip)
+        if packed is None:
+            raise ValueError(f"{ip!r} does not appear to be an IPv4 or IPv6 address")
+        match = self._tries[4 if len(packed) == 4 else 6].longest_match(int.from_bytes(packed, "big"))
+        return match[1] if match is not None else None
+
+    def result_for(self, ip: str) -> Optional[IPCheckResult]:
+        """IPCheckResult pre-filled from the matching range, or None."""
+        info = self.lookup(ip)
+        return info.to_result(ip.strip()) if info is not None else None
+
+    def load_text(self, path: str, classification: str, **attrs: Any) -> int:
+        """
+        Load a plain-text list (one CIDR/address/range per line, # comments)
+        where every line shares the given classification and attributes.
+        """
+        entries = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    entries.append((line, IPRange(line, classification, **attrs)))
+        return self.add_many(entries)
+
+    def load_csv(self, path: str, classification: Optional[str] = None, **attrs: Any) -> int:
+        """
+        Load a CSV file with a header row. Recognized columns: cidr (or prefix,
+        network), classification, provider, org, asn, country, confidence and
+        any is_* signal column. Missing values fall back to the keyword arguments.
+        """
+        with open(path, newline="", encoding="utf-8") as f:
+            return self.add_many(_entries(csv.DictReader(f), classification, attrs))
+
+    def load_json(self, path: str, classification: Optional[str] = None, **attrs: Any) -> int:
+        """
+        Load a JSON list of range objects (same keys as load_csv), or an object
+        with "prefixes"/"ipv6_prefixes" lists such as AWS ip-ranges.json.
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            rows = list(data.get("prefixes", [])) + list(data.get("ipv6_prefixes", []))
+        else:
+            rows = data
+        return self.add_many(_entries(rows, classification, attrs))
+
+
+def _entries(
+    rows: Iterable[Dict[str, Any]],
+    classification: Optional[str],
+    attrs: Dict[str, Any],
+) -> Iterator[Tuple[str, IPRange]]:
+    """Turn CSV/JSON rows into (network, IPRange) pairs."""
+    for row in rows:
+        network = next((row[k] for k in _CIDR_KEYS if row.get(k)), None)
+        if network is None:
+            continue
+        row_class = row.get("classification") or classification
+        if not row_class:
+            raise ValueError(f"No classification for range {network}")
+        signals = {name: _truthy(row[name]) for name in SIGNAL_FIELDS if row.get(name) not in (None, "")}
+        info = IPRange(
+            network,
+            row_class,
+            signals=signals or attrs.get("signals"),
+            provider=row.get("provider") or attrs.get("provider"),
+            org=row.get("org") or attrs.get("org"),
+            asn=_given(_optional_int(row.get("asn")), attrs.get("asn")),
+            country=row.get("country") or attrs.get("country"),
+            confidence=float(_given(row.get("confidence"), attrs.get("confidence", 1.0))),
+        )
+        yield network, info
@@ -0,0 +1,139 @@
+"""Client-side token-bucket rate limiter driven by X-RateLimit-* headers."""
+
+import asyncio
+import math
+import threading
+import time
+from typing import Dict, Optional
+
+from sec4dev.exceptions import RateLimitError
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all services of a client.
+
+    The bucket is seeded and re-synced from the X-RateLimit-Limit/Remaining/Reset
+    headers of every response: capacity is the server limit, the refill rate is
+    limit divided by the longest reset window seen, and the token count never
+    exceeds what the server reports as remaining. When the server reports no
+    remaining requests (or answers 429), sending is paused until the reset.
+
+    acquire() blocks until a token is available. With ``fail_fast`` (or when the
+    predicted wait exceeds ``max_wait`` seconds) it raises RateLimitError with the
+    predicted wait in ``retry_after`` instead. Until the first response arrives,
+    requests are not limited unless ``rate``/``burst`` are given.
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.0,
+        burst: Optional[float] = None,
+        fail_fast: bool = False,
+        max_wait: Optional[float] = None,
+    ) -> None:
+        self.fail_fast = fail_fast
+        self.max_wait = max_wait
+        self._rate = rate
+        self._capacity = burst if burst is not None else rate
+        self._tokens = self._capacity
+        self._window = 0.0
+        self._blocked_until = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._waits = 0
+        self._rejections = 0
+
+    def _refill(self, now: float) -> None:
+        if self._rate > 0:
+            elapsed = now - self._updated
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def _reserve(self, now: float, max_wait: Optional[float] = None) -> float:
+        """Take a token, returning the wait in seconds before it may be used."""
+        if self._rate <= 0 and self._blocked_until <= now:
+            return 0.0
+        self._refill(now)
+        wait = max(0.0, self._blocked_until - now)
+        if self._rate > 0 and self._tokens < 1:
+            wait = max(wait, (1 - self._tokens) / self._rate)
+        if self.max_wait is not None:
+            max_wait = self.max_wait if max_wait is None else min(max_wait, self.max_wait)
+        if wait > 0 and (self.fail_fast or (max_wait is not None and wait > max_wait)):
+            self._rejections += 1
+            raise RateLimitError(
+                "Client-side rate limit reached",
+                retry_after=int(math.ceil(wait)),
+                limit=int(self._capacity),
+                remaining=max(0, int(self._tokens)),
+            )
+        self._tokens -= 1
+        if wait > 0:
+            self._waits += 1
+        return wait
+
+    def acquire(self, max_wait: Optional[float] = None) -> None:
+        """
+        Block until a request may be sent (or raise RateLimitError).
+        ``max_wait`` further limits the wait for this call only.
+        """
+        with self._lock:
+            wait = self._reserve(time.monotonic(), max_wait)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, max_wait: Optional[float] = None) -> None:
+        """Await until a request may be sent (or raise RateLimitError)."""
+        with self._lock:
+            wait = self._reserve(time.monotonic(), max_wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def update(self, info: Dict[str, int]) -> None:
+        """Re-sync the bucket from parsed X-RateLimit-* headers."""
+        limit = info.get("limit", 0)
+        if limit <= 0:
+            return
+        remaining = max(0, info.get("remaining", 0))
+        reset = max(0, info.get("reset_seconds", 0))
+        now = time.monotonic()
+        with self._lock:
+            self._refill(now)
+            first_sync = self._window == 0
+            self._window = max(self._window, float(reset), 1.0)
+            self._capacity = float(limit)
+            self._rate = limit / self._window
+            if first_sync:
+                self._tokens = float(remaining)
+            else:
+                self._tokens = min(self._tokens, float(remaining))
+            if remaining == 0 and reset > 0:
+                self._blocked_until = max(self._blocked_until, now + reset)
+
+    def block(self, seconds: float) -> None:
+        """Pause sending for the given number of seconds (e.g. after a 429)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def predicted_wait(self) -> float:
+        """Seconds until the next request could be sent, without taking a token."""
+        now = time.monotonic()
+        with self._lock:
+            self._refill(now)
+            wait = max(0.0, self._blocked_until - now)
+            if self._rate > 0 and self._tokens < 1:
+                wait = max(wait, (1 - self._tokens) / self._rate)
+            return wait
+
+    def stats(self) -> Dict[str, float]:
+        """Current state and counters: tokens, rate, capacity, waits, rejections."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "tokens": self._tokens,
+                "rate": self._rate,
+                "capacity": self._capacity,
+                "waits": self._waits,
+                "rejections": self._rejections,
+            }
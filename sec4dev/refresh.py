@@ -0,0 +1,107 @@
+"""Background refresh of stale cache entries (stale-while-revalidate)."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+DEFAULT_REFRESH_WORKERS = 2
+
+
+class BackgroundRefresher:
+    """
+    Runs at most one background refresh per key on a small thread pool.
+    A failed refresh is counted and otherwise ignored, so the stale value
+    keeps being served until it is refreshed or hits its hard TTL.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_REFRESH_WORKERS) -> None:
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._inflight: Set[Hashable] = set()
+        self._closed = False
+        self._refreshes = 0
+        self._failures = 0
+
+    def _begin(self, key: Hashable) -> bool:
+        with self._lock:
+            if self._closed or key in self._inflight:
+                return False
+            self._inflight.add(key)
+            self._refreshes += 1
+            return True
+
+    def _end(self, key: Hashable, ok: bool) -> None:
+        with self._lock:
+            self._inflight.discard(key)
+            if not ok:
+                self._failures += 1
+
+    def schedule(self, key: Hashable, fn: Callable[[], Any]) -> bool:
+        """Run fn in the background unless a refresh for key is already running or close() was called."""
+        if not self._begin(key):
+            return False
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="sec4dev-refresh"
+                )
+            executor = self._executor
+        executor.submit(self._run, key, fn)
+        return True
+
+    def _run(self, key: Hashable, fn: Callable[[], Any]) -> None:
+        ok = False
+        try:
+            fn()
+            ok = True
+        except Exception:
+            pass
+        finally:
+            self._end(key, ok)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters: refreshes started and refreshes that failed."""
+        with self._lock:
+            return {"refreshes": self._refreshes, "refresh_failures": self._failures}
+
+    def close(self) -> None:
+        """Stop accepting work; running refreshes finish in the background."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+class AsyncBackgroundRefresher(BackgroundRefresher):
+    """Asyncio variant: each refresh runs as a task on the running loop."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._tasks: "Set[asyncio.Task[None]]" = set()
+
+    def schedule(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> bool:  # type: ignore[override]
+        if not self._begin(key):
+            return False
+        task = asyncio.ensure_future(self._run_async(key, fn))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _run_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> None:
+        ok = False
+        try:
+            await fn()
+            ok = True
+        except Exception:
+            pass
+        finally:
+            self._end(key, ok)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        for task in list(self._tasks):
+            task.cancel()
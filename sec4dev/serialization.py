@@ -0,0 +1,70 @@
+"""Compact serialized form of check results (for persistent caches)."""
+
+import json
+from typing import Any, Union
+
+from sec4dev.models.email import EmailCheckResult
+from sec4dev.models.fast import email_check_result
+from sec4dev.models.ip import IPCheckResult, IPSignals
+
+SIGNAL_FIELDS = ("is_hosting", "is_residential", "is_mobile", "is_vpn", "is_tor", "is_proxy")
+
+_IP_TAG = "i"
+_EMAIL_TAG = "e"
+
+
+def pack_signals(signals: IPSignals) -> int:
+    """Pack IPSignals into an int bitfield (bit i = SIGNAL_FIELDS[i])."""
+    bits = 0
+    for i, name in enumerate(SIGNAL_FIELDS):
+        if getattr(signals, name):
+            bits |= 1 << i
+    return bits
+
+
+def unpack_signals(bits: int) -> IPSignals:
+    """Inverse of pack_signals()."""
+    return IPSignals(**{name: bool(bits >> i & 1) for i, name in enumerate(SIGNAL_FIELDS)})
+
+
+def encode_result(result: Union[IPCheckResult, EmailCheckResult]) -> bytes:
+    """Serialize a result to a compact tagged JSON array."""
+    if isinstance(result, IPCheckResult):
+        row: list = [
+            _IP_TAG,
+            result.ip,
+            result.classification,
+            result.confidence,
+            pack_signals(result.signals),
+            result.network.asn,
+            result.network.org,
+            result.network.provider,
+            result.geo.country,
+            result.geo.region,
+        ]
+    elif isinstance(result, EmailCheckResult):
+        row = [_EMAIL_TAG, result.email, result.domain, result.is_disposable]
+    else:
+        raise TypeError(f"Cannot serialize {type(result).__name__}")
+    return json.dumps(row, separators=(",", ":")).encode("utf-8")
+
+
+def decode_result(data: Union[bytes, str]) -> Any:
+    """Deserialize a value produced by encode_result()."""
+    row = json.loads(data)
+    tag = row[0]
+    if tag == _IP_TAG:
+        _, ip, classification, confidence, bits, asn, org, provider, country, region = row
+        return IPCheckResult.model_validate({
+            "ip": ip,
+            "classification": classification,
+            "confidence": confidence,
+            "signals": {name: bool(bits >> i & 1) for i, name in enumerate(SIGNAL_FIELDS)},
+            "network": {"asn": asn, "org": org, "provider": provider},
+            "geo": {"country": country, "region": region},
+        })
+    if tag == _EMAIL_TAG:
+        _, email, domain, is_disposable = row
+        # Rows are written by encode_result() from validated results.
+        return email_check_result(email, domain, is_disposable)
+    raise ValueError(f"Unknown result tag: {tag!r}")
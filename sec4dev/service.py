@@ -0,0 +1,131 @@
+"""Machinery shared by the IP and email services."""
+
+import math
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sec4dev.breaker import CircuitBreaker
+from sec4dev.budget import RetryBudget
+from sec4dev.cache import CacheBackend
+from sec4dev.http import _expiry, _remaining
+from sec4dev.metrics import MetricsRegistry
+from sec4dev.negative import NegativeCache
+from sec4dev.ratelimit import RateLimiter
+from sec4dev.refresh import BackgroundRefresher
+from sec4dev.singleflight import SingleFlight
+
+
+class BaseService:
+    """
+    Configuration, caching, request coalescing and counters shared by every
+    service. Sync services use SingleFlight and a thread-pool refresher; async
+    services swap in their asyncio counterparts via the class attributes.
+
+    When the cache backend reports an entry as stale (past its soft TTL but
+    within its hard TTL), the stale value is returned at once and a single
+    background refresh per key fetches a fresh one.
+    """
+
+    _flight_class: Any = SingleFlight
+    _refresher_class: Any = BackgroundRefresher
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout_ms: int = 30000,
+        retries: int = 3,
+        retry_delay_ms: int = 1000,
+        on_rate_limit: Optional[Callable[[dict], None]] = None,
+        http_client: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        deadline_ms: Optional[int] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        cache: Optional[CacheBackend] = None,
+        negative_cache: Optional[NegativeCache] = None,
+    ) -> None:
+        self._base_url = base_url.rstrip("/")
+        self._api_key = api_key
+        self._timeout_ms = timeout_ms
+        self._retries = retries
+        self._retry_delay_ms = retry_delay_ms
+        self._on_rate_limit = on_rate_limit
+        self._http_client = http_client
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self._retry_budget = retry_budget
+        self._deadline_ms = deadline_ms
+        self._metrics = metrics
+        self._cache = cache
+        self._negative_cache = negative_cache
+        # Concurrent checks for the same cache key share one request.
+        self._flight = self._flight_class()
+        self._refresher = self._refresher_class()
+        self._counters: Dict[str, int] = {"api_calls": 0, "local_answers": 0, "stale_served": 0}
+        self._stats_lock = threading.Lock()
+
+    @property
+    def cache(self) -> Optional[CacheBackend]:
+        """Result cache, if enabled."""
+        return self._cache
+
+    @property
+    def negative_cache(self) -> Optional[NegativeCache]:
+        """Cache of inputs that failed deterministically, if enabled."""
+        return self._negative_cache
+
+    def _raise_if_known_bad(self, value: Any) -> None:
+        if self._negative_cache is not None and isinstance(value, str):
+            self._negative_cache.check(value)
+
+    def _remember_failure(self, value: Any, error: Exception) -> None:
+        if self._negative_cache is not None and isinstance(value, str):
+            self._negative_cache.record(value, error)
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def _expires_at(self, deadline: Optional[int]) -> Optional[float]:
+        """Monotonic time at which a call with ``deadline`` (ms; the client's by default) gives up."""
+        return _expiry(self._deadline_ms if deadline is None else deadline)
+
+    @staticmethod
+    def _deadline_left(expires_at: Optional[float]) -> Optional[int]:
+        """Milliseconds left before expires_at; raises DeadlineExceededError once it has passed."""
+        remaining = _remaining(expires_at)
+        return None if remaining is None else math.ceil(remaining * 1000)
+
+    def _cache_lookup(self, key: str) -> Tuple[Optional[Any], bool]:
+        """Return (cached value or None, whether it is stale)."""
+        if self._cache is None:
+            return None, False
+        return self._cache.lookup(key)
+
+    def _cache_set(self, key: str, result: Any) -> None:
+        if self._cache is not None:
+            self._cache.set(key, result)
+
+    def _revalidate(self, key: str, fetch: Callable[[], Any]) -> None:
+        """A stale entry is being served: refresh it in the background."""
+        self._count("stale_served")
+        self._refresher.schedule(key, lambda: self._flight.do(key, fetch))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters: api_calls, local_answers, stale_served (stale cache entries
+        returned while revalidating), refreshes, refresh_failures and
+        negative_hits (known-bad inputs rejected from the negative cache).
+        """
+        with self._stats_lock:
+            stats = dict(self._counters)
+        stats.update(self._refresher.stats())
+        stats["negative_hits"] = self._negative_cache.stats()["hits"] if self._negative_cache is not None else 0
+        return stats
+
+    def close(self) -> None:
+        """Stop background refreshes."""
+        self._refresher.close()
+
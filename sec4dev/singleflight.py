@@ -0,0 +1,119 @@
+"""Request coalescing: concurrent calls for the same key share one execution."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from sec4dev.exceptions import DeadlineExceededError
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-based single-flight group.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait and receive the same result or exception.
+
+    Each caller may pass ``expires_at`` (a time.monotonic() value): a caller
+    waiting on another's call raises DeadlineExceededError once it passes.
+    A DeadlineExceededError of the running call is that caller's own, so
+    waiting callers do not receive it; they run their own function instead.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T], expires_at: Optional[float] = None) -> T:
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if call is None:
+                    call = self._calls[key] = _Call()
+                else:
+                    self._shared += 1
+            if leader:
+                try:
+                    call.result = fn()
+                except BaseException as e:
+                    call.error = e
+                finally:
+                    with self._lock:
+                        del self._calls[key]
+                    call.done.set()
+            else:
+                timeout = None if expires_at is None else max(0.0, expires_at - time.monotonic())
+                if not call.done.wait(timeout):
+                    raise DeadlineExceededError("Deadline exceeded while waiting for a shared request")
+                if isinstance(call.error, DeadlineExceededError):
+                    continue
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+    @property
+    def shared(self) -> int:
+        """Number of calls served by another caller's in-flight request."""
+        return self._shared
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio single-flight group.
+
+    The shared work runs as its own task and each caller awaits it through
+    asyncio.shield, so cancelling one caller does not cancel the others.
+    ``expires_at`` bounds each waiting caller as in SingleFlight.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self._shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]], expires_at: Optional[float] = None) -> T:
+        while True:
+            task = self._tasks.get(key)
+            leader = task is None
+            if task is None:
+                task = asyncio.ensure_future(fn())
+                self._tasks[key] = task
+                task.add_done_callback(lambda t: self._forget(key, t))
+            else:
+                self._shared += 1
+            if leader:
+                return await asyncio.shield(task)
+            timeout = None if expires_at is None else max(0.0, expires_at - time.monotonic())
+            try:
+                return await asyncio.wait_for(asyncio.shield(task), timeout)
+            except asyncio.TimeoutError:
+                if task.done():
+                    raise
+                raise DeadlineExceededError("Deadline exceeded while waiting for a shared request") from None
+            except DeadlineExceededError:
+                continue
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller was cancelled.
+            task.exception()
+
+    @property
+    def shared(self) -> int:
+        """Number of calls served by another caller's in-flight request."""
+        return self._shared
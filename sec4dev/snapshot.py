@@ -0,0 +1,164 @@
+"""Offline disposable-domain snapshot: a Bloom filter plus exact top-N sets."""
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+from typing import Iterable, Optional, Union
+
+from sec4dev.validation import normalize_domain
+
+_MAGIC = b"S4DS"
+_VERSION = 1
+_FLAG_AUTHORITATIVE = 1
+# magic, version, flags, bloom bits, hash count, known-good bytes, disposable bytes
+_HEADER = struct.Struct("<4sHHQIII")
+
+DEFAULT_FALSE_POSITIVE_RATE = 0.001
+
+
+def _hashes(item: str):
+    digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+class BloomFilter:
+    """
+    Bloom filter over strings (double hashing on blake2b).
+
+    ``bits`` may be any buffer, including a read-only memory map.
+    """
+
+    def __init__(self, num_bits: int, num_hashes: int, bits: Optional[Union[bytearray, memoryview]] = None) -> None:
+        if num_bits < 8:
+            raise ValueError("num_bits must be at least 8")
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, fp_rate: float = DEFAULT_FALSE_POSITIVE_RATE) -> "BloomFilter":
+        """Size a filter for ``capacity`` items at the given false-positive rate."""
+        capacity = max(1, capacity)
+        num_bits = max(8, int(math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))))
+        num_hashes = max(1, int(round(num_bits / capacity * math.log(2))))
+        return cls(num_bits, num_hashes)
+
+    def add(self, item: str) -> None:
+        h1, h2 = _hashes(item)
+        for i in range(self.num_hashes):
+            pos = (h1 + i * h2) % self.num_bits
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        h1, h2 = _hashes(item)
+        bits = self.bits
+        for i in range(self.num_hashes):
+            pos = (h1 + i * h2) % self.num_bits
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+
+class DomainSnapshot:
+    """
+    Local knowledge of disposable and known-good email domains.
+
+    Holds a Bloom filter of all known disposable domains plus exact sets for
+    the top-N disposable and known-good domains. lookup() returns True or False
+    only when certain: exact-set hits, or a Bloom filter miss when the snapshot
+    is ``authoritative`` (covers every disposable domain the API knows). It
+    returns None otherwise, and the caller should ask the API.
+
+    Snapshots loaded from a file memory-map the Bloom filter, so worker
+    processes share its pages.
+    """
+
+    def __init__(
+        self,
+        bloom: BloomFilter,
+        disposable: Iterable[str] = (),
+        known_good: Iterable[str] = (),
+        authoritative: bool = False,
+    ) -> None:
+        self.bloom = bloom
+        self.disposable = frozenset(normalize_domain(d) for d in disposable)
+        self.known_good = frozenset(normalize_domain(d) for d in known_good)
+        self.authoritative = authoritative
+        self._mmap: Optional[mmap.mmap] = None
+
+    @classmethod
+    def build(
+        cls,
+        disposable: Iterable[str],
+        known_good: Iterable[str] = (),
+        top_disposable: Optional[Iterable[str]] = None,
+        authoritative: bool = False,
+        fp_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+    ) -> "DomainSnapshot":
+        """
+        Build a snapshot. ``disposable`` feeds the Bloom filter; ``top_disposable``
+        (default: none) and ``known_good`` are kept as exact sets.
+        """
+        domains = sorted({normalize_domain(d) for d in disposable})
+        bloom = BloomFilter.for_capacity(len(domains), fp_rate)
+        for domain in domains:
+            bloom.add(domain)
+        return cls(bloom, top_disposable or (), known_good, authoritative)
+
+    def lookup(self, domain: str) -> Optional[bool]:
+        """True/False if the domain's disposability is certain, else None."""
+        domain = normalize_domain(domain)
+        if domain in self.known_good:
+            return False
+        if domain in self.disposable:
+            return True
+        if self.authoritative and domain not in self.bloom:
+            return False
+        return None
+
+    def save(self, path: str) -> None:
+        """Write the snapshot atomically to ``path``."""
+        good = "\n".join(sorted(self.known_good)).encode("utf-8")
+        bad = "\n".join(sorted(self.disposable)).encode("utf-8")
+        header = _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            _FLAG_AUTHORITATIVE if self.authoritative else 0,
+            self.bloom.num_bits,
+            self.bloom.num_hashes,
+            len(good),
+            len(bad),
+        )
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(header)
+            f.write(good)
+            f.write(bad)
+            f.write(bytes(self.bloom.bits))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "DomainSnapshot":
+        """Load a snapshot file, memory-mapping its Bloom filter."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, flags, num_bits, num_hashes, good_len, bad_len = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC or version != _VERSION:
+            mapped.close()
+            raise ValueError(f"{path} is not a sec4dev domain snapshot")
+        offset = _HEADER.size
+        good = mapped[offset:offset + good_len].decode("utf-8")
+        offset += good_len
+        bad = mapped[offset:offset + bad_len].decode("utf-8")
+        offset += bad_len
+        bits = memoryview(mapped)[offset:offset + (num_bits + 7) // 8]
+        snapshot = cls(
+            BloomFilter(num_bits, num_hashes, bits),
+            bad.split("\n") if bad else (),
+            good.split("\n") if good else (),
+            bool(flags & _FLAG_AUTHORITATIVE),
+        )
+        snapshot._mmap = mapped
+        return snapshot
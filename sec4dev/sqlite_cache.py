@@ -0,0 +1,304 @@
+"""Persistent SQLite (WAL) cache backend shared across processes and restarts."""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from sec4dev.cache import CacheBackend
+from sec4dev.serialization import decode_result, encode_result
+
+DEFAULT_TTL = 3600.0
+DEFAULT_MAXSIZE = 1000000
+DEFAULT_WRITE_BATCH = 64
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_POOL_SIZE = 4
+PRUNE_EVERY = 16
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_expires ON results (expires_at);
+"""
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Cache backend stored in an SQLite database in WAL mode.
+
+    Many processes (e.g. gunicorn workers) can open the same file and read
+    concurrently, and entries survive restarts. Results are stored in the
+    compact form from sec4dev.serialization. set() only buffers: a background
+    thread writes the buffer in one transaction once it holds ``write_batch``
+    entries, or at most ``flush_interval`` seconds after an entry was
+    buffered, so a process that exits without close() loses at most that
+    much. Failed writes are retried on the next flush and counted in
+    stats()["write_errors"]. Expired rows are pruned and the table is trimmed
+    to ``maxsize`` rows (soonest-expiring first) every few flushes. ``ttl`` is
+    in seconds. Use a different ``namespace`` per service when sharing one
+    file.
+
+    Threads borrow connections from a pool that keeps at most ``pool_size``
+    idle connections open, however many threads use the cache over time. A
+    forked child (e.g. a gunicorn worker started with --preload) never reuses
+    connections opened by its parent.
+
+    With ``hard_ttl`` greater than ``ttl``, rows are kept until ``hard_ttl``
+    and lookup() returns them flagged stale once ``ttl`` has passed
+    (stale-while-revalidate); get() treats them as misses.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        namespace: str = "default",
+        ttl: float = DEFAULT_TTL,
+        hard_ttl: Optional[float] = None,
+        maxsize: int = DEFAULT_MAXSIZE,
+        write_batch: int = DEFAULT_WRITE_BATCH,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if hard_ttl is not None and hard_ttl < ttl:
+            raise ValueError("hard_ttl must not be less than ttl")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.path = path
+        self.namespace = namespace
+        self.ttl = ttl
+        self.hard_ttl = ttl if hard_ttl is None else hard_ttl
+        self.maxsize = maxsize
+        self.write_batch = max(1, write_batch)
+        self.flush_interval = flush_interval
+        self.pool_size = max(1, pool_size)
+        self._idle: List[sqlite3.Connection] = []
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Tuple[bytes, float]] = {}
+        self._flushing: Dict[str, Tuple[bytes, float]] = {}
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = False
+        self._flushes = 0
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._write_errors = 0
+        self._stale_hits = 0
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow an idle connection (or open one) and return it to the pool afterwards."""
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked: the parent's connections are not ours to use or close.
+                self._idle, self._pid = [], os.getpid()
+            conn = self._idle.pop() if self._idle else None
+            pid = self._pid
+        if conn is None:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                keep = len(self._idle) < self.pool_size and self._pid == pid
+                if keep:
+                    self._idle.append(conn)
+            if not keep:
+                conn.close()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        value, stale = self._lookup(key, allow_stale=False)
+        return value
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[Any], bool]:
+        """Return (value, stale); stale rows are served until hard_ttl."""
+        return self._lookup(key, allow_stale=True)
+
+    def _lookup(self, key: Hashable, allow_stale: bool) -> Tuple[Optional[Any], bool]:
+        # Rows store their hard expiry; they turn stale hard_ttl - ttl before it.
+        skey = str(key)
+        now = time.time()
+        with self._lock:
+            pending = self._pending.get(skey) or self._flushing.get(skey)
+        if pending is not None:
+            blob, expires_at = pending
+        else:
+            with self._connection() as conn:
+                row = conn.execute(
+                    "SELECT value, expires_at FROM results WHERE namespace = ? AND key = ?",
+                    (self.namespace, skey),
+                ).fetchone()
+            if row is None:
+                self._count(hit=False)
+                return None, False
+            blob, expires_at = row
+        stale = expires_at - (self.hard_ttl - self.ttl) <= now
+        if expires_at <= now or (stale and not allow_stale):
+            self._count(hit=False)
+            return None, False
+        self._count(hit=True, stale=stale)
+        return decode_result(blob), stale
+
+    def _count(self, hit: bool, stale: bool = False) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+                if stale:
+                    self._stale_hits += 1
+            else:
+                self._misses += 1
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + (self.ttl if ttl is None else ttl) + (self.hard_ttl - self.ttl)
+        blob = encode_result(value)
+        with self._lock:
+            self._pending[str(key)] = (blob, expires_at)
+            full = len(self._pending) >= self.write_batch
+            if not self._closed and (self._flusher is None or not self._flusher.is_alive()):
+                # Also restarts the flusher in a forked child, where it does not exist.
+                self._flusher = threading.Thread(target=self._flush_loop, name="sec4dev-sqlite-flush", daemon=True)
+                self._flusher.start()
+        if full:
+            self._wake.set()
+
+    def _flush_loop(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except sqlite3.Error:
+                # Counted in write_errors; the entries were put back for the next flush.
+                pass
+
+    def flush(self) -> None:
+        """Write buffered entries in one transaction (and prune periodically)."""
+        with self._flush_lock:
+            with self._lock:
+                # Entries stay readable from _flushing until they are committed.
+                pending, self._pending = self._pending, {}
+                self._flushing = pending
+            if not pending:
+                return
+            try:
+                with self._connection() as conn:
+                    try:
+                        conn.execute("BEGIN IMMEDIATE")
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO results (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                            [(self.namespace, k, blob, exp) for k, (blob, exp) in pending.items()],
+                        )
+                        conn.execute("COMMIT")
+                    except BaseException:
+                        if conn.in_transaction:
+                            conn.execute("ROLLBACK")
+                        with self._lock:
+                            # Keep newer writes made while this flush was running.
+                            self._pending = {**pending, **self._pending}
+                            self._write_errors += 1
+                        raise
+            finally:
+                with self._lock:
+                    self._flushing = {}
+        with self._lock:
+            self._flushes += 1
+            self._writes += len(pending)
+            prune = self._flushes % PRUNE_EVERY == 0
+        if prune:
+            self.prune()
+
+    def prune(self) -> int:
+        """Delete expired rows and trim to maxsize. Returns rows removed."""
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                removed = conn.execute(
+                    "DELETE FROM results WHERE expires_at <= ?", (time.time(),)
+                ).rowcount
+                (count,) = conn.execute(
+                    "SELECT COUNT(*) FROM results WHERE namespace = ?", (self.namespace,)
+                ).fetchone()
+                if count > self.maxsize:
+                    removed += conn.execute(
+                        "DELETE FROM results WHERE namespace = ? AND key IN ("
+                        "SELECT key FROM results WHERE namespace = ? ORDER BY expires_at LIMIT ?)",
+                        (self.namespace, self.namespace, count - self.maxsize),
+                    ).rowcount
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return removed
+
+    def delete(self, key: Hashable) -> None:
+        skey = str(key)
+        with self._lock:
+            self._pending.pop(skey, None)
+            self._flushing.pop(skey, None)
+        with self._connection() as conn:
+            conn.execute("DELETE FROM results WHERE namespace = ? AND key = ?", (self.namespace, skey))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+        with self._connection() as conn:
+            conn.execute("DELETE FROM results WHERE namespace = ?", (self.namespace,))
+
+    def __len__(self) -> int:
+        self.flush()
+        with self._connection() as conn:
+            (count,) = conn.execute(
+                "SELECT COUNT(*) FROM results WHERE namespace = ?", (self.namespace,)
+            ).fetchone()
+        return count
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters: hits (stale_hits of them served stale), misses, writes,
+        write_errors (failed flushes) and pending (unflushed) writes.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "writes": self._writes,
+                "write_errors": self._write_errors,
+                "pending": len(self._pending),
+            }
+
+    def close(self) -> None:
+        """Stop the background flusher, flush pending writes and close the pooled connections."""
+        with self._lock:
+            self._closed = True
+            flusher = self._flusher
+        self._wake.set()
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+        self.flush()
+        with self._lock:
+            connections, self._idle = self._idle, []
+        for conn in connections:
+            conn.close()
@@ -2,31 +2,157 @@
 
 import ipaddress
 import re
+from socket import AF_INET, AF_INET6, inet_ntop, inet_pton
+from typing import Dict, Iterable, List, NamedTuple, Optional
 
 from sec4dev.exceptions import ValidationError
 
 EMAIL_REGEX = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
 
+_V4_MAPPED_PREFIX = b"\x00" * 10 + b"\xff\xff"
+_ZERO_PREFIX = b"\x00" * 12
 
-def validate_email(email: str) -> None:
-    """Validate email format. Raises ValidationError if invalid."""
+
+class ValidatedBatch(NamedTuple):
+    """Result of a batch validator: a validity mask and canonical forms (None where invalid)."""
+
+    valid: List[bool]
+    canonical: List[Optional[str]]
+
+
+def validate_email(email: str) -> str:
+    """
+    Validate email format and return its canonical form (see canonical_email).
+    Raises ValidationError if invalid.
+    """
     if not email or not isinstance(email, str):
         raise ValidationError("Email is required", status_code=422)
-    email = email.strip()
-    if not email:
+    if not email.strip():
         raise ValidationError("Email cannot be empty", status_code=422)
-    if not EMAIL_REGEX.match(email):
+    canonical = canonical_email(email)
+    if canonical is None:
         raise ValidationError("Invalid email format", status_code=422)
+    return canonical
 
 
-def validate_ip(ip: str) -> None:
-    """Validate IP address (IPv4 or IPv6). Raises ValidationError if invalid."""
+def validate_ip(ip: str) -> str:
+    """
+    Validate IP address (IPv4 or IPv6) and return its canonical form (see
+    canonical_ip). Raises ValidationError if invalid.
+    """
     if not ip or not isinstance(ip, str):
         raise ValidationError("IP address is required", status_code=422)
-    ip = ip.strip()
-    if not ip:
+    if not ip.strip():
         raise ValidationError("IP address cannot be empty", status_code=422)
-    try:
-        ipaddress.ip_address(ip)
-    except ValueError:
+    canonical = canonical_ip(ip)
+    if canonical is None:
         raise ValidationError("Invalid IP address format", status_code=422)
+    return canonical
+
+
+def packed_ip(ip: str) -> Optional[bytes]:
+    """
+    The 4- or 16-byte form of an IP address string, or None if it is invalid.
+    IPv4-mapped IPv6 addresses (::ffff:a.b.c.d) unwrap to their IPv4 address;
+    an IPv6 scope ID ("%eth0") is dropped.
+    Parsed with inet_pton(), which accepts exactly what ipaddress does but
+    without building an address object.
+    """
+    ip = ip.strip()
+    try:
+        if ":" not in ip:
+            return inet_pton(AF_INET, ip)
+        if "%" in ip:
+            ip, _, scope_id = ip.partition("%")
+            if not scope_id or "%" in scope_id:
+                return None
+        packed = inet_pton(AF_INET6, ip)
+    except (OSError, ValueError):
+        return None
+    return packed[12:] if packed[:12] == _V4_MAPPED_PREFIX else packed
+
+
+def canonical_ip(ip: str) -> Optional[str]:
+    """
+    Canonical form of an IP address, or None if it is invalid: dotted-quad
+    IPv4 and compressed lowercase IPv6, with IPv4-mapped addresses unwrapped.
+    Equivalent inputs map to the same string, so it serves as a cache key.
+    """
+    if not isinstance(ip, str):
+        return None
+    packed = packed_ip(ip)
+    return format_packed_ip(packed) if packed is not None else None
+
+
+def format_packed_ip(packed: bytes) -> str:
+    """
+    Canonical string for a 4- or 16-byte address (see canonical_ip).
+    IPv4-mapped 16-byte addresses are written as IPv4.
+    """
+    if len(packed) == 16 and packed[:12] == _V4_MAPPED_PREFIX:
+        packed = packed[12:]
+    if len(packed) == 4:
+        return inet_ntop(AF_INET, packed)
+    if packed[:12] == _ZERO_PREFIX:
+        # inet_ntop() writes these with a dotted-quad tail (::0.0.0.2).
+        return str(ipaddress.IPv6Address(packed))
+    return inet_ntop(AF_INET6, packed)
+
+
+def canonical_email(email: str) -> Optional[str]:
+    """
+    Canonical form of an email address, or None if it is invalid: stripped,
+    with the domain normalized (see normalize_domain). The local part is
+    kept as given.
+    """
+    if not isinstance(email, str):
+        return None
+    email = email.strip()
+    if not EMAIL_REGEX.match(email):
+        return None
+    local, _, domain = email.rpartition("@")
+    return f"{local}@{normalize_domain(domain)}"
+
+
+def validate_ips(ips: Iterable[str]) -> ValidatedBatch:
+    """
+    Validate many IP addresses without raising.
+    Returns a mask of which inputs are valid and their canonical forms.
+    """
+    canonical = [canonical_ip(ip) for ip in ips]
+    return ValidatedBatch([value is not None for value in canonical], canonical)
+
+
+def validate_emails(emails: Iterable[str]) -> ValidatedBatch:
+    """
+    Validate many email addresses without raising.
+    Returns a mask of which inputs are valid and their canonical forms.
+    Each distinct domain is normalized once.
+    """
+    match = EMAIL_REGEX.match
+    domains: Dict[str, str] = {}
+    canonical: List[Optional[str]] = []
+    for email in emails:
+        if not isinstance(email, str) or not match(email.strip()):
+            canonical.append(None)
+            continue
+        local, _, domain = email.strip().rpartition("@")
+        normalized = domains.get(domain)
+        if normalized is None:
+            normalized = domains[domain] = normalize_domain(domain)
+        canonical.append(f"{local}@{normalized}")
+    return ValidatedBatch([value is not None for value in canonical], canonical)
+
+
+def normalize_domain(domain: str) -> str:
+    """Lowercase and IDNA-encode a domain (trailing dot removed)."""
+    domain = domain.strip().rstrip(".").lower()
+    try:
+        return domain.encode("idna").decode("ascii")
+    except UnicodeError:
+        return domain
+
+
+def email_domain(email: str) -> str:
+    """Normalized domain part of an email address."""
+    return normalize_domain(email.strip().rsplit("@", 1)[-1])
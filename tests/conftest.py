@@ -0,0 +1,28 @@
+"""Shared fixtures."""
+
+from unittest.mock import patch
+
+import pytest
+
+
+class FakeClock:
+    """Fake time.monotonic(): ``now`` only moves when a test (or sleep()) advances it."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+        self.slept = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Patch time.monotonic with a FakeClock for the duration of the test."""
+    c = FakeClock()
+    with patch("time.monotonic", c):
+        yield c
@@ -0,0 +1,111 @@
+"""Tests for AsyncSec4DevClient and the async HTTP path."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from sec4dev import AsyncSec4DevClient
+from sec4dev.exceptions import ServerError, ValidationError
+from sec4dev.http import async_request
+
+
+def _mock_response(data):
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+    mock_resp.json.return_value = data
+    mock_resp.headers = {}
+    return mock_resp
+
+
+def test_async_ip_check_returns_result():
+    mock_resp = _mock_response({
+        "ip": "203.0.113.42",
+        "classification": "hosting",
+        "confidence": 0.9,
+        "signals": {"is_hosting": True},
+        "network": {"asn": 16509, "provider": "AWS"},
+        "geo": {"country": "US"},
+    })
+
+    async def run():
+        with patch("sec4dev.ip.async_request", new=AsyncMock(return_value=(mock_resp, {}))):
+            async with AsyncSec4DevClient("sec4_test") as client:
+                result = await client.ip.check("203.0.113.42")
+                assert await client.ip.is_hosting("203.0.113.42") is True
+                assert await client.ip.is_vpn("203.0.113.42") is False
+        return result
+
+    result = asyncio.run(run())
+    assert result.classification == "hosting"
+    assert result.network.provider == "AWS"
+
+
+def test_async_email_is_disposable():
+    mock_resp = _mock_response({"email": "x@temp.com", "domain": "temp.com", "is_disposable": True})
+
+    async def run():
+        with patch("sec4dev.email.async_request", new=AsyncMock(return_value=(mock_resp, {}))):
+            async with AsyncSec4DevClient("sec4_test") as client:
+                return await client.email.is_disposable("x@temp.com")
+
+    assert asyncio.run(run()) is True
+
+
+def test_async_check_invalid_input_raises():
+    async def run():
+        async with AsyncSec4DevClient("sec4_test") as client:
+            with pytest.raises(ValidationError):
+                await client.ip.check("not-an-ip")
+            with pytest.raises(ValidationError):
+                await client.email.check("not-an-email")
+
+    asyncio.run(run())
+
+
+def test_async_request_retries_server_error():
+    calls = []
+
+    def handler(req):
+        calls.append(req)
+        if len(calls) == 1:
+            return httpx.Response(503, json={"detail": "busy"})
+        return httpx.Response(200, json={"ok": True})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            resp, _ = await async_request(
+                "POST", "https://api.test/ip/check", "sec4_k", json={}, retry_delay_ms=0, client=client
+            )
+            return resp.json()
+
+    assert asyncio.run(run()) == {"ok": True}
+    assert len(calls) == 2
+
+
+def test_async_request_raises_after_retries():
+    async def run():
+        transport = httpx.MockTransport(lambda req: httpx.Response(500, json={"detail": "down"}))
+        async with httpx.AsyncClient(transport=transport) as client:
+            await async_request("POST", "https://api.test/ip/check", "sec4_k", retries=0, client=client)
+
+    with pytest.raises(ServerError):
+        asyncio.run(run())
+
+
+def test_async_request_is_cancellable_during_backoff():
+    async def run():
+        transport = httpx.MockTransport(
+            lambda req: httpx.Response(429, headers={"retry-after": "60"}, json={})
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            task = asyncio.ensure_future(
+                async_request("POST", "https://api.test/ip/check", "sec4_k", client=client)
+            )
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(asyncio.wait_for(run(), timeout=5))
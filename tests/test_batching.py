@@ -0,0 +1,122 @@
+"""Tests for the micro-batching front ends."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sec4dev import AsyncSec4DevClient, Sec4DevClient
+from sec4dev.batching import AsyncBatchCollector, BatchCollector
+from sec4dev.exceptions import ValidationError
+
+
+def test_batch_collector_groups_concurrent_submits():
+    batches = []
+
+    def dispatch(items):
+        batches.append(list(items))
+        return {item: item.upper() for item in items}
+
+    with BatchCollector(dispatch, max_items=50, max_wait_ms=50) as batcher:
+        futures = [batcher.submit(f"item{i}") for i in range(10)]
+        results = [f.result(timeout=2) for f in futures]
+
+    assert results == [f"ITEM{i}" for i in range(10)]
+    assert len(batches) == 1
+    assert batcher.stats()["items"] == 10
+
+
+def test_batch_collector_respects_max_items():
+    batches = []
+
+    def dispatch(items):
+        batches.append(len(items))
+        return {item: item for item in items}
+
+    with BatchCollector(dispatch, max_items=3, max_wait_ms=200) as batcher:
+        futures = [batcher.submit(str(i)) for i in range(7)]
+        for f in futures:
+            f.result(timeout=2)
+    assert max(batches) <= 3
+    assert sum(batches) == 7
+
+
+def test_batch_collector_propagates_errors():
+    def dispatch(items):
+        return {item: ValueError(item) for item in items}
+
+    with BatchCollector(dispatch, max_wait_ms=1) as batcher:
+        with pytest.raises(ValueError):
+            batcher.check("bad", timeout=2)
+
+    with pytest.raises(RuntimeError):
+        batcher.submit("late")
+
+
+def test_batch_collector_fails_items_missing_from_the_outcome():
+    with BatchCollector(lambda items: {}, max_wait_ms=1) as batcher:
+        with pytest.raises(RuntimeError, match="no outcome"):
+            batcher.check("lost", timeout=2)
+
+
+def test_async_collector_cancels_callers_when_the_batch_is_cancelled():
+    started = asyncio.Event()
+
+    async def dispatch(items):
+        started.set()
+        await asyncio.sleep(10)
+
+    async def run():
+        batcher = AsyncBatchCollector(dispatch, max_wait_ms=1)
+        future = batcher.submit("x")
+        await started.wait()
+        for task in list(batcher._tasks):
+            task.cancel()
+        await asyncio.gather(*batcher._tasks, return_exceptions=True)
+        return future
+
+    assert asyncio.run(run()).cancelled()
+
+
+def test_ip_batched_front_end_from_threads():
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"ip": "203.0.113.1", "classification": "hosting", "confidence": 0.9}
+    results = {}
+
+    with patch("sec4dev.ip.request", return_value=(mock_resp, {})):
+        client = Sec4DevClient("sec4_test")
+        with client.ip.batched(max_items=20, max_wait_ms=20) as batcher:
+            def call(ip):
+                try:
+                    results[ip] = batcher.check(ip, timeout=2)
+                except Exception as e:
+                    results[ip] = e
+
+            threads = [threading.Thread(target=call, args=(ip,)) for ip in ("203.0.113.1", "bad")]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+    assert results["203.0.113.1"].classification == "hosting"
+    assert isinstance(results["bad"], ValidationError)
+
+
+def test_async_batched_front_end():
+    async def fake_request(method, url, api_key, json=None, **kwargs):
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"email": json["email"], "domain": "x.com", "is_disposable": True}
+        return mock_resp, {}
+
+    async def run():
+        with patch("sec4dev.email.async_request", new=AsyncMock(side_effect=fake_request)):
+            async with AsyncSec4DevClient("sec4_test") as client:
+                async with client.email.batched(max_items=10, max_wait_ms=10) as batcher:
+                    results = await asyncio.gather(*(batcher.check(f"u{i}@x.com") for i in range(25)))
+                    stats = batcher.stats()
+        return results, stats
+
+    results, stats = asyncio.run(run())
+    assert [r.email for r in results] == [f"u{i}@x.com" for i in range(25)]
+    assert stats["batches"] == 3
@@ -0,0 +1,165 @@
+"""Tests for the client-side circuit breaker."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from sec4dev import AsyncSec4DevClient, Sec4DevClient
+from sec4dev.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from sec4dev.exceptions import CircuitOpenError, DeadlineExceededError, RateLimitError, ServerError
+from sec4dev.http import async_request, request
+from sec4dev.ratelimit import RateLimiter
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record(False)
+    breaker.before_call()
+    breaker.record(True)
+    assert breaker.state == CLOSED
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record(False)
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.retry_after == pytest.approx(10)
+    assert breaker.stats() == {"state": OPEN, "opens": 1, "rejections": 1}
+
+
+def test_opens_on_error_rate(clock):
+    breaker = CircuitBreaker(failure_threshold=None, error_rate=0.5, window_size=10, min_calls=4)
+    for success in (True, False, True, False):
+        breaker.before_call()
+        breaker.record(success)
+    assert breaker.state == OPEN
+
+
+def test_half_open_admits_limited_probes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, half_open_max_calls=1)
+    breaker.before_call()
+    breaker.record(False)
+    clock.now += 10
+    assert breaker.state == HALF_OPEN
+
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record(False)
+    assert breaker.state == OPEN
+
+    clock.now += 10
+    breaker.before_call()
+    breaker.record(True)
+    assert breaker.state == CLOSED
+    breaker.before_call()
+
+
+def test_lost_probe_is_forgotten(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.before_call()
+    breaker.record(False)
+    clock.now += 10
+    breaker.before_call()  # probe never reports back
+    clock.now += 10
+    breaker.before_call()
+
+
+def test_request_fails_fast_while_open():
+    calls = []
+
+    def handler(req):
+        calls.append(req)
+        return httpx.Response(503, json={"detail": "down"})
+
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        with patch("sec4dev.http.time.sleep") as sleep:
+            with pytest.raises(CircuitOpenError):
+                request("POST", "https://api.test/ip/check", "sec4_test", client=client, retries=3, breaker=breaker)
+            with pytest.raises(CircuitOpenError):
+                request("POST", "https://api.test/ip/check", "sec4_test", client=client, breaker=breaker)
+
+    assert len(calls) == 2
+    assert sleep.call_count == 2
+
+
+def _half_open_breaker(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.before_call()
+    breaker.record(False)
+    clock.now += 10
+    assert breaker.state == HALF_OPEN
+    return breaker
+
+
+def test_rate_limited_request_does_not_hold_the_probe_slot(clock):
+    breaker = _half_open_breaker(clock)
+    limiter = RateLimiter(rate=1, burst=1, fail_fast=True)
+    limiter.acquire()
+    with pytest.raises(RateLimitError):
+        request("POST", "https://api.test/ip/check", "sec4_test", breaker=breaker, limiter=limiter)
+    breaker.before_call()
+
+
+def test_deadline_spent_waiting_for_the_limiter_does_not_hold_the_probe_slot(clock):
+    class SlowLimiter:
+        def acquire(self, max_wait=None):
+            clock.now += 1
+
+        async def acquire_async(self, max_wait=None):
+            clock.now += 1
+
+    breaker = _half_open_breaker(clock)
+    with pytest.raises(DeadlineExceededError):
+        request("POST", "https://api.test/ip/check", "sec4_test", breaker=breaker, limiter=SlowLimiter(), deadline_ms=500)
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(async_request(
+            "POST", "https://api.test/ip/check", "sec4_test", breaker=breaker, limiter=SlowLimiter(), deadline_ms=500
+        ))
+    breaker.before_call()
+
+
+def test_client_errors_do_not_trip():
+    def handler(req):
+        return httpx.Response(404, json={"detail": "nope"})
+
+    breaker = CircuitBreaker(failure_threshold=1)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        for _ in range(3):
+            with pytest.raises(Exception):
+                request("POST", "https://api.test/ip/check", "sec4_test", client=client, breaker=breaker)
+    assert breaker.state == CLOSED
+
+
+def test_async_request_uses_breaker():
+    def handler(req):
+        return httpx.Response(500, json={"detail": "down"})
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(ServerError):
+                await async_request("POST", "https://api.test/ip/check", "sec4_test", client=client, retries=0, breaker=breaker)
+            with pytest.raises(CircuitOpenError):
+                await async_request("POST", "https://api.test/ip/check", "sec4_test", client=client, retries=0, breaker=breaker)
+
+    asyncio.run(run())
+
+
+def test_clients_share_breaker_across_services():
+    breaker = CircuitBreaker()
+    client = Sec4DevClient("sec4_test", circuit_breaker=breaker)
+    assert client.circuit_breaker is breaker
+    assert client.ip._circuit_breaker is breaker
+    assert client.email._circuit_breaker is breaker
+    async_client = AsyncSec4DevClient("sec4_test", circuit_breaker=breaker)
+    assert async_client.ip._circuit_breaker is breaker
+    client.close()
+    asyncio.run(async_client.aclose())
@@ -0,0 +1,92 @@
+"""Tests for check_many bulk APIs (mocked HTTP)."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sec4dev import AsyncSec4DevClient, Sec4DevClient
+from sec4dev.bulk import run_many
+from sec4dev.exceptions import ServerError, ValidationError
+
+
+def _ip_response(ip):
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+    mock_resp.json.return_value = {"ip": ip, "classification": "hosting", "confidence": 0.9}
+    mock_resp.headers = {}
+    return mock_resp
+
+
+def _fake_request(method, url, api_key, json=None, **kwargs):
+    if json["ip"] == "198.51.100.1":
+        raise ServerError("boom", 500)
+    return _ip_response(json["ip"]), {}
+
+
+def test_ip_check_many_dedupes_and_collects_errors():
+    with patch("sec4dev.ip.request", side_effect=_fake_request) as mock_request:
+        client = Sec4DevClient("sec4_test")
+        results = client.ip.check_many(
+            ["203.0.113.1", "bad", "203.0.113.1", " 203.0.113.1 ", "198.51.100.1"],
+            concurrency=4,
+        )
+
+    assert list(results) == ["203.0.113.1", "bad", " 203.0.113.1 ", "198.51.100.1"]
+    assert results["203.0.113.1"].ip == "203.0.113.1"
+    assert results[" 203.0.113.1 "] is results["203.0.113.1"]
+    assert isinstance(results["bad"], ValidationError)
+    assert isinstance(results["198.51.100.1"], ServerError)
+    assert mock_request.call_count == 2
+
+
+def test_run_many_bounds_concurrency():
+    lock = threading.Lock()
+    active = [0, 0]
+    barrier = threading.Event()
+
+    def work(item):
+        with lock:
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        barrier.wait(0.01)
+        with lock:
+            active[0] -= 1
+        return item
+
+    results = run_many(work, [str(i) for i in range(50)], concurrency=3)
+    assert len(results) == 50
+    assert active[1] <= 3
+
+
+def test_run_many_rejects_bad_concurrency():
+    with pytest.raises(ValueError):
+        run_many(str, ["a"], concurrency=0)
+
+
+def test_async_email_check_many():
+    async def fake_request(method, url, api_key, json=None, **kwargs):
+        email = json["email"]
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {
+            "email": email,
+            "domain": email.split("@")[1],
+            "is_disposable": email.endswith("temp.com"),
+        }
+        return mock_resp, {}
+
+    async def run():
+        with patch("sec4dev.email.async_request", new=AsyncMock(side_effect=fake_request)) as mock_request:
+            async with AsyncSec4DevClient("sec4_test") as client:
+                results = await client.email.check_many(
+                    ["a@temp.com", "b@gmail.com", "a@temp.com", "nope"], concurrency=2
+                )
+            return results, mock_request.await_count
+
+    results, calls = asyncio.run(run())
+    assert list(results) == ["a@temp.com", "b@gmail.com", "nope"]
+    assert results["a@temp.com"].is_disposable is True
+    assert results["b@gmail.com"].is_disposable is False
+    assert isinstance(results["nope"], ValidationError)
+    assert calls == 2
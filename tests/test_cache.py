@@ -0,0 +1,103 @@
+"""Tests for result caches."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sec4dev import Sec4DevClient
+from sec4dev.cache import CacheBackend, TTLCache
+
+
+def test_ttl_cache_hit_and_miss():
+    cache = TTLCache(maxsize=2, ttl=60)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_cache_expires_entries(clock):
+    cache = TTLCache(maxsize=10, ttl=5)
+    cache.set("a", 1)
+    clock.now += 4.9
+    assert cache.get("a") == 1
+    clock.now += 0.2
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_ttl_cache_rejects_bad_config():
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=0)
+    with pytest.raises(ValueError):
+        TTLCache(ttl=0)
+
+
+def test_cache_backend_requires_the_whole_interface():
+    class GetOnly(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnly()
+
+
+def test_ip_service_serves_from_cache():
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"ip": "203.0.113.42", "classification": "hosting", "confidence": 0.9}
+
+    with patch("sec4dev.ip.request", return_value=(mock_resp, {})) as mock_request:
+        client = Sec4DevClient("sec4_test", ip_cache=TTLCache(maxsize=100, ttl=60))
+        first = client.ip.check("203.0.113.42")
+        second = client.ip.check(" 203.0.113.42 ")
+        mapped = client.ip.check("::ffff:203.0.113.42")
+
+    assert first is second is mapped
+    assert mock_request.call_count == 1
+    assert client.ip.cache.stats()["hits"] == 2
+
+
+def test_services_without_cache_always_request():
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"email": "a@b.com", "domain": "b.com", "is_disposable": False}
+
+    with patch("sec4dev.email.request", return_value=(mock_resp, {})) as mock_request:
+        client = Sec4DevClient("sec4_test")
+        client.email.check("a@b.com")
+        client.email.check("a@b.com")
+
+    assert client.email.cache is None
+    assert mock_request.call_count == 2
+
+
+def test_email_cache_is_keyed_by_domain():
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"email": "a@gmail.com", "domain": "gmail.com", "is_disposable": False}
+
+    with patch("sec4dev.email.request", return_value=(mock_resp, {})) as mock_request:
+        client = Sec4DevClient("sec4_test", email_cache=TTLCache(maxsize=100, ttl=60))
+        client.email.check("a@gmail.com")
+        other = client.email.check("b@GMAIL.com.")
+
+    assert mock_request.call_count == 1
+    assert other.email == "b@GMAIL.com."
+    assert other.domain == "gmail.com"
+    assert other.is_disposable is False
+    stats = client.email.stats()
+    assert (stats["api_calls"], stats["calls_avoided"], stats["local_answers"]) == (1, 1, 0)
@@ -0,0 +1,177 @@
+"""Tests for the sec4dev command-line enrichment tool (mocked HTTP)."""
+
+import csv
+import io
+import json as json_lib
+import random
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from sec4dev.cli import enrich, main
+
+
+def _fake_ip_request(method, url, api_key, json=None, **kwargs):
+    ip = json["ip"]
+    time.sleep(random.random() / 200)
+    mock_resp = MagicMock()
+    body = {"ip": ip, "classification": "hosting", "confidence": 0.9, "network": {"asn": 16509}}
+    mock_resp.content = json_lib.dumps(body).encode()
+    return mock_resp, {}
+
+
+def test_enrich_keeps_input_order_with_bounded_window():
+    in_flight = []
+
+    def check(value):
+        time.sleep(random.random() / 500)
+        return value * 2
+
+    def rows():
+        for i in range(200):
+            in_flight.append(i - len(seen))
+            yield {"n": i}, i
+
+    seen = []
+    for row, result, error in enrich(rows(), check, concurrency=4):
+        seen.append(row["n"])
+        assert result == row["n"] * 2 and error is None
+
+    assert seen == list(range(200))
+    assert max(in_flight) <= 8
+
+
+def test_csv_rows_are_enriched_in_order(tmp_path, capsys):
+    source = tmp_path / "ips.csv"
+    source.write_text("id,ip\n" + "".join(f"{i},203.0.113.{i}\n" for i in range(50)) + "50,not-an-ip\n")
+
+    with patch("sec4dev.ip.request", side_effect=_fake_ip_request):
+        assert main(["ip", str(source), "-j", "8", "--api-key", "sec4_test"]) == 0
+
+    captured = capsys.readouterr()
+    rows = list(csv.DictReader(io.StringIO(captured.out)))
+    assert [row["id"] for row in rows] == [str(i) for i in range(51)]
+    assert rows[0]["sec4dev_classification"] == "hosting"
+    assert rows[0]["sec4dev_asn"] == "16509"
+    assert rows[-1]["sec4dev_error"] == "Invalid IP address format"
+    assert "done, 51 rows" in captured.err
+    assert "1 errors" in captured.err
+
+
+def test_jsonl_from_stdin(monkeypatch, capsys):
+    lines = [{"user": "a", "email": "a@tempmail.com"}, {"user": "b"}]
+    monkeypatch.setattr("sys.stdin", io.StringIO("".join(json_lib.dumps(line) + "\n" for line in lines)))
+    mock_resp = MagicMock()
+    mock_resp.content = b'{"email": "a@tempmail.com", "domain": "tempmail.com", "is_disposable": true}'
+
+    with patch("sec4dev.email.request", return_value=(mock_resp, {})):
+        assert main(["email", "-f", "jsonl", "--api-key", "sec4_test"]) == 0
+
+    out = [json_lib.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert out[0]["sec4dev"] == {"domain": "tempmail.com", "is_disposable": True}
+    assert out[1]["user"] == "b"
+    assert out[1]["sec4dev"]["error"] == "Email is required"
+
+
+def test_missing_column_and_api_key(tmp_path, monkeypatch):
+    source = tmp_path / "rows.csv"
+    source.write_text("id,addr\n1,203.0.113.1\n")
+    with pytest.raises(SystemExit, match="column 'ip' not found"):
+        main(["ip", str(source), "--api-key", "sec4_test"])
+
+    monkeypatch.delenv("SEC4DEV_API_KEY", raising=False)
+    with pytest.raises(SystemExit):
+        main(["ip", str(source), "-c", "addr"])
+
+
+def test_bad_jsonl_lines_are_reported_and_the_run_continues(monkeypatch, capsys):
+    lines = ['{"email": "a@gmail.com"}', "[1, 2]", "{not json", '{"email": "b@gmail.com"}']
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(lines) + "\n"))
+    mock_resp = MagicMock()
+    mock_resp.content = b'{"domain": "gmail.com", "is_disposable": false}'
+
+    with patch("sec4dev.email.request", return_value=(mock_resp, {})):
+        assert main(["email", "-f", "jsonl", "--api-key", "sec4_test"]) == 0
+
+    captured = capsys.readouterr()
+    out = [json_lib.loads(line) for line in captured.out.splitlines()]
+    assert [row.get("email") or row["input"] for row in out] == ["a@gmail.com", "[1, 2]", "{not json", "b@gmail.com"]
+    assert out[1]["sec4dev"]["error"] == "<stdin>:2: not a JSON object"
+    assert out[2]["sec4dev"]["error"].startswith("<stdin>:3: invalid JSON")
+    assert out[3]["sec4dev"] == {"domain": "gmail.com", "is_disposable": False}
+    assert "2 errors" in captured.err
+
+
+def test_rows_read_before_an_input_failure_are_written():
+    def rows():
+        yield {"n": 1}, 1
+        yield {"n": 2}, 2
+        raise OSError("disk gone")
+
+    seen = []
+    with pytest.raises(OSError):
+        for row, result, error in enrich(rows(), lambda value: value, concurrency=4):
+            seen.append(row["n"])
+    assert seen == [1, 2]
+
+
+def test_progress_counts_retried_statuses(tmp_path, capsys):
+    source = tmp_path / "ips.csv"
+    source.write_text("ip\n203.0.113.1\n")
+    responses = iter([httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(503)])
+
+    def handler(req):
+        return next(responses, None) or httpx.Response(200, json={"ip": "203.0.113.1", "classification": "hosting"})
+
+    def mock_http_client(*args, **kwargs):
+        return httpx.Client(transport=httpx.MockTransport(handler))
+
+    with patch("sec4dev.client.create_http_client", side_effect=mock_http_client), patch(
+        "sec4dev.http._backoff_seconds", return_value=0.0
+    ):
+        assert main(["ip", str(source), "--api-key", "sec4_test", "--retries", "3"]) == 0
+
+    assert "1 rate limited (429), 1 server errors" in capsys.readouterr().err
+
+
+def test_csv_inputs_must_share_a_header(tmp_path, capsys):
+    first, reordered, other = tmp_path / "a.csv", tmp_path / "b.csv", tmp_path / "c.csv"
+    first.write_text("id,ip\n1,203.0.113.1\n")
+    reordered.write_text("ip,id\n203.0.113.2,2\n")
+    other.write_text("ip,host\n203.0.113.3,x\n")
+
+    with patch("sec4dev.ip.request", side_effect=_fake_ip_request):
+        assert main(["ip", str(first), str(reordered), "--api-key", "sec4_test"]) == 0
+        rows = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+        assert [(row["id"], row["ip"]) for row in rows] == [("1", "203.0.113.1"), ("2", "203.0.113.2")]
+
+        with pytest.raises(SystemExit, match="does not match"):
+            main(["ip", str(first), str(other), "--api-key", "sec4_test"])
+
+
+def test_json_input_is_not_guessed_to_be_jsonl(tmp_path, capsys):
+    source = tmp_path / "rows.json"
+    source.write_text('[{"ip": "203.0.113.1"}]')
+    with pytest.raises(SystemExit):
+        main(["ip", str(source), "--api-key", "sec4_test"])
+    assert "--format jsonl" in capsys.readouterr().err
+
+
+def test_closed_output_pipe_and_interrupt_exit_cleanly(tmp_path, monkeypatch, capsys):
+    source = tmp_path / "ips.csv"
+    source.write_text("ip\n203.0.113.1\n")
+
+    class ClosedPipe(io.StringIO):
+        def write(self, text):
+            raise BrokenPipeError()
+
+    monkeypatch.setattr("sys.stdout", ClosedPipe())
+    with patch("sec4dev.ip.request", side_effect=_fake_ip_request):
+        assert main(["ip", str(source), "--api-key", "sec4_test"]) == 1
+    monkeypatch.undo()
+
+    with patch("sec4dev.ip.request", side_effect=KeyboardInterrupt):
+        assert main(["ip", str(source), "--api-key", "sec4_test"]) == 130
+    assert "sec4dev: interrupted" in capsys.readouterr().err
@@ -0,0 +1,125 @@
+"""Tests for columnar IP result sets."""
+
+import asyncio
+import json as json_lib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sec4dev import AsyncSec4DevClient, Sec4DevClient
+from sec4dev.columnar import SIGNAL_FLAGS, IPResultColumns
+from sec4dev.exceptions import ServerError, ValidationError
+from sec4dev.ip import _build_result
+
+AWS = _build_result(
+    {
+        "ip": "203.0.113.42",
+        "classification": "hosting",
+        "confidence": 0.5,
+        "signals": {"is_hosting": True, "is_vpn": True},
+        "network": {"asn": 4200000000, "org": "Amazon", "provider": "AWS"},
+        "geo": {"country": "US"},
+    },
+    "203.0.113.42",
+)
+
+
+def _columns():
+    columns = IPResultColumns()
+    columns.append("203.0.113.42", AWS)
+    columns.append("bad", ValidationError("Invalid IP address format", 422))
+    columns.append("::ffff:198.51.100.7", _build_result({"classification": "residential", "confidence": 0.25}, "::ffff:198.51.100.7"))
+    columns.append("2001:db8::1", _build_result({"classification": "satellite", "confidence": 1.0}, "2001:db8::1"))
+    return columns
+
+
+def test_rows_round_trip():
+    columns = _columns()
+    assert len(columns) == 4
+    assert list(columns.ok) == [1, 0, 1, 1]
+    assert columns.ips() == ["203.0.113.42", "bad", "198.51.100.7", "2001:db8::1"]
+    assert columns.result(0) == AWS
+    assert columns.signals[0] == SIGNAL_FLAGS["is_hosting"] | SIGNAL_FLAGS["is_vpn"]
+    assert columns.result(-1).classification == "satellite"
+    assert columns.categories["classification"][columns.classification[3]] == "satellite"
+    assert list(columns.org) == [0, -1, -1, -1]
+    with pytest.raises(ValidationError):
+        columns.result(1)
+    assert columns.nbytes == 4 * 44
+
+
+def test_many_distinct_classifications():
+    columns = IPResultColumns()
+    for i in range(300):
+        columns.append("203.0.113.42", AWS.model_copy(update={"classification": f"class{i}"}))
+    assert columns.result(299).classification == "class299"
+    assert list(columns.to_pandas()["classification"][-2:]) == ["class298", "class299"]
+
+    full = IPResultColumns()
+    full._dictionaries["classification"].limit = len(full.categories["classification"])
+    with pytest.raises(ValueError, match="distinct values"):
+        full.append("203.0.113.42", AWS.model_copy(update={"classification": "new"}))
+    assert len(full) == 0
+
+
+def test_to_numpy_shares_memory():
+    np = pytest.importorskip("numpy")
+    columns = _columns()
+    arrays = columns.to_numpy()
+    assert arrays["ip"].shape == (4, 16)
+    assert arrays["asn"].dtype == np.uint32 and arrays["asn"][0] == 4200000000
+    assert arrays["confidence"].dtype == np.float32
+    columns.confidence[0] = 0.75
+    assert arrays["confidence"][0] == np.float32(0.75)
+
+
+def test_to_pandas_and_arrow():
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    columns = _columns()
+
+    frame = columns.to_pandas()
+    assert list(frame["ip"]) == columns.ips()
+    assert isinstance(frame["classification"].dtype, pd.CategoricalDtype)
+    assert list(frame["is_vpn"]) == [True, False, False, False]
+    assert frame["asn"].isna().tolist() == [False, True, True, True]
+
+    table = columns.to_arrow()
+    assert table.num_rows == 4
+    assert table.column("provider").to_pylist() == ["AWS", None, None, None]
+    assert table.column("classification").to_pylist() == ["hosting", None, "residential", "satellite"]
+
+
+def _fake_request(method, url, api_key, json=None, **kwargs):
+    if json["ip"] == "198.51.100.1":
+        raise ServerError("boom", 500)
+    mock_resp = MagicMock()
+    mock_resp.content = json_lib.dumps({"ip": json["ip"], "classification": "hosting", "confidence": 0.9}).encode()
+    return mock_resp, {}
+
+
+def test_check_many_columns_keeps_every_input_in_order():
+    ips = [f"203.0.113.{i % 7}" for i in range(100)] + ["198.51.100.1", "bad"]
+    with patch("sec4dev.ip.request", side_effect=_fake_request) as mock_request:
+        with Sec4DevClient("sec4_test") as client:
+            columns = client.ip.check_many_columns(ips, concurrency=2)
+
+    assert columns.ips()[:100] == ips[:100]
+    assert sum(columns.ok) == 100
+    assert isinstance(columns.errors[100], ServerError)
+    assert isinstance(columns.errors[101], ValidationError)
+    assert mock_request.call_count <= 7 * 4 + 1
+
+
+def test_async_check_many_columns():
+    async def fake_request(*args, **kwargs):
+        return _fake_request(*args, **kwargs)
+
+    async def run():
+        with patch("sec4dev.ip.async_request", new=AsyncMock(side_effect=fake_request)):
+            async with AsyncSec4DevClient("sec4_test") as client:
+                return await client.ip.check_many_columns(["203.0.113.1", "bad", "203.0.113.2"], concurrency=2)
+
+    columns = asyncio.run(run())
+    assert list(columns.ok) == [1, 0, 1]
+    assert columns.result(2).ip == "203.0.113.2"
@@ -0,0 +1,130 @@
+"""Tests for per-call deadlines and the client-wide retry budget."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from sec4dev import Sec4DevClient
+from sec4dev.budget import RetryBudget
+from sec4dev.exceptions import DeadlineExceededError, RateLimitError, ServerError
+from sec4dev.http import async_request, request
+
+URL = "https://api.test/ip/check"
+
+
+def _mock_client(handler):
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_deadline_never_sleeps_past_it():
+    calls = []
+
+    def handler(req):
+        calls.append(req)
+        return httpx.Response(503, json={"detail": "down"})
+
+    with _mock_client(handler) as client, patch("sec4dev.http.time.sleep") as sleep:
+        with pytest.raises(ServerError):
+            request("POST", URL, "sec4_test", client=client, retries=3, retry_delay_ms=1000, deadline_ms=200)
+
+    assert len(calls) == 1
+    sleep.assert_not_called()
+
+
+def test_deadline_skips_long_retry_after():
+    def handler(req):
+        return httpx.Response(429, json={"detail": "slow down"}, headers={"retry-after": "60"})
+
+    with _mock_client(handler) as client, patch("sec4dev.http.time.sleep") as sleep:
+        with pytest.raises(RateLimitError):
+            request("POST", URL, "sec4_test", client=client, retries=3, deadline_ms=5000)
+    sleep.assert_not_called()
+
+
+def test_expired_deadline_raises_before_sending():
+    handler = MagicMock(return_value=httpx.Response(200, json={}))
+    with _mock_client(handler) as client:
+        with pytest.raises(DeadlineExceededError):
+            request("POST", URL, "sec4_test", client=client, deadline_ms=0)
+    handler.assert_not_called()
+
+
+def test_attempt_timeouts_are_cut_to_deadline():
+    seen = []
+
+    def handler(req):
+        seen.append(req.extensions["timeout"])
+        return httpx.Response(200, json={})
+
+    with _mock_client(handler) as client:
+        request("POST", URL, "sec4_test", client=client, timeout_ms=30000, deadline_ms=250)
+
+    assert all(0 < value <= 0.25 for value in seen[0].values())
+
+
+def test_async_deadline_never_sleeps_past_it():
+    def handler(req):
+        return httpx.Response(503, json={"detail": "down"})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with patch("sec4dev.http.asyncio.sleep") as sleep:
+                with pytest.raises(ServerError):
+                    await async_request("POST", URL, "sec4_test", client=client, retry_delay_ms=1000, deadline_ms=200)
+            return sleep.call_count
+
+    assert asyncio.run(run()) == 0
+
+
+def test_retry_budget_limits_retries():
+    budget = RetryBudget(ratio=0.5, window=10, min_retries_per_second=0)
+    for _ in range(4):
+        budget.record_request()
+    assert [budget.try_retry() for _ in range(3)] == [True, True, False]
+    assert budget.stats() == {"requests": 4, "retries": 2, "exhausted": 1}
+
+
+def test_retry_budget_window_slides():
+    clock = MagicMock(return_value=100.0)
+    with patch("sec4dev.budget.time.monotonic", clock):
+        budget = RetryBudget(ratio=1.0, window=10, min_retries_per_second=0)
+        budget.record_request()
+        assert budget.try_retry() is True
+        assert budget.try_retry() is False
+        clock.return_value = 111.0
+        budget.record_request()
+        assert budget.try_retry() is True
+
+
+def test_spent_budget_stops_retrying():
+    calls = []
+
+    def handler(req):
+        calls.append(req)
+        return httpx.Response(503, json={"detail": "down"})
+
+    budget = RetryBudget(ratio=0, min_retries_per_second=0)
+    with _mock_client(handler) as client, patch("sec4dev.http.time.sleep"):
+        with pytest.raises(ServerError):
+            request("POST", URL, "sec4_test", client=client, retries=3, retry_budget=budget)
+
+    assert len(calls) == 1
+    assert budget.stats()["exhausted"] == 1
+
+
+def test_service_passes_deadline_and_budget():
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"ip": "203.0.113.42", "classification": "hosting", "confidence": 0.9}
+    budget = RetryBudget()
+
+    with patch("sec4dev.ip.request", return_value=(mock_resp, {})) as mock_request:
+        client = Sec4DevClient("sec4_test", deadline=500, retry_budget=budget)
+        client.ip.check("203.0.113.42")
+        client.ip.check("203.0.113.43", deadline=150)
+
+    first, second = mock_request.call_args_list
+    assert first.kwargs["deadline_ms"] == 500
+    assert second.kwargs["deadline_ms"] == 150
+    assert first.kwargs["retry_budget"] is budget
@@ -0,0 +1,197 @@
+"""Tests for hedged requests."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sec4dev import Sec4DevClient
+from sec4dev.exceptions import ServerError
+from sec4dev.hedging import HedgePolicy
+
+
+def _warm(policy, seconds=0.01, n=20):
+    for _ in range(n):
+        policy.record_latency(seconds)
+
+
+def test_delay_tracks_percentile():
+    policy = HedgePolicy(percentile=90, min_samples=10)
+    assert policy.delay() is None
+    for ms in range(1, 11):
+        policy.record_latency(ms / 1000.0)
+    assert policy.delay() == pytest.approx(0.009)
+
+
+def test_fast_call_is_not_hedged():
+    policy = HedgePolicy(max_ratio=1.0)
+    _warm(policy, 0.2)
+    fn = MagicMock(return_value="ok")
+    assert policy.run(fn) == "ok"
+    assert fn.call_count == 1
+    assert policy.stats()["hedges"] == 0
+    policy.close()
+
+
+def test_slow_call_is_hedged_and_hedge_wins():
+    policy = HedgePolicy(max_ratio=1.0)
+    _warm(policy)
+    calls = []
+    release = threading.Event()
+
+    def fn():
+        calls.append(1)
+        if len(calls) == 1:
+            release.wait(2)
+            return "slow"
+        return "fast"
+
+    assert policy.run(fn) == "fast"
+    release.set()
+    stats = policy.stats()
+    assert (stats["hedges"], stats["hedge_wins"]) == (1, 1)
+    policy.close()
+
+
+def test_unhedgeable_call_runs_on_the_callers_thread():
+    policy = HedgePolicy(max_ratio=0.0)
+    threads = []
+
+    def fn():
+        threads.append(threading.current_thread())
+        return "ok"
+
+    assert policy.run(fn) == "ok"
+    _warm(policy)
+    assert policy.run(fn) == "ok"
+    assert threads == [threading.current_thread()] * 2
+    assert policy._executor is None
+
+
+def test_losing_primary_latency_is_recorded():
+    policy = HedgePolicy(max_ratio=1.0, window=20)
+    _warm(policy)
+    calls = []
+    finished = threading.Event()
+
+    def fn():
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(0.2)
+            finished.set()
+            return "slow"
+        return "fast"
+
+    assert policy.run(fn) == "fast"
+    assert finished.wait(2)
+    deadline = time.monotonic() + 2
+    while max(policy._samples) < 0.2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert max(policy._samples) >= 0.2
+    assert len(policy._samples) == 20
+    policy.close()
+
+
+def test_hedges_are_capped():
+    policy = HedgePolicy(max_ratio=0.0)
+    _warm(policy)
+
+    def fn():
+        time.sleep(0.05)
+        return "ok"
+
+    assert policy.run(fn) == "ok"
+    assert policy.stats()["hedges"] == 0
+    policy.close()
+
+
+def test_failed_hedge_falls_back_to_primary():
+    policy = HedgePolicy(max_ratio=1.0)
+    _warm(policy)
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(0.05)
+            return "primary"
+        raise ServerError("boom", 503)
+
+    assert policy.run(fn) == "primary"
+    assert policy.stats()["hedge_wins"] == 0
+    policy.close()
+
+
+def test_async_loser_is_cancelled():
+    policy = HedgePolicy(max_ratio=1.0)
+    _warm(policy)
+    cancelled = []
+
+    async def run():
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+                return "slow"
+            return "fast"
+
+        result = await policy.run_async(fn)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == "fast"
+    assert cancelled == [True]
+    assert policy.stats()["hedge_wins"] == 1
+
+
+def test_ip_service_hedges_requests():
+    policy = HedgePolicy(max_ratio=1.0)
+    _warm(policy)
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"ip": "203.0.113.42", "classification": "hosting", "confidence": 0.9}
+    calls = []
+
+    def slow_then_fast(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(0.2)
+        return mock_resp, {}
+
+    with patch("sec4dev.ip.request", side_effect=slow_then_fast):
+        with Sec4DevClient("sec4_test", ip_hedge=policy) as client:
+            started = time.monotonic()
+            assert client.ip.check("203.0.113.42").classification == "hosting"
+            elapsed = time.monotonic() - started
+            assert client.ip.stats()["api_calls"] == 2
+
+    assert elapsed < 0.2
+    assert policy.stats()["hedge_wins"] == 1
+
+
+def test_hedge_gets_the_remaining_deadline():
+    policy = HedgePolicy(max_ratio=1.0)
+    _warm(policy)
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"ip": "203.0.113.42", "classification": "hosting", "confidence": 0.9}
+    deadlines = []
+
+    def slow_then_fast(*args, **kwargs):
+        deadlines.append(kwargs["deadline_ms"])
+        if len(deadlines) == 1:
+            time.sleep(0.2)
+        return mock_resp, {}
+
+    with patch("sec4dev.ip.request", side_effect=slow_then_fast):
+        with Sec4DevClient("sec4_test", ip_hedge=policy, deadline=1000) as client:
+            client.ip.check("203.0.113.42")
+
+    assert deadlines[0] <= 1000
+    assert deadlines[1] < deadlines[0]
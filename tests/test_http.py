@@ -0,0 +1,103 @@
+"""Tests for the HTTP layer (httpx.MockTransport, no network)."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from sec4dev import Sec4DevClient
+from sec4dev.exceptions import NotFoundError
+from sec4dev.http import (
+    available_json_backends,
+    decode_json,
+    json_backend,
+    request,
+    response_json,
+    set_json_backend,
+)
+
+
+def _mock_client(handler):
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_request_reuses_given_client():
+    seen = []
+
+    def handler(req):
+        seen.append(req.headers["x-api-key"])
+        return httpx.Response(200, json={"ok": True}, headers={"x-ratelimit-limit": "100"})
+
+    with _mock_client(handler) as client:
+        for _ in range(3):
+            resp, rate = request("POST", "https://api.test/ip/check", "sec4_k", json={}, client=client)
+            assert resp.json() == {"ok": True}
+            assert rate["limit"] == 100
+        assert not client.is_closed
+    assert seen == ["sec4_k"] * 3
+
+
+def test_request_maps_error_status():
+    with _mock_client(lambda req: httpx.Response(404, json={"detail": "nope"})) as client:
+        with pytest.raises(NotFoundError) as exc_info:
+            request("POST", "https://api.test/ip/check", "sec4_k", json={}, client=client)
+    assert exc_info.value.message == "nope"
+
+
+def test_services_share_client_pool():
+    client = Sec4DevClient("sec4_test", max_connections=5, max_keepalive_connections=2)
+    assert client.email._http_client is client.ip._http_client
+    client.close()
+    assert client._http_client.is_closed
+
+
+def test_client_context_manager_closes_pool():
+    with Sec4DevClient("sec4_test") as client:
+        pool = client._http_client
+        assert not pool.is_closed
+    assert pool.is_closed
+
+
+IP_BODY = (
+    b'{"ip":"203.0.113.42","classification":"hosting","confidence":0.93,'
+    b'"signals":{"is_hosting":true},"network":{"asn":16509,"org":"Amazon.com, Inc.","provider":"AWS"},'
+    b'"geo":{"country":"US","region":"Virginia"}}'
+)
+
+
+@pytest.fixture
+def restore_backend():
+    previous = json_backend()
+    yield
+    set_json_backend(previous)
+
+
+@pytest.mark.parametrize("backend", available_json_backends())
+def test_json_backends_decode_alike(backend, restore_backend):
+    set_json_backend(backend)
+    assert json_backend() == backend
+    assert decode_json(IP_BODY) == json.loads(IP_BODY)
+
+    def handler(req):
+        return httpx.Response(200, content=IP_BODY)
+
+    with Sec4DevClient("sec4_test") as client:
+        with patch.object(client.ip, "_http_client", _mock_client(handler)):
+            result = client.ip.check("203.0.113.42")
+    assert result.network.asn == 16509
+    assert result.signals.is_hosting is True
+
+
+def test_response_json_falls_back_without_bytes_content():
+    assert response_json(httpx.Response(200, content=IP_BODY)) == json.loads(IP_BODY)
+    stub = MagicMock()
+    stub.json.return_value = {"ok": True}
+    assert response_json(stub) == {"ok": True}
+
+
+def test_unknown_json_backend_is_rejected(restore_backend):
+    assert available_json_backends()[-1] == "json"
+    with pytest.raises(ValueError):
+        set_json_backend("simdjson")
+    assert set_json_backend() == available_json_backends()[0]
@@ -0,0 +1,58 @@
+"""Import-time budget for `import sec4dev` (runs a fresh interpreter)."""
+
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+import sec4dev
+
+# Cumulative microseconds for `import sec4dev`. Eager imports of httpx and
+# pydantic cost well over 100ms; the lazy package takes a few ms.
+IMPORT_BUDGET_US = 50_000
+HEAVY_MODULES = ("httpx", "pydantic", "sec4dev.client", "sec4dev.models")
+
+
+def _import_times(statement: str) -> Dict[str, int]:
+    """Cumulative import time in microseconds per module, from -X importtime."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_stays_within_budget():
+    times = min((_import_times("import sec4dev") for _ in range(3)), key=lambda t: t["sec4dev"])
+    assert times["sec4dev"] < IMPORT_BUDGET_US
+    assert not [name for name in HEAVY_MODULES if name in times]
+
+
+def test_public_names_resolve_lazily():
+    times = _import_times("import sec4dev; sec4dev.Sec4DevClient")
+    assert "httpx" in times
+    for name in sec4dev.__all__:
+        assert getattr(sec4dev, name) is not None
+    assert set(sec4dev.__all__) <= set(dir(sec4dev))
+    with pytest.raises(AttributeError):
+        sec4dev.NoSuchName
+
+
+def test_submodules_resolve_as_attributes():
+    proc = subprocess.run(
+        [sys.executable, "-c", "import sec4dev; print(sec4dev.http.__name__, sec4dev.ip.IPService.__name__)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert proc.stdout.split() == ["sec4dev.http", "IPService"]
@@ -0,0 +1,161 @@
+"""Tests for the request metrics registry (httpx.MockTransport, no network)."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from sec4dev import Sec4DevClient
+from sec4dev.cache import TTLCache
+from sec4dev.exceptions import NotFoundError
+from sec4dev.http import async_request, request
+from sec4dev.metrics import MetricsRegistry
+
+URL = "https://api.test/api/v1/ip/check"
+
+
+def _flaky(failures):
+    calls = []
+
+    def handler(req):
+        calls.append(req)
+        if len(calls) <= failures:
+            return httpx.Response(503, json={"detail": "busy"})
+        return httpx.Response(200, json={"ok": True})
+
+    return handler
+
+
+def test_request_records_attempts_retries_and_statuses():
+    metrics = MetricsRegistry()
+    with httpx.Client(transport=httpx.MockTransport(_flaky(2))) as client:
+        request("POST", URL, "sec4_k", json={}, client=client, retry_delay_ms=1, metrics=metrics)
+        with pytest.raises(NotFoundError):
+            with httpx.Client(transport=httpx.MockTransport(lambda req: httpx.Response(404))) as missing:
+                request("POST", URL, "sec4_k", json={}, client=missing, metrics=metrics)
+
+    endpoint = metrics.snapshot()["endpoints"]["/api/v1/ip/check"]
+    assert endpoint["requests"] == 2
+    assert endpoint["in_flight"] == 0
+    assert endpoint["attempts"] == 4
+    assert endpoint["retries"] == 2
+    assert 0 < endpoint["sleep_seconds"] < 1
+    assert endpoint["statuses"] == {503: 2, 200: 1, 404: 1}
+    latency = endpoint["latency"]
+    assert latency["count"] == 4
+    assert latency["buckets"][-1] == (float("inf"), 4)
+    counts = [count for _, count in latency["buckets"]]
+    assert counts == sorted(counts)
+
+
+def test_transport_errors_and_in_flight():
+    metrics = MetricsRegistry()
+    seen_in_flight = []
+
+    def handler(req):
+        seen_in_flight.append(metrics.snapshot()["endpoints"]["/api/v1/ip/check"]["in_flight"])
+        raise httpx.ConnectError("refused")
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(Exception):
+            request("POST", URL, "sec4_k", json={}, client=client, retries=1, retry_delay_ms=1, metrics=metrics)
+
+    endpoint = metrics.snapshot()["endpoints"]["/api/v1/ip/check"]
+    assert seen_in_flight == [1, 1]
+    assert endpoint["in_flight"] == 0
+    assert endpoint["errors"] == {"ConnectError": 2}
+    assert endpoint["retries"] == 1
+
+
+def test_async_request_records_metrics():
+    metrics = MetricsRegistry()
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_flaky(1))) as client:
+            await async_request("POST", URL, "sec4_k", json={}, client=client, retry_delay_ms=1, metrics=metrics)
+
+    asyncio.run(run())
+    endpoint = metrics.snapshot()["endpoints"]["/api/v1/ip/check"]
+    assert (endpoint["attempts"], endpoint["retries"], endpoint["statuses"]) == (2, 1, {503: 1, 200: 1})
+
+
+def test_counts_from_many_threads_are_summed():
+    metrics = MetricsRegistry(buckets=(0.5,))
+
+    def work():
+        for _ in range(1000):
+            counters = metrics.start(URL)
+            counters.attempt(0.1, 200)
+            counters.finished()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    endpoint = metrics.snapshot()["endpoints"]["/api/v1/ip/check"]
+    assert endpoint["requests"] == endpoint["attempts"] == 4000
+    assert endpoint["latency"]["buckets"] == [(0.5, 4000), (float("inf"), 4000)]
+    with pytest.raises(ValueError):
+        MetricsRegistry(buckets=(0.0, 1.0))
+
+
+def test_prometheus_text():
+    metrics = MetricsRegistry(buckets=(0.1, 1.0))
+    counters = metrics.start(URL)
+    counters.attempt(0.05, 503)
+    counters.retrying(0.25)
+    counters.attempt(0.5, 200)
+    counters.finished()
+    metrics.register("ip_cache", lambda: {"hits": 3, "size": 7, "enabled": True, "name": "lru"})
+
+    text = metrics.to_prometheus()
+    assert "# TYPE sec4dev_request_duration_seconds histogram" in text
+    assert 'sec4dev_request_duration_seconds_bucket{endpoint="/api/v1/ip/check",le="0.1"} 1' in text
+    assert 'sec4dev_request_duration_seconds_bucket{endpoint="/api/v1/ip/check",le="+Inf"} 2' in text
+    assert 'sec4dev_request_duration_seconds_count{endpoint="/api/v1/ip/check"} 2' in text
+    assert 'sec4dev_responses_total{endpoint="/api/v1/ip/check",status="503"} 1' in text
+    assert 'sec4dev_retry_sleep_seconds_total{endpoint="/api/v1/ip/check"} 0.25' in text
+    assert "sec4dev_ip_cache_hits 3" in text
+    assert "enabled" not in text and "lru" not in text
+    assert text.endswith("\n")
+
+
+def test_client_records_requests_and_exports_component_stats():
+    metrics = MetricsRegistry()
+    transport = httpx.MockTransport(lambda req: httpx.Response(200, json={"ip": "203.0.113.1", "classification": "hosting"}))
+    with Sec4DevClient("sec4_test", base_url="https://api.test/api/v1", metrics=metrics, ip_cache=TTLCache()) as client:
+        client._http_client._transport = transport
+        client.ip.check("203.0.113.1")
+        client.ip.check("203.0.113.1")
+        assert client.metrics is metrics
+
+    snapshot = metrics.snapshot()
+    assert snapshot["endpoints"]["/api/v1/ip/check"]["requests"] == 1
+    assert snapshot["stats"]["ip_cache"]["hits"] == 1
+    assert "ip" in snapshot["stats"] and "email" in snapshot["stats"]
+
+
+def test_exited_threads_are_folded_into_the_totals():
+    metrics = MetricsRegistry()
+
+    def one_request():
+        counters = metrics.start(URL)
+        counters.attempt(0.01, 200)
+        counters.finished()
+
+    for _ in range(50):
+        threads = [threading.Thread(target=one_request) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    endpoint = metrics._endpoints[URL]
+    assert len(endpoint._shards) <= 4
+    totals = metrics.snapshot()["endpoints"]["/api/v1/ip/check"]
+    assert (totals["requests"], totals["attempts"], totals["in_flight"]) == (200, 200, 0)
+    assert totals["statuses"] == {200: 200}
+    assert totals["latency"]["count"] == 200
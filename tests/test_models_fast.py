@@ -0,0 +1,52 @@
+"""Tests for fast (trusted) result construction."""
+
+import pytest
+from pydantic import ValidationError as PydanticValidationError
+
+from sec4dev.ip import _build_result
+from sec4dev.models.email import EmailCheckResult
+from sec4dev.models.fast import construct, email_check_result
+from sec4dev.models.ip import IPCheckResult, IPGeo, IPNetwork, IPSignals
+
+
+def _validated():
+    return IPCheckResult(
+        ip="203.0.113.42",
+        classification="hosting",
+        confidence=0.9,
+        signals=IPSignals(is_hosting=True),
+        network=IPNetwork(asn=16509, org="Amazon", provider="AWS"),
+        geo=IPGeo(country="US"),
+    )
+
+
+def test_trusted_copy_matches_validated():
+    original = _validated()
+    result = construct(IPCheckResult, {**original.__dict__, "ip": "203.0.113.43"})
+    expected = original.model_copy(update={"ip": "203.0.113.43"})
+    assert result == expected
+    assert result.model_dump() == expected.model_dump()
+    assert result.model_dump_json() == expected.model_dump_json()
+    assert original.ip == "203.0.113.42"
+
+
+def test_trusted_results_copy_and_compare():
+    result = email_check_result("a@b.com", "b.com", True)
+    assert result == EmailCheckResult(email="a@b.com", domain="b.com", is_disposable=True)
+    copy = result.model_copy(update={"email": "c@b.com"})
+    assert copy.email == "c@b.com"
+    assert result.email == "a@b.com"
+
+
+def test_api_results_are_still_validated():
+    result = _build_result(
+        {"ip": "203.0.113.42", "confidence": "0.9", "signals": {"is_hosting": 1}, "network": {"asn": "16509"}},
+        "203.0.113.42",
+    )
+    assert result.confidence == 0.9
+    assert result.signals.is_hosting is True
+    assert result.network.asn == 16509
+    assert result.classification == "unknown"
+
+    with pytest.raises(PydanticValidationError):
+        _build_result({"confidence": "high"}, "203.0.113.42")
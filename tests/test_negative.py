@@ -0,0 +1,108 @@
+"""Tests for negative (deterministic failure) caching."""
+
+import asyncio
+import json as json_lib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sec4dev import AsyncSec4DevClient, Sec4DevClient
+from sec4dev.exceptions import NotFoundError, RateLimitError, ServerError, ValidationError
+from sec4dev.negative import NegativeCache
+
+
+def test_negative_cache_only_stores_deterministic_errors():
+    cache = NegativeCache(maxsize=10, ttl=60)
+    assert cache.record("bad", ValidationError("Invalid", status_code=422)) is True
+    assert cache.record("gone", NotFoundError("Not found", status_code=404)) is True
+    assert cache.record("busy", RateLimitError("Slow down")) is False
+    assert cache.record("down", ServerError("Boom", status_code=503)) is False
+    assert len(cache) == 2
+
+    with pytest.raises(NotFoundError) as exc_info:
+        cache.check("gone")
+    assert exc_info.value.status_code == 404
+    cache.check("busy")
+
+
+def test_negative_cache_is_bounded():
+    cache = NegativeCache(maxsize=2, ttl=60)
+    for key in ("a", "b", "c"):
+        cache.record(key, ValidationError("Invalid", status_code=422))
+    assert len(cache) == 2
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalid_input_is_rejected_from_cache():
+    client = Sec4DevClient("sec4_test", ip_negative_cache=NegativeCache())
+
+    with patch("sec4dev.ip.validate_ip", side_effect=ValidationError("Invalid IP address format", 422)) as validate:
+        for _ in range(3):
+            with pytest.raises(ValidationError):
+                client.ip.check("not-an-ip")
+
+    assert validate.call_count == 1
+    assert client.ip.stats()["negative_hits"] == 2
+
+
+def test_server_422_is_cached_but_5xx_is_not():
+    client = Sec4DevClient("sec4_test", email_negative_cache=NegativeCache())
+
+    with patch("sec4dev.email.request", side_effect=ValidationError("Rejected", 422)) as mock_request:
+        for _ in range(3):
+            with pytest.raises(ValidationError):
+                client.email.check("user@example.com")
+    assert mock_request.call_count == 1
+
+    with patch("sec4dev.email.request", side_effect=ServerError("Boom", 503)) as mock_request:
+        for _ in range(3):
+            with pytest.raises(ServerError):
+                client.email.check("other@example.com")
+    assert mock_request.call_count == 3
+
+
+def test_async_server_404_is_cached():
+    async def run():
+        mock = AsyncMock(side_effect=NotFoundError("Not found", 404))
+        with patch("sec4dev.ip.async_request", new=mock):
+            async with AsyncSec4DevClient("sec4_test", ip_negative_cache=NegativeCache()) as client:
+                for _ in range(3):
+                    with pytest.raises(NotFoundError):
+                        await client.ip.check("203.0.113.42")
+        return mock.await_count
+
+    assert asyncio.run(run()) == 1
+
+
+def test_rejection_of_one_address_is_not_shared_across_its_domain():
+    release = threading.Event()
+
+    def fake_request(method, url, api_key, json=None, **kwargs):
+        if json["email"] == "bad@x.com":
+            release.wait(2)
+            raise ValidationError("Rejected", 422)
+        mock_resp = MagicMock()
+        mock_resp.content = json_lib.dumps({"email": json["email"], "domain": "x.com", "is_disposable": False}).encode()
+        return mock_resp, {}
+
+    client = Sec4DevClient("sec4_test", email_negative_cache=NegativeCache())
+    with patch("sec4dev.email.request", side_effect=fake_request) as mock_request:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            bad = pool.submit(client.email.check, "bad@x.com")
+            while not client.email._flight._calls:
+                time.sleep(0.001)
+            alice = pool.submit(client.email.check, "alice@x.com")
+            time.sleep(0.05)
+            release.set()
+            with pytest.raises(ValidationError):
+                bad.result()
+            assert alice.result().email == "alice@x.com"
+        assert client.email.check("alice@x.com").is_disposable is False
+        with pytest.raises(ValidationError):
+            client.email.check("bad@x.com")
+
+    assert mock_request.call_count == 3
+    assert client.email.stats()["negative_hits"] == 1
@@ -0,0 +1,130 @@
+"""Tests for the prefix trie and IP prefix cache."""
+
+import ipaddress
+import random
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sec4dev import Sec4DevClient
+from sec4dev.models.ip import IPCheckResult, IPGeo, IPNetwork, IPSignals
+from sec4dev.prefix import IPPrefixCache, PrefixTrie
+
+
+def _net(cidr):
+    network = ipaddress.ip_network(cidr)
+    return int(network.network_address), network.prefixlen
+
+
+def _ip(addr):
+    return int(ipaddress.ip_address(addr))
+
+
+def _result(ip, classification="hosting", provider="AWS"):
+    return IPCheckResult(
+        ip=ip,
+        classification=classification,
+        confidence=0.9,
+        signals=IPSignals(is_hosting=classification == "hosting"),
+        network=IPNetwork(provider=provider),
+        geo=IPGeo(),
+    )
+
+
+def test_trie_longest_prefix_match():
+    trie = PrefixTrie(32)
+    trie.insert(*_net("10.0.0.0/8"), "a")
+    trie.insert(*_net("10.1.0.0/16"), "b")
+    trie.insert(*_net("10.1.2.0/24"), "c")
+    trie.insert(*_net("10.1.2.3/32"), "d")
+    assert trie.longest_match(_ip("10.1.2.3")) == (32, "d")
+    assert trie.longest_match(_ip("10.1.2.4")) == (24, "c")
+    assert trie.longest_match(_ip("10.1.3.4")) == (16, "b")
+    assert trie.longest_match(_ip("10.9.9.9")) == (8, "a")
+    assert trie.longest_match(_ip("11.0.0.1")) is None
+    assert len(trie) == 4
+
+
+def test_trie_delete_prunes_and_keeps_others():
+    trie = PrefixTrie(32)
+    trie.insert(*_net("10.1.2.0/24"), "c")
+    trie.insert(*_net("10.1.3.0/24"), "e")
+    trie.insert(*_net("10.1.0.0/16"), "b")
+    assert trie.delete(*_net("10.1.2.0/24")) is True
+    assert trie.delete(*_net("10.1.2.0/24")) is False
+    assert trie.longest_match(_ip("10.1.2.9")) == (16, "b")
+    assert trie.longest_match(_ip("10.1.3.9")) == (24, "e")
+    assert trie.get(*_net("10.1.0.0/16")) == "b"
+    assert len(trie) == 2
+
+
+def test_trie_matches_linear_scan():
+    rng = random.Random(7)
+    trie = PrefixTrie(32)
+    prefixes = {}
+    for _ in range(300):
+        length = rng.randint(1, 32)
+        key = trie.mask(rng.getrandbits(32), length)
+        prefixes[(key, length)] = (key, length)
+        trie.insert(key, length, (key, length))
+    for _ in range(2000):
+        addr = rng.getrandbits(32)
+        expected = None
+        for key, length in prefixes:
+            if trie.mask(addr, length) == key and (expected is None or length > expected[0]):
+                expected = (length, (key, length))
+        assert trie.longest_match(addr) == expected
+
+
+def test_prefix_cache_generalizes_hosting_results():
+    cache = IPPrefixCache(ipv4_prefix=24, ipv6_prefix=64)
+    cache.set("203.0.113.7", _result("203.0.113.7"))
+    hit = cache.get("203.0.113.200")
+    assert hit is not None
+    assert hit.ip == "203.0.113.200"
+    assert hit.network.provider == "AWS"
+    assert cache.get("203.0.114.1") is None
+
+    cache.set("2001:db8::1", _result("2001:db8::1"))
+    assert cache.get("2001:db8::ffff").ip == "2001:db8::ffff"
+    assert cache.get("2001:db8:0:1::1") is None
+
+
+def test_prefix_cache_keeps_residential_results_exact():
+    cache = IPPrefixCache()
+    cache.set("198.51.100.5", _result("198.51.100.5", classification="residential", provider=None))
+    assert cache.get("198.51.100.5") is not None
+    assert cache.get("198.51.100.6") is None
+
+
+def test_prefix_cache_evicts_lru():
+    cache = IPPrefixCache(maxsize=2)
+    cache.set("10.0.1.1", _result("10.0.1.1"))
+    cache.set("10.0.2.1", _result("10.0.2.1"))
+    cache.get("10.0.1.9")
+    cache.set("10.0.3.1", _result("10.0.3.1"))
+    assert cache.get("10.0.2.9") is None
+    assert cache.get("10.0.1.9") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_prefix_cache_rejects_bad_prefix():
+    with pytest.raises(ValueError):
+        IPPrefixCache(ipv4_prefix=33)
+
+
+def test_ip_service_uses_prefix_cache():
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {
+        "ip": "203.0.113.1",
+        "classification": "hosting",
+        "confidence": 0.9,
+        "signals": {"is_hosting": True},
+        "network": {"provider": "AWS"},
+    }
+    with patch("sec4dev.ip.request", return_value=(mock_resp, {})) as mock_request:
+        client = Sec4DevClient("sec4_test", ip_prefix_cache=IPPrefixCache())
+        client.ip.check("203.0.113.1")
+        result = client.ip.check("203.0.113.99")
+    assert mock_request.call_count == 1
+    assert result.ip == "203.0.113.99"
@@ -0,0 +1,97 @@
+"""Tests for the local IP range database."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sec4dev import Sec4DevClient
+from sec4dev.ranges import IPRange, IPRangeDatabase
+
+
+def test_text_loader_and_lookup(tmp_path):
+    path = tmp_path / "tor.txt"
+    path.write_text("# tor exits\n185.220.101.1\n185.220.102.0/24  # relay block\n\n2001:db8::/48\n")
+    db = IPRangeDatabase()
+    assert db.load_text(str(path), "tor") == 3
+    info = db.lookup("185.220.102.77")
+    assert info.classification == "tor"
+    assert info.signals == {"is_tor": True}
+    assert db.lookup("185.220.101.2") is None
+    assert db.lookup("2001:db8:0:ffff::1").classification == "tor"
+
+
+def test_csv_loader_with_columns(tmp_path):
+    path = tmp_path / "ranges.csv"
+    path.write_text(
+        "cidr,classification,provider,asn,country,is_hosting\n"
+        "10.0.0.0/8,hosting,ExampleCloud,AS64500,US,true\n"
+        "10.1.0.0/16,vpn,ExampleVPN,,,\n"
+    )
+    db = IPRangeDatabase()
+    db.load_csv(str(path))
+    outer = db.lookup("10.2.3.4")
+    assert (outer.provider, outer.asn, outer.country, outer.signals) == (
+        "ExampleCloud", 64500, "US", {"is_hosting": True}
+    )
+    assert db.lookup("10.1.3.4").classification == "vpn"
+
+
+def test_json_loader_accepts_aws_format(tmp_path):
+    path = tmp_path / "ip-ranges.json"
+    path.write_text(json.dumps({
+        "prefixes": [{"ip_prefix": "3.5.140.0/22", "region": "ap-northeast-2", "service": "AMAZON"}],
+        "ipv6_prefixes": [{"ipv6_prefix": "2600:1f00::/24", "service": "AMAZON"}],
+    }))
+    db = IPRangeDatabase()
+    assert db.load_json(str(path), classification="hosting", provider="AWS") == 2
+    result = db.result_for("3.5.141.9")
+    assert result.ip == "3.5.141.9"
+    assert result.classification == "hosting"
+    assert result.signals.is_hosting is True
+    assert result.network.provider == "AWS"
+    assert db.result_for("2600:1f00::1").network.provider == "AWS"
+
+
+def test_loaders_keep_zero_confidence_and_asn(tmp_path):
+    path = tmp_path / "ranges.json"
+    path.write_text(json.dumps([
+        {"cidr": "192.0.2.0/24", "classification": "hosting", "confidence": 0, "asn": 0},
+        {"cidr": "198.51.100.0/24", "classification": "hosting", "confidence": "", "asn": ""},
+    ]))
+    db = IPRangeDatabase()
+    db.load_json(str(path), asn=64500, confidence=0.5)
+    assert (db.lookup("192.0.2.1").confidence, db.lookup("192.0.2.1").asn) == (0.0, 0)
+    assert (db.lookup("198.51.100.1").confidence, db.lookup("198.51.100.1").asn) == (0.5, 64500)
+
+
+def test_add_address_range_and_missing_classification(tmp_path):
+    db = IPRangeDatabase()
+    db.add("192.0.2.10-192.0.2.20", IPRange("192.0.2.10-192.0.2.20", "proxy"))
+    assert db.lookup("192.0.2.15").classification == "proxy"
+    assert db.lookup("192.0.2.21") is None
+
+    path = tmp_path / "bad.json"
+    path.write_text(json.dumps([{"cidr": "10.0.0.0/8"}]))
+    with pytest.raises(ValueError):
+        db.load_json(str(path))
+
+
+def test_ip_service_answers_from_range_db():
+    db = IPRangeDatabase()
+    db.add("185.220.101.0/24", IPRange("185.220.101.0/24", "tor"))
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"ip": "8.8.8.8", "classification": "hosting", "confidence": 0.9}
+
+    with patch("sec4dev.ip.request", return_value=(mock_resp, {})) as mock_request:
+        client = Sec4DevClient("sec4_test", ip_ranges=db)
+        assert client.ip.is_tor("185.220.101.5") is True
+        assert client.ip.check("::ffff:185.220.101.6").ip == "185.220.101.6"
+        client.ip.check("8.8.8.8")
+
+    assert mock_request.call_count == 1
+    stats = client.ip.stats()
+    assert (stats["api_calls"], stats["local_answers"]) == (1, 2)
+    assert db.lookup("::ffff:185.220.101.7").classification == "tor"
+    with pytest.raises(ValueError):
+        db.lookup("not-an-ip")
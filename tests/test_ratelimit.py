@@ -0,0 +1,79 @@
+"""Tests for the client-side token-bucket rate limiter."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from sec4dev import Sec4DevClient
+from sec4dev.exceptions import RateLimitError
+from sec4dev.http import request
+from sec4dev.ratelimit import RateLimiter
+
+
+@pytest.fixture
+def clock(clock):
+    with patch("sec4dev.ratelimit.time.sleep", clock.sleep):
+        yield clock
+
+
+def test_unsynced_limiter_does_not_block(clock):
+    limiter = RateLimiter()
+    for _ in range(100):
+        limiter.acquire()
+    assert clock.slept == []
+
+
+def test_limiter_seeds_from_headers_and_waits(clock):
+    limiter = RateLimiter()
+    limiter.update({"limit": 10, "remaining": 2, "reset_seconds": 10})
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.slept == []
+    limiter.acquire()
+    assert clock.slept == [pytest.approx(1.0)]
+
+
+def test_limiter_fail_fast_reports_predicted_wait(clock):
+    limiter = RateLimiter(fail_fast=True)
+    limiter.update({"limit": 60, "remaining": 0, "reset_seconds": 30})
+    assert limiter.predicted_wait() == pytest.approx(30)
+    with pytest.raises(RateLimitError) as exc_info:
+        limiter.acquire()
+    assert exc_info.value.retry_after == 30
+    assert limiter.stats()["rejections"] == 1
+
+
+def test_limiter_max_wait(clock):
+    limiter = RateLimiter(max_wait=0.5)
+    limiter.update({"limit": 1, "remaining": 0, "reset_seconds": 5})
+    with pytest.raises(RateLimitError):
+        limiter.acquire()
+
+
+def test_limiter_resync_never_raises_tokens_above_remaining(clock):
+    limiter = RateLimiter()
+    limiter.update({"limit": 100, "remaining": 50, "reset_seconds": 60})
+    limiter.update({"limit": 100, "remaining": 5, "reset_seconds": 59})
+    assert limiter.stats()["tokens"] == pytest.approx(5)
+    limiter.update({"limit": 100, "remaining": 80, "reset_seconds": 58})
+    assert limiter.stats()["tokens"] == pytest.approx(5)
+
+
+def test_request_feeds_limiter_from_headers():
+    limiter = RateLimiter(fail_fast=True)
+    headers = {"x-ratelimit-limit": "10", "x-ratelimit-remaining": "0", "x-ratelimit-reset": "30"}
+    transport = httpx.MockTransport(lambda req: httpx.Response(200, json={}, headers=headers))
+    with httpx.Client(transport=transport) as client:
+        request("POST", "https://api.test/ip/check", "sec4_k", client=client, limiter=limiter)
+        with pytest.raises(RateLimitError) as exc_info:
+            request("POST", "https://api.test/ip/check", "sec4_k", client=client, limiter=limiter)
+    assert exc_info.value.retry_after == 30
+
+
+def test_client_shares_limiter_between_services():
+    limiter = RateLimiter()
+    client = Sec4DevClient("sec4_test", rate_limiter=limiter)
+    assert client.rate_limiter is limiter
+    assert client.ip._rate_limiter is limiter
+    assert client.email._rate_limiter is limiter
@@ -0,0 +1,209 @@
+"""Tests for request coalescing (single-flight)."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sec4dev import AsyncSec4DevClient, Sec4DevClient
+from sec4dev.exceptions import DeadlineExceededError, ServerError
+from sec4dev.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def _run_threads(n, target):
+    results = [None] * n
+    start = threading.Barrier(n)
+
+    def run(i):
+        start.wait()
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def _outcome(fn):
+    try:
+        return fn()
+    except Exception as e:
+        return e
+
+
+def test_single_flight_shares_result():
+    flight = SingleFlight()
+    calls = []
+
+    def work():
+        calls.append(1)
+        time.sleep(0.1)
+        return "value"
+
+    results = _run_threads(8, lambda: flight.do("k", work))
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+    assert flight.shared == 7
+
+
+def test_single_flight_shares_exception_and_forgets_key():
+    flight = SingleFlight()
+
+    def fail():
+        time.sleep(0.05)
+        raise ServerError("down", 503)
+
+    results = _run_threads(4, lambda: flight.do("k", fail))
+    assert all(isinstance(r, ServerError) for r in results)
+    assert flight.do("k", lambda: "fresh") == "fresh"
+
+
+def test_ip_check_coalesces_concurrent_requests():
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"ip": "203.0.113.42", "classification": "hosting", "confidence": 0.9}
+
+    def slow_request(*args, **kwargs):
+        time.sleep(0.1)
+        return mock_resp, {}
+
+    with patch("sec4dev.ip.request", side_effect=slow_request) as mock_request:
+        client = Sec4DevClient("sec4_test")
+        results = _run_threads(6, lambda: client.ip.check("203.0.113.42"))
+
+    assert mock_request.call_count == 1
+    assert all(r.classification == "hosting" for r in results)
+
+
+def test_async_email_check_coalesces_by_domain():
+    async def slow_request(method, url, api_key, json=None, **kwargs):
+        await asyncio.sleep(0.05)
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"email": json["email"], "domain": "gmail.com", "is_disposable": False}
+        return mock_resp, {}
+
+    async def run():
+        with patch("sec4dev.email.async_request", side_effect=slow_request) as mock_request:
+            async with AsyncSec4DevClient("sec4_test") as client:
+                results = await asyncio.gather(
+                    *(client.email.check(f"user{i}@gmail.com") for i in range(5))
+                )
+            return results, mock_request.call_count
+
+    results, calls = asyncio.run(run())
+    assert calls == 1
+    assert [r.email for r in results] == [f"user{i}@gmail.com" for i in range(5)]
+
+
+def test_async_single_flight_survives_caller_cancellation():
+    async def run():
+        flight = AsyncSingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "value"
+
+        first = asyncio.ensure_future(flight.do("k", work))
+        second = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second, flight.shared
+
+    assert asyncio.run(run()) == ("value", 1)
+
+
+def test_follower_wait_is_bounded_by_its_own_deadline():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def slow():
+        started.set()
+        time.sleep(0.5)
+        return "value"
+
+    leader = threading.Thread(target=flight.do, args=("k", slow))
+    leader.start()
+    started.wait()
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        flight.do("k", slow, expires_at=time.monotonic() + 0.05)
+    assert time.monotonic() - start < 0.3
+    leader.join()
+
+
+def test_leader_deadline_is_not_passed_to_followers():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def leader_work():
+        started.set()
+        time.sleep(0.05)
+        raise DeadlineExceededError("Deadline exceeded before the request completed")
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(_outcome(lambda: flight.do("k", leader_work))))
+    leader.start()
+    started.wait()
+    assert flight.do("k", lambda: "own") == "own"
+    leader.join()
+    assert isinstance(results[0], DeadlineExceededError)
+
+
+def test_ip_check_with_deadline_does_not_wait_for_slower_leader():
+    mock_resp = MagicMock()
+    mock_resp.content = b'{"ip": "203.0.113.42", "classification": "hosting"}'
+    started = threading.Event()
+
+    def slow_request(*args, **kwargs):
+        started.set()
+        time.sleep(0.6)
+        return mock_resp, {}
+
+    with patch("sec4dev.ip.request", side_effect=slow_request):
+        client = Sec4DevClient("sec4_test")
+        leader = threading.Thread(target=client.ip.check, args=("203.0.113.42",))
+        leader.start()
+        started.wait()
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            client.ip.check("203.0.113.42", deadline=100)
+        assert time.monotonic() - start < 0.4
+        leader.join()
+
+
+def test_async_follower_deadline_and_leader_deadline():
+    async def run():
+        flight = AsyncSingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.3)
+            return "value"
+
+        async def expired():
+            await asyncio.sleep(0.05)
+            raise DeadlineExceededError("Deadline exceeded before the request completed")
+
+        async def own():
+            return "own"
+
+        leader = asyncio.ensure_future(flight.do("a", slow))
+        await asyncio.sleep(0)
+        with pytest.raises(DeadlineExceededError):
+            await flight.do("a", slow, expires_at=time.monotonic() + 0.05)
+        assert await leader == "value"
+
+        leader = asyncio.ensure_future(flight.do("b", expired))
+        await asyncio.sleep(0)
+        assert await flight.do("b", own) == "own"
+        with pytest.raises(DeadlineExceededError):
+            await leader
+
+    asyncio.run(run())
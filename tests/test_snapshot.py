@@ -0,0 +1,76 @@
+"""Tests for the offline disposable-domain snapshot."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sec4dev import Sec4DevClient
+from sec4dev.snapshot import BloomFilter, DomainSnapshot
+
+DISPOSABLE = [f"temp{i}.example" for i in range(500)] + ["mailinator.com"]
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter.for_capacity(len(DISPOSABLE), fp_rate=0.01)
+    for domain in DISPOSABLE:
+        bloom.add(domain)
+    assert all(domain in bloom for domain in DISPOSABLE)
+    false_positives = sum(f"real{i}.example" in bloom for i in range(2000))
+    assert false_positives < 100
+
+
+def test_lookup_is_certain_only_when_possible():
+    snapshot = DomainSnapshot.build(
+        DISPOSABLE, known_good=["gmail.com"], top_disposable=["mailinator.com"]
+    )
+    assert snapshot.lookup("GMAIL.com") is False
+    assert snapshot.lookup("mailinator.com") is True
+    assert snapshot.lookup("temp1.example") is None
+    assert snapshot.lookup("unknown.example") is None
+
+    authoritative = DomainSnapshot.build(DISPOSABLE, authoritative=True)
+    assert authoritative.lookup("temp1.example") is None
+    misses = [authoritative.lookup(f"real{i}.example") for i in range(50)]
+    assert misses.count(False) >= 45
+    assert True not in misses
+
+
+def test_save_and_load_memory_maps_snapshot(tmp_path):
+    path = str(tmp_path / "domains.snap")
+    DomainSnapshot.build(
+        DISPOSABLE, known_good=["gmail.com"], top_disposable=["mailinator.com"], authoritative=True
+    ).save(path)
+    loaded = DomainSnapshot.load(path)
+    assert loaded.authoritative is True
+    assert isinstance(loaded.bloom.bits, memoryview)
+    assert loaded.lookup("gmail.com") is False
+    assert loaded.lookup("mailinator.com") is True
+    assert all(d in loaded.bloom for d in DISPOSABLE)
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "bad.snap"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        DomainSnapshot.load(str(path))
+
+
+def test_email_service_answers_locally_when_certain(tmp_path):
+    path = str(tmp_path / "domains.snap")
+    DomainSnapshot.build(DISPOSABLE, known_good=["gmail.com"], top_disposable=["mailinator.com"]).save(path)
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"email": "x@other.com", "domain": "other.com", "is_disposable": False}
+
+    with patch("sec4dev.email.request", return_value=(mock_resp, {})) as mock_request:
+        client = Sec4DevClient("sec4_test")
+        client.email.load_snapshot(path)
+        assert client.email.check("a@gmail.com").is_disposable is False
+        result = client.email.check("b@mailinator.com")
+        client.email.check("x@other.com")
+
+    assert result.is_disposable is True
+    assert result.email == "b@mailinator.com"
+    assert mock_request.call_count == 1
+    stats = client.email.stats()
+    assert stats["local_answers"] == 2
+    assert stats["api_calls"] == 1
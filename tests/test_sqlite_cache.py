@@ -0,0 +1,153 @@
+"""Tests for the SQLite cache backend and result serialization."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sec4dev import Sec4DevClient
+from sec4dev.models.email import EmailCheckResult
+from sec4dev.models.ip import IPCheckResult, IPGeo, IPNetwork, IPSignals
+from sec4dev.serialization import decode_result, encode_result
+from sec4dev.sqlite_cache import SQLiteCache
+
+
+def _ip_result(ip="203.0.113.42"):
+    return IPCheckResult(
+        ip=ip,
+        classification="vpn",
+        confidence=0.75,
+        signals=IPSignals(is_vpn=True, is_hosting=True),
+        network=IPNetwork(asn=64500, org="Example", provider=None),
+        geo=IPGeo(country="DE", region="BE"),
+    )
+
+
+def test_encode_decode_roundtrip():
+    ip_result = _ip_result()
+    email_result = EmailCheckResult(email="a@b.com", domain="b.com", is_disposable=True)
+    assert decode_result(encode_result(ip_result)) == ip_result
+    assert decode_result(encode_result(email_result)) == email_result
+    assert len(encode_result(ip_result)) < len(ip_result.model_dump_json())
+
+
+def test_encode_rejects_unknown_type():
+    with pytest.raises(TypeError):
+        encode_result({"ip": "1.2.3.4"})
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteCache(path, namespace="ip", write_batch=100)
+    cache.set("203.0.113.42", _ip_result())
+    assert cache.get("203.0.113.42") == _ip_result()
+    assert cache.stats()["pending"] == 1
+    cache.close()
+
+    reopened = SQLiteCache(path, namespace="ip")
+    assert reopened.get("203.0.113.42") == _ip_result()
+    assert SQLiteCache(path, namespace="email").get("203.0.113.42") is None
+    reopened.close()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_sqlite_cache_batches_writes(tmp_path):
+    path = str(tmp_path / "cache.db")
+    writer = SQLiteCache(path, write_batch=3, flush_interval=60)
+    reader = SQLiteCache(path)
+    writer.set("a", _ip_result("10.0.0.1"))
+    writer.set("b", _ip_result("10.0.0.2"))
+    assert reader.get("a") is None
+    writer.set("c", _ip_result("10.0.0.3"))
+    _wait_for(lambda: writer.stats()["writes"] == 3)
+    assert reader.get("a").ip == "10.0.0.1"
+    assert writer.stats()["writes"] == 3
+    writer.close()
+    reader.close()
+
+
+def test_sqlite_cache_flushes_on_a_timer(tmp_path):
+    path = str(tmp_path / "cache.db")
+    writer = SQLiteCache(path, write_batch=100, flush_interval=0.05)
+    writer.set("a", _ip_result("10.0.0.1"))
+    _wait_for(lambda: writer.stats()["writes"] == 1)
+    reader = SQLiteCache(path)
+    assert reader.get("a").ip == "10.0.0.1"
+    reader.close()
+    writer.close()
+
+
+def test_sqlite_cache_pools_connections_across_threads(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), pool_size=2)
+    assert cache._idle == []
+    for _ in range(20):
+        threads = [threading.Thread(target=cache.get, args=("missing",)) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert len(cache._idle) <= 2
+    assert cache.stats()["misses"] == 100
+    cache.close()
+    assert cache._idle == []
+
+
+def test_sqlite_cache_counts_failed_writes_and_retries_them(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteCache(path, write_batch=1, flush_interval=60)
+    with cache._connection() as conn:
+        conn.execute("ALTER TABLE results RENAME TO moved")
+    cache.set("a", _ip_result())
+    _wait_for(lambda: cache.stats()["write_errors"] == 1)
+    assert cache.stats()["pending"] == 1
+
+    with cache._connection() as conn:
+        conn.execute("ALTER TABLE moved RENAME TO results")
+    cache.close()
+    assert cache.stats()["writes"] == 1
+    assert SQLiteCache(path).get("a") == _ip_result()
+
+
+def test_sqlite_cache_does_not_reuse_connections_after_fork(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    cache.get("a")
+    inherited = cache._idle[0]
+    cache._pid = -1  # as seen from a forked child
+    cache.get("a")
+    assert len(cache._idle) == 1 and cache._idle[0] is not inherited
+    inherited.close()
+    cache.close()
+
+
+def test_sqlite_cache_expires_and_prunes(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), maxsize=2, write_batch=1)
+    cache.set("old", _ip_result(), ttl=-1)
+    assert cache.get("old") is None
+    for key in ("a", "b", "c"):
+        cache.set(key, _ip_result())
+    cache.flush()
+    assert cache.prune() == 2
+    assert len(cache) == 2
+    cache.close()
+
+
+def test_client_uses_sqlite_cache_and_flushes_on_close(tmp_path):
+    path = str(tmp_path / "cache.db")
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"email": "a@gmail.com", "domain": "gmail.com", "is_disposable": False}
+
+    with patch("sec4dev.email.request", return_value=(mock_resp, {})) as mock_request:
+        with Sec4DevClient("sec4_test", email_cache=SQLiteCache(path, namespace="email")) as client:
+            client.email.check("a@gmail.com")
+        with Sec4DevClient("sec4_test", email_cache=SQLiteCache(path, namespace="email")) as client:
+            result = client.email.check("b@gmail.com")
+
+    assert mock_request.call_count == 1
+    assert result.email == "b@gmail.com"
@@ -0,0 +1,144 @@
+"""Tests for stale-while-revalidate caching and background refresh."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sec4dev import AsyncSec4DevClient, Sec4DevClient
+from sec4dev.cache import TTLCache
+from sec4dev.exceptions import ServerError
+from sec4dev.models.email import EmailCheckResult
+from sec4dev.refresh import BackgroundRefresher
+from sec4dev.sqlite_cache import SQLiteCache
+
+
+def _ip_response(classification):
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"ip": "203.0.113.42", "classification": classification, "confidence": 0.9}
+    return mock_resp
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_ttl_cache_serves_stale_until_hard_ttl(clock):
+    cache = TTLCache(maxsize=10, ttl=60, hard_ttl=600)
+    cache.set("a", 1)
+    assert cache.lookup("a") == (1, False)
+    clock.now += 61
+    assert cache.get("a") is None
+    assert cache.lookup("a") == (1, True)
+    assert cache.stats()["stale_hits"] == 1
+    clock.now += 600
+    assert cache.lookup("a") == (None, False)
+    assert cache.stats()["expirations"] == 1
+
+
+def test_ttl_cache_rejects_hard_ttl_below_ttl():
+    with pytest.raises(ValueError):
+        TTLCache(ttl=60, hard_ttl=30)
+
+
+def test_sqlite_cache_serves_stale_until_hard_ttl(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "c.db"), ttl=60, hard_ttl=600)
+    value = EmailCheckResult(email="a@b.com", domain="b.com", is_disposable=True)
+    cache.set("b.com", value)
+    cache.flush()
+    with patch("sec4dev.sqlite_cache.time.time", return_value=time.time() + 120):
+        assert cache.get("b.com") is None
+        assert cache.lookup("b.com") == (value, True)
+    with patch("sec4dev.sqlite_cache.time.time", return_value=time.time() + 700):
+        assert cache.lookup("b.com") == (None, False)
+    cache.close()
+
+
+def test_stale_entry_is_served_while_refreshing(clock):
+    responses = [_ip_response("hosting"), _ip_response("vpn")]
+
+    with patch("sec4dev.ip.request", side_effect=[(r, {}) for r in responses]) as mock_request:
+        with Sec4DevClient("sec4_test", ip_cache=TTLCache(ttl=60, hard_ttl=600)) as client:
+            assert client.ip.check("203.0.113.42").classification == "hosting"
+            clock.now += 61
+            # Served stale immediately; one refresh runs in the background.
+            assert client.ip.check("203.0.113.42").classification == "hosting"
+            _wait_for(lambda: mock_request.call_count == 2 and not client.ip._refresher._inflight)
+            assert client.ip.check("203.0.113.42").classification == "vpn"
+            stats = client.ip.stats()
+
+    assert mock_request.call_count == 2
+    assert stats["refreshes"] == 1
+    assert stats["refresh_failures"] == 0
+    assert stats["stale_served"] == 1
+
+
+def test_one_refresh_per_key(clock):
+    release = threading.Event()
+
+    def slow_request(*args, **kwargs):
+        release.wait(2)
+        return _ip_response("vpn"), {}
+
+    with patch("sec4dev.ip.request", return_value=(_ip_response("hosting"), {})):
+        client = Sec4DevClient("sec4_test", ip_cache=TTLCache(ttl=60, hard_ttl=600))
+        client.ip.check("203.0.113.42")
+    clock.now += 61
+
+    with patch("sec4dev.ip.request", side_effect=slow_request) as mock_request:
+        for _ in range(5):
+            assert client.ip.check("203.0.113.42").classification == "hosting"
+        release.set()
+        _wait_for(lambda: client.ip.stats()["refreshes"] == 1 and not client.ip._refresher._inflight)
+        client.close()
+
+    assert mock_request.call_count == 1
+    assert client.ip.stats()["stale_served"] == 5
+
+
+def test_failed_refresh_keeps_serving_stale(clock):
+    with patch("sec4dev.ip.request", return_value=(_ip_response("hosting"), {})):
+        client = Sec4DevClient("sec4_test", ip_cache=TTLCache(ttl=60, hard_ttl=600))
+        client.ip.check("203.0.113.42")
+    clock.now += 61
+
+    with patch("sec4dev.ip.request", side_effect=ServerError("boom", 503)):
+        assert client.ip.check("203.0.113.42").classification == "hosting"
+        _wait_for(lambda: client.ip.stats()["refresh_failures"] == 1)
+        assert client.ip.check("203.0.113.42").classification == "hosting"
+    client.close()
+
+
+def test_refresher_rejects_work_after_close():
+    refresher = BackgroundRefresher()
+    assert refresher.schedule("a", lambda: None)
+    refresher.close()
+    assert not refresher.schedule("b", lambda: None)
+    assert refresher._executor is None
+    assert refresher.stats()["refreshes"] == 1
+
+
+def test_async_stale_entry_is_served_while_refreshing(clock):
+    responses = [_ip_response("hosting"), _ip_response("vpn")]
+
+    async def run():
+        with patch("sec4dev.ip.async_request", new=AsyncMock(side_effect=[(r, {}) for r in responses])) as mock:
+            async with AsyncSec4DevClient("sec4_test", ip_cache=TTLCache(ttl=60, hard_ttl=600)) as client:
+                await client.ip.check("203.0.113.42")
+                clock.now += 61
+                stale = await client.ip.check("203.0.113.42")
+                for _ in range(10):
+                    await asyncio.sleep(0)
+                fresh = await client.ip.check("203.0.113.42")
+                return stale, fresh, mock.call_count, client.ip.stats()
+
+    stale, fresh, calls, stats = asyncio.run(run())
+    assert stale.classification == "hosting"
+    assert fresh.classification == "vpn"
+    assert calls == 2
+    assert stats["refreshes"] == 1
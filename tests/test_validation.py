@@ -1,8 +1,19 @@
 """Tests for validation helpers."""
 
+import ipaddress
+
 import pytest
 
-from sec4dev.validation import validate_email, validate_ip
+from sec4dev.validation import (
+    canonical_ip,
+    email_domain,
+    normalize_domain,
+    packed_ip,
+    validate_email,
+    validate_emails,
+    validate_ip,
+    validate_ips,
+)
 from sec4dev.exceptions import ValidationError
 
 
@@ -71,3 +82,45 @@ def test_validate_ip_rejects_non_string():
         validate_ip(None)
     with pytest.raises(ValidationError):
         validate_ip(123)
+
+
+def test_normalize_domain_lowercases_and_idna_encodes():
+    assert normalize_domain("Example.COM.") == "example.com"
+    assert normalize_domain("Bücher.example") == "xn--bcher-kva.example"
+
+
+def test_email_domain():
+    assert email_domain("  User@Example.Org ") == "example.org"
+
+
+def test_validators_return_canonical_forms():
+    assert validate_ip(" 203.0.113.42 ") == "203.0.113.42"
+    assert validate_ip("2001:DB8:0:0:0:0:0:1") == "2001:db8::1"
+    assert validate_email(" User@Example.COM ") == "User@example.com"
+
+
+def test_canonical_ip_unwraps_ipv4_mapped():
+    assert canonical_ip("::ffff:203.0.113.42") == "203.0.113.42"
+    assert canonical_ip("::FFFF:cb00:712a") == "203.0.113.42"
+    assert packed_ip("::ffff:203.0.113.42") == bytes([203, 0, 113, 42])
+    assert canonical_ip("::2") == "::2"
+    assert canonical_ip("fe80::1%eth0") == "fe80::1"
+
+
+def test_canonical_ip_matches_ipaddress():
+    for text in ("01.2.3.4", "1.2.3", "1::2::3", "fe80::1%", "::ffff:01.2.3.4", "1.2.3.4\x00", 123):
+        assert canonical_ip(text) is None
+    for text in ("0.0.0.0", "::", "::1", "1:2:3:4:5:6:7::", "::1.2.3.4", "2001:0db8::0001"):
+        assert canonical_ip(text) == str(ipaddress.ip_address(text))
+
+
+def test_validate_ips_returns_mask_and_canonical_forms():
+    batch = validate_ips(["203.0.113.42", "bad", "::FFFF:1.2.3.4", None])
+    assert batch.valid == [True, False, True, False]
+    assert batch.canonical == ["203.0.113.42", None, "1.2.3.4", None]
+
+
+def test_validate_emails_returns_mask_and_canonical_forms():
+    batch = validate_emails(["a@Bücher.example", "nobody@", " b@GMAIL.com. ", None])
+    assert batch.valid == [True, False, True, False]
+    assert batch.canonical == ["a@xn--bcher-kva.example", None, "b@gmail.com", None]